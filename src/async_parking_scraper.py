@@ -0,0 +1,503 @@
+"""
+Real Parking 비동기 웹 스크래핑 모듈
+Playwright async API를 사용하여 포인트 정보와 입출차 정보를 동시에 수집합니다.
+
+하나의 브라우저 컨텍스트(로그인 세션 공유)에 두 개의 페이지를 열어,
+포인트 페이지 새로고침과 입출차 검색을 동시에 수행합니다.
+여러 사이트를 조회할 때는 하나의 브라우저를 공유하고 사이트별로 컨텍스트를 만듭니다.
+"""
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
+import config
+from logger import scraping_logger
+from table_parser import ScrapeCursor
+from http_client import session_from_cookies, fetch_remaining_pages
+from browser_server import get_server_endpoint
+from parking_scraper import (
+    BaseParkingScraper, PREPARE_SEARCH_SCRIPT, ROWS_REFRESHED_SCRIPT, EXTRACT_SCRIPT, FILL_LOGIN_SCRIPT,
+    SUBMIT_LOGIN_SCRIPT, SEARCH_BUTTON_SELECTOR, LOGIN_ID_SELECTOR, records_from_extract, points_from_extract
+)
+
+
+async def launch_browser(playwright) -> Browser:
+    """
+    브라우저 실행 (공유 브라우저 서버가 실행 중이면 연결)
+    
+    Args:
+        playwright: 시작된 async Playwright 인스턴스
+    
+    Returns:
+        브라우저 인스턴스
+    """
+    endpoint = get_server_endpoint()
+    if endpoint:
+        try:
+            browser = await playwright.chromium.connect(endpoint)
+            scraping_logger.info(f"공유 브라우저 서버 연결: {endpoint}")
+            return browser
+        except Exception as e:
+            scraping_logger.warning(f"공유 브라우저 서버 연결 실패 - 브라우저를 직접 실행합니다: {str(e)}")
+    
+    return await playwright.chromium.launch(headless=config.HEADLESS)
+
+
+class AsyncParkingScraper(BaseParkingScraper):
+    """
+    Real Parking 웹사이트 비동기 스크래퍼
+    
+    상태, URL, 응답 파싱 등은 BaseParkingScraper를 사용하고 페이지를 다루는 비동기 호출만 구현합니다.
+    """
+    
+    def __init__(self, site: Optional[Dict[str, Any]] = None, browser: Optional[Browser] = None):
+        """
+        Args:
+            site: 조회할 사이트 설정 (기본값: .env의 단일 사이트)
+            browser: 공유할 브라우저 (지정하면 컨텍스트만 생성하고 브라우저는 종료하지 않음)
+        """
+        super().__init__(site)
+        self.owns_browser = browser is None
+        self.browser: Optional[Browser] = browser
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None  # 입출차 조회 페이지
+        self.points_page: Optional[Page] = None  # 포인트 정보 조회 페이지
+    
+    async def start(self):
+        """브라우저 시작"""
+        try:
+            if self.owns_browser:
+                self.playwright = await async_playwright().start()
+                self.browser = await launch_browser(self.playwright)
+            
+            # 저장된 로그인 세션이 있으면 컨텍스트에 불러오기
+            storage_state = self._saved_storage_state()
+            self.context = await self.browser.new_context(storage_state=storage_state)
+            self.context.set_default_timeout(config.TIMEOUT)
+            self.session_restored = storage_state is not None
+            
+            # 이미지, 폰트, 스타일시트, 분석 스크립트 차단
+            if config.BLOCK_RESOURCES:
+                await self.context.route('**/*', self._route_request)
+            self.context.on('response', self._on_response)
+            
+            self.page = await self.context.new_page()
+            self.points_page = await self.context.new_page()
+            scraping_logger.info(f"브라우저 시작 완료 (비동기, 사이트: {self.site['name']})")
+        except Exception as e:
+            scraping_logger.error(f"브라우저 시작 실패: {str(e)}")
+            raise
+    
+    async def stop(self):
+        """브라우저 종료 (연결이 끊긴 브라우저도 남은 자원을 모두 정리)"""
+        if self.context:
+            await self._close_quietly(self.context.close)
+        if self.owns_browser:
+            if self.browser:
+                await self._close_quietly(self.browser.close)
+            if hasattr(self, 'playwright'):
+                await self._close_quietly(self.playwright.stop)
+            self.browser = None
+        
+        self.context = None
+        self.page = None
+        self.points_page = None
+        scraping_logger.info(f"브라우저 종료 완료 (사이트: {self.site['name']})")
+    
+    async def _close_quietly(self, close):
+        """종료 함수 실행 (실패해도 나머지 정리를 계속하도록 기록만 함)"""
+        try:
+            await close()
+        except Exception as e:
+            scraping_logger.error(f"브라우저 종료 중 오류: {str(e)}")
+    
+    def is_browser_alive(self) -> bool:
+        """
+        브라우저 연결 상태 확인
+        
+        Returns:
+            연결 여부 (브라우저 연결이 끊겼거나 컨텍스트가 없으면 False)
+        """
+        try:
+            return bool(self.browser) and self.browser.is_connected() and self.context is not None
+        except Exception:
+            return False
+    
+    async def restart_browser(self, reason: str = '') -> bool:
+        """
+        브라우저(공유 브라우저면 컨텍스트) 재시작 후 저장된 세션으로 다시 로그인
+        
+        직접 실행한 브라우저는 launch_browser()로 다시 실행하므로, 공유 브라우저 서버에 연결할 수 없으면
+        브라우저를 직접 실행합니다. 다중 사이트 조회에서 공유하는 브라우저는 호출한 쪽에서 다시 실행한 후
+        browser를 바꿔 두어야 합니다.
+        
+        Args:
+            reason: 재시작 사유 (로그 기록용)
+        
+        Returns:
+            입출차 조회 페이지까지 준비 성공 여부
+        """
+        scraping_logger.warning(f"브라우저 재시작{f' ({reason})' if reason else ''} (사이트: {self.site['name']})")
+        
+        if self.is_browser_alive():
+            await self.save_session()
+        await self.stop()
+        
+        self.is_logged_in = False
+        try:
+            await self.start()
+        except Exception:
+            return False
+        return await self.prepare()
+    
+    async def _route_request(self, route):
+        """요청 라우팅 (차단 대상은 중단, 나머지는 그대로 진행)"""
+        if self._should_block(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def save_session(self):
+        """현재 로그인 세션(쿠키, 로컬 스토리지)을 파일로 저장"""
+        session_state_path = self._session_state_path()
+        if not session_state_path or not self.context:
+            return
+        
+        try:
+            await self.context.storage_state(path=str(session_state_path))
+            self.session_restored = True
+            scraping_logger.info(f"로그인 세션 저장 완료: {session_state_path}")
+        except Exception as e:
+            scraping_logger.warning(f"로그인 세션 저장 실패: {str(e)}")
+    
+    async def is_session_valid(self) -> bool:
+        """
+        저장된 세션으로 입출차 조회 페이지에 접근 가능한지 확인
+        
+        Returns:
+            세션 유효 여부
+        """
+        try:
+            await self.page.goto(self._inout_url(), wait_until='domcontentloaded')
+            
+            if await self.page.query_selector(LOGIN_ID_SELECTOR):
+                return False
+            return await self.page.query_selector(SEARCH_BUTTON_SELECTOR) is not None
+        
+        except Exception as e:
+            scraping_logger.warning(f"세션 확인 중 오류: {str(e)}")
+            return False
+    
+    async def ensure_login(self) -> bool:
+        """
+        저장된 세션이 유효하면 로그인을 건너뛰고, 아니면 로그인 수행
+        
+        Returns:
+            로그인 상태 여부
+        """
+        session_valid = False
+        if self.session_restored:
+            with self._timed('session_probe'):
+                session_valid = await self.is_session_valid()
+        
+        if self._accept_session_probe(session_valid):
+            return True
+        
+        with self._timed('login'):
+            return await self.login()
+    
+    async def login(self) -> bool:
+        """
+        Real Parking 로그인
+        
+        Returns:
+            로그인 성공 여부
+        """
+        try:
+            site_url = self.site['url']
+            scraping_logger.info(f"로그인 시도 중... (사이트: {self.site['name']})")
+            
+            await self.page.goto(site_url)
+            scraping_logger.info(f"로그인 페이지 접속: {site_url}")
+            
+            await self.page.evaluate(FILL_LOGIN_SCRIPT, self._login_credentials())
+            scraping_logger.info("로그인 정보 입력 완료")
+            
+            # 로그인 버튼 클릭 후 페이지 이동 완료까지 대기
+            try:
+                with self._timed('login_wait'):
+                    async with self.page.expect_navigation(wait_until='domcontentloaded'):
+                        await self.page.evaluate(SUBMIT_LOGIN_SCRIPT)
+                scraping_logger.info(f"로그인 버튼 클릭 ({self.step_timings['login_wait']}ms 대기)")
+            except PlaywrightTimeout:
+                scraping_logger.warning("로그인 후 페이지 이동이 감지되지 않음")
+            
+            current_url = self.page.url
+            if self._is_logged_in_url(current_url):
+                self._mark_logged_in(current_url)
+                scraping_logger.success(f"로그인 성공 - 현재 URL: {current_url}")
+                await self.save_session()
+                return True
+            
+            scraping_logger.error(f"로그인 실패 - 현재 URL: {current_url}")
+            return False
+        
+        except Exception as e:
+            scraping_logger.error(f"로그인 중 오류 발생: {str(e)}")
+            return False
+    
+    async def get_points_info(self) -> Dict[str, int]:
+        """
+        포인트 정보 조회
+        
+        입출차 조회 페이지와 별도의 페이지를 새로고침하여 확인하므로
+        입출차 검색과 동시에 실행할 수 있습니다.
+        
+        Returns:
+            포인트 정보 딕셔너리 {'basic': 기본 포인트, 'purchase': 구매 포인트}
+            (찾지 못하면 이전 값 유지)
+        """
+        try:
+            with self._timed('points'):
+                await self.points_page.goto(self.home_url, wait_until='domcontentloaded')
+                extract = await self.points_page.evaluate(EXTRACT_SCRIPT, {'cursor': None, 'rows': False})
+            
+            # 검색과 동시에 실행되므로 포인트 정보만 반영 (페이지 수는 입출차 조회 페이지 기준)
+            points_info = points_from_extract(extract)
+            if not points_info:
+                scraping_logger.warning(f"포인트 정보를 찾지 못함 - 이전 값 유지 ({self.home_url})")
+                if not self.points_info:
+                    self.points_info = {'basic': 0, 'purchase': 0}
+                return self.points_info
+            
+            self.points_info = points_info
+            scraping_logger.info(
+                f"포인트 정보 조회 완료 - 기본: {points_info['basic']}, 구매: {points_info['purchase']} "
+                f"({self.step_timings['points']}ms)"
+            )
+            return points_info
+        
+        except Exception as e:
+            scraping_logger.error(f"포인트 정보 조회 실패: {str(e)}")
+            if not self.points_info:
+                self.points_info = {'basic': 0, 'purchase': 0}
+            return self.points_info
+    
+    async def navigate_to_inout_list(self) -> bool:
+        """
+        입출차 조회 페이지로 이동
+        
+        Returns:
+            이동 성공 여부
+        """
+        try:
+            if not self.is_logged_in:
+                scraping_logger.error("로그인이 필요합니다")
+                return False
+            
+            # 세션 확인 과정에서 이미 조회 페이지가 열려 있으면 이동 생략
+            if self.page.url.startswith(self._inout_url()) and await self.is_search_ready():
+                scraping_logger.info("입출차 조회 페이지가 이미 열려 있음")
+                return True
+            
+            with self._timed('navigate'):
+                await self.page.goto(self._inout_url(), wait_until='domcontentloaded')
+                await self.page.wait_for_selector(SEARCH_BUTTON_SELECTOR, state='attached')
+            
+            scraping_logger.info(f"입출차 조회 페이지 이동 완료 ({self.step_timings['navigate']}ms)")
+            return True
+        
+        except Exception as e:
+            scraping_logger.error(f"페이지 이동 중 오류: {str(e)}")
+            return False
+    
+    async def is_search_ready(self) -> bool:
+        """
+        입출차 조회 페이지의 검색 버튼이 사용 가능한지 확인
+        
+        Returns:
+            검색 가능 여부
+        """
+        try:
+            if not self.is_logged_in or not self.page:
+                return False
+            return await self.page.query_selector(SEARCH_BUTTON_SELECTOR) is not None
+        except Exception:
+            return False
+    
+    async def get_parking_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                               cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+        """
+        입출차 데이터 조회
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 기본값: 시작 날짜)
+            cursor: 증분 조회 기준
+        
+        Returns:
+            입출차 데이터 리스트
+        """
+        try:
+            if not self.is_logged_in:
+                scraping_logger.error("로그인이 필요합니다")
+                return []
+            
+            start_date, end_date = self._resolve_dates(start_date, end_date)
+            scraping_logger.info(f"입출차 데이터 조회 시작: {start_date} ~ {end_date}")
+            
+            await self.page.evaluate(PREPARE_SEARCH_SCRIPT, [start_date, end_date])
+            
+            # 검색 버튼 클릭 (검색 응답을 바로 파싱할 수 있으면 DOM 파싱 생략)
+            data = None
+            self.last_search_html = ''
+            search_button = await self.page.query_selector(SEARCH_BUTTON_SELECTOR)
+            if search_button:
+                with self._timed('search'):
+                    data = await self._search_and_wait(search_button, cursor)
+            
+            # 응답을 파싱하지 못한 경우 렌더링된 테이블 파싱 (페이지 수도 함께 추출)
+            # 응답을 파싱한 경우에도 페이지 수를 알 수 없으면 행 없이 페이지 수만 추출
+            self.last_total_pages = 1
+            if data is None or not self.last_search_html:
+                with self._timed('parse'):
+                    extract = await self.page.evaluate(
+                        EXTRACT_SCRIPT, {'cursor': cursor.to_js() if cursor else None, 'rows': data is None}
+                    )
+                self.last_total_pages = extract['totalPages']
+                if data is None:
+                    self.last_parse_source = 'dom'
+                    data = records_from_extract(extract, cursor)
+            
+            data = await self._fetch_remaining_pages(data, start_date, end_date, cursor)
+            
+            if cursor:
+                scraping_logger.info(cursor.summary())
+            
+            scraping_logger.success(
+                f"입출차 데이터 {len(data)}건 조회 완료 (파싱: {self.last_parse_source})",
+                {'timings': dict(self.step_timings), 'requests': dict(self.request_stats)}
+            )
+            return data
+        
+        except Exception as e:
+            scraping_logger.error(f"데이터 조회 중 오류: {str(e)}")
+            return []
+    
+    async def _search_and_wait(self, search_button,
+                               cursor: Optional[ScrapeCursor] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        검색 버튼 클릭 후 검색 결과 응답을 파싱하고 테이블이 갱신될 때까지 대기
+        (ParkingScraper._search_and_wait와 같은 순서)
+        
+        Returns:
+            검색 응답에서 파싱한 데이터 리스트 (DOM 파싱이 필요하면 None)
+        """
+        async with self.page.expect_response(self._is_search_response) as response_info:
+            await search_button.click()
+        response = await response_info.value
+        
+        data = None
+        try:
+            content_type = response.headers.get('content-type', '')
+            if 'json' in content_type or 'html' in content_type:
+                data = self._apply_search_body(content_type, await response.text(), cursor)
+        except Exception as e:
+            scraping_logger.warning(f"검색 응답 파싱 실패 - 테이블에서 파싱합니다: {str(e)}")
+        
+        try:
+            await self.page.wait_for_function(ROWS_REFRESHED_SCRIPT, timeout=config.SEARCH_RENDER_TIMEOUT)
+        except PlaywrightTimeout:
+            scraping_logger.warning("검색 후 테이블이 바뀌지 않음 - 현재 테이블을 사용합니다")
+        await self.page.wait_for_load_state('domcontentloaded')
+        
+        return data
+    
+    async def _fetch_remaining_pages(self, data: List[Dict[str, Any]], start_date: str, end_date: str,
+                                     cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+        """
+        검색 결과가 여러 페이지인 경우 2페이지 이후를 동시에 조회하여 병합
+        
+        HTTP 조회는 별도 스레드에서 실행하여 이벤트 루프(포인트 조회 등)를 막지 않습니다.
+        
+        Returns:
+            전체 페이지 데이터 (실패 시 첫 페이지 데이터)
+        """
+        try:
+            total_pages = self._remaining_total_pages(cursor)
+            if total_pages <= 1:
+                return data
+            
+            search_form = self._pages_search_form(self.last_search_html or await self.page.content(), self.page.url)
+            
+            with self._timed('pages'):
+                session = session_from_cookies(await self.context.cookies())
+                try:
+                    rest = await asyncio.to_thread(
+                        fetch_remaining_pages, session, search_form, total_pages, start_date, end_date
+                    )
+                finally:
+                    session.close()
+            
+            return self._merge_remaining_pages(data, rest, total_pages, cursor)
+        
+        except Exception as e:
+            scraping_logger.warning(f"2페이지 이후 조회 실패 - 첫 페이지만 사용합니다: {str(e)}")
+            return data
+    
+    async def get_today_data(self, cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+        """
+        오늘 입출차 데이터 조회
+        
+        Args:
+            cursor: 증분 조회 기준
+        
+        Returns:
+            오늘의 입출차 데이터 리스트
+        """
+        today = datetime.now().strftime(config.DATE_FORMAT)
+        return await self.get_parking_data(today, today, cursor)
+    
+    async def prepare(self) -> bool:
+        """
+        로그인 후 포인트 정보 조회와 입출차 조회 페이지 이동을 동시에 수행
+        
+        Returns:
+            준비 성공 여부
+        """
+        if not await self.ensure_login():
+            return False
+        
+        _, navigated = await asyncio.gather(self.get_points_info(), self.navigate_to_inout_list())
+        return navigated
+    
+    async def poll(self, cursor: Optional[ScrapeCursor] = None) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+        """
+        포인트 정보와 오늘 입출차 데이터를 동시에 조회
+        
+        조회 1회의 소요 시간은 두 조회 중 느린 쪽의 시간이 됩니다.
+        
+        Args:
+            cursor: 증분 조회 기준
+        
+        Returns:
+            (포인트 정보, 입출차 데이터 리스트)
+        """
+        self.reset_request_stats()
+        with self._timed('poll'):
+            points, records = await asyncio.gather(self.get_points_info(), self.get_today_data(cursor))
+        
+        scraping_logger.info(
+            f"동시 조회 완료 ({self.step_timings['poll']}ms - 포인트 {self.step_timings.get('points', 0)}ms, "
+            f"검색 {self.step_timings.get('search', 0)}ms)"
+        )
+        return points, records
+    
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입"""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료"""
+        await self.stop()
@@ -0,0 +1,171 @@
+"""
+과거 입출차 데이터 수집 스크립트
+기간을 일/주 단위 구간으로 나누어 동시에 조회하고, 구간별로 저장합니다.
+중단된 경우 다시 실행하면 완료되지 않은 구간부터 이어서 수집합니다.
+
+사용 예:
+    python backfill.py --from 2025-07-01 --to 2025-12-31 --chunk week --workers 4
+"""
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import List, Tuple
+import config
+from parking_scraper import create_scraper
+from database import ParkingDatabase
+from delta_log import DeltaLog
+from http_client import WorkerSessions, search_all_pages
+from logger import system_logger
+
+
+def split_date_range(start_date: str, end_date: str, chunk: str = 'day') -> List[Tuple[str, str]]:
+    """
+    조회 기간을 구간으로 분할
+    
+    Args:
+        start_date: 시작 날짜 (YYYY-MM-DD)
+        end_date: 종료 날짜 (YYYY-MM-DD)
+        chunk: 구간 단위 ('day' 또는 'week')
+    
+    Returns:
+        (구간 시작 날짜, 구간 종료 날짜) 리스트
+    """
+    start = datetime.strptime(start_date, config.DATE_FORMAT)
+    end = datetime.strptime(end_date, config.DATE_FORMAT)
+    step = timedelta(days=7 if chunk == 'week' else 1)
+    
+    chunks = []
+    current = start
+    while current <= end:
+        chunk_end = min(current + step - timedelta(days=1), end)
+        chunks.append((current.strftime(config.DATE_FORMAT), chunk_end.strftime(config.DATE_FORMAT)))
+        current = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def backfill(start_date: str, end_date: str, chunk: str = 'day', workers: int = config.BACKFILL_WORKERS,
+             backend: str = config.SCRAPER_BACKEND) -> int:
+    """
+    과거 입출차 데이터 수집
+    
+    오늘이 포함된 구간은 이후 입출차가 더 생기므로 저장만 하고 완료 표시는 하지 않습니다
+    (다시 실행하면 다시 수집).
+    
+    Args:
+        start_date: 시작 날짜 (YYYY-MM-DD)
+        end_date: 종료 날짜 (YYYY-MM-DD)
+        chunk: 구간 단위 ('day' 또는 'week')
+        workers: 동시에 조회할 구간 수
+        backend: 스크래퍼 백엔드
+    
+    Returns:
+        종료 코드 (실패한 구간이 있으면 1)
+    """
+    db = ParkingDatabase()
+    delta_log = DeltaLog(db) if config.DELTA_LOG_ENABLED else None
+    if delta_log:
+        delta_log.sync()
+    
+    completed = db.get_completed_backfill_chunks()
+    chunks = [c for c in split_date_range(start_date, end_date, chunk) if c not in completed]
+    
+    system_logger.info(
+        f"과거 데이터 수집 시작: {start_date} ~ {end_date} "
+        f"({len(chunks)}개 구간 남음, 완료 {len(completed)}개 건너뜀)"
+    )
+    if not chunks:
+        system_logger.success("수집할 구간이 없습니다")
+        return 0
+    
+    with create_scraper(backend) as scraper:
+        if not scraper.ensure_login() or not scraper.navigate_to_inout_list():
+            system_logger.error("로그인 또는 입출차 조회 페이지 이동 실패")
+            return 1
+        
+        # 모든 작업자가 브라우저의 로그인 세션을 공유
+        session, search_form = scraper.open_search_session()
+    
+    failed = 0
+    total_records = 0
+    today = datetime.now().strftime(config.DATE_FORMAT)
+    try:
+        # 작업자마다 로그인 세션 쿠키를 복사한 HTTP 세션 사용
+        with WorkerSessions(session) as sessions, ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(
+                    lambda start, end: search_all_pages(sessions.get(), search_form, start, end),
+                    chunk_start, chunk_end
+                ): (chunk_start, chunk_end)
+                for chunk_start, chunk_end in chunks
+            }
+            
+            # 완료되는 순서대로 저장 후 진행 상황 기록
+            for future in as_completed(futures):
+                chunk_start, chunk_end = futures[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    failed += 1
+                    system_logger.error(f"구간 조회 실패: {chunk_start} ~ {chunk_end} - {str(e)}")
+                    continue
+                
+                # 저장에 실패하면 완료 표시도 롤백되어 다음 실행에서 다시 수집
+                try:
+                    with db.transaction():
+                        new_count = db.insert_records(records) if records else 0
+                        if chunk_end < today:
+                            db.mark_backfill_chunk_completed(chunk_start, chunk_end, len(records))
+                except Exception as e:
+                    failed += 1
+                    system_logger.error(f"구간 저장 실패: {chunk_start} ~ {chunk_end} - {str(e)}")
+                    continue
+                
+                total_records += len(records)
+                system_logger.info(
+                    f"구간 저장 완료: {chunk_start} ~ {chunk_end} - 조회 {len(records)}건, 신규 {new_count}건"
+                )
+    finally:
+        session.close()
+        
+        # 수집한 새 기록과 출차 반영 기록을 변경 파일로 남김
+        if delta_log:
+            delta_log.flush()
+    
+    if failed:
+        system_logger.warning(f"과거 데이터 수집 종료 - {failed}개 구간 실패 (다시 실행하면 이어서 수집)")
+        return 1
+    
+    system_logger.success(f"과거 데이터 수집 완료 - 총 {total_records}건 조회")
+    return 0
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='Real Parking 과거 입출차 데이터 수집')
+    parser.add_argument('--from', dest='start_date', required=True, help='시작 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='end_date', default=datetime.now().strftime(config.DATE_FORMAT),
+                        help='종료 날짜 (YYYY-MM-DD, 기본값: 오늘)')
+    parser.add_argument('--chunk', choices=['day', 'week'], default='day', help='구간 단위 (기본값: day)')
+    parser.add_argument('--workers', type=int, default=config.BACKFILL_WORKERS,
+                        help=f'동시에 조회할 구간 수 (기본값: {config.BACKFILL_WORKERS})')
+    parser.add_argument('--backend', choices=['playwright', 'http'], default=config.SCRAPER_BACKEND,
+                        help='로그인에 사용할 스크래퍼 백엔드')
+    args = parser.parse_args()
+    
+    try:
+        return backfill(args.start_date, args.end_date, args.chunk, args.workers, args.backend)
+    
+    except KeyboardInterrupt:
+        system_logger.info("사용자에 의해 수집 중단 (다시 실행하면 이어서 수집)")
+        return 0
+    
+    except Exception as e:
+        system_logger.error(f"과거 데이터 수집 중 오류 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+녹화 파일 재생 벤치마크
+data/fixtures/에 녹화된 응답으로 main_with_notification의 조회 과정
+(로그인 → 포인트 조회 → 입출차 조회 → 변경 감지/알림 → 저장)을
+네트워크 없이 반복 실행하고 단계별 소요 시간을 측정합니다.
+
+녹화:
+    SCRAPER_FIXTURE_MODE=record python main_with_notification.py --no-notification --full-scan
+
+재생 벤치마크:
+    python benchmark_replay.py --iterations 10
+"""
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from typing import List, Dict, Any
+import config
+from logger import system_logger
+
+
+class RecordingBroadcaster:
+    """실제 방송 대신 알림 횟수만 기록하는 방송기"""
+    
+    def __init__(self):
+        self.entries = 0
+        self.exits = 0
+    
+    def broadcast_entry(self, car_number: str, name: str, location: str, is_resident: bool = False) -> bool:
+        """입차 안내방송 (횟수만 기록)"""
+        self.entries += 1
+        return True
+    
+    def broadcast_exit(self, car_number: str, name: str, location: str, is_resident: bool = False,
+                       current_points: int = 0) -> bool:
+        """출차 안내방송 (횟수만 기록)"""
+        self.exits += 1
+        return True
+
+
+def run_iteration(db_path: Path) -> Dict[str, Any]:
+    """
+    재생 모드로 조회 과정 1회 실행
+    
+    Args:
+        db_path: 이번 회차에 사용할 빈 데이터베이스 경로
+    
+    Returns:
+        측정 결과 (단계별 소요 시간은 밀리초)
+    """
+    from parking_scraper import ParkingScraper
+    from database import ParkingDatabase
+    from notification_manager import NotificationManager
+    from main_with_notification import prepare_scraper, run_poll
+    
+    db = ParkingDatabase(db_path)
+    broadcaster = RecordingBroadcaster()
+    notification_manager = NotificationManager(db, broadcaster=broadcaster)
+    
+    started = time.perf_counter()
+    with ParkingScraper() as scraper:
+        browser_ready = time.perf_counter()
+        if not prepare_scraper(scraper):
+            raise RuntimeError("재생 중 로그인 또는 페이지 이동 실패 (녹화 파일 확인 필요)")
+        
+        prepared = time.perf_counter()
+        result = run_poll(scraper, db, notification_manager, verbose=False, incremental=False)
+        polled = time.perf_counter()
+        timings = dict(scraper.step_timings)
+    db.close()
+    
+    return {
+        'startup': round((browser_ready - started) * 1000, 1),
+        'prepare': round((prepared - browser_ready) * 1000, 1),
+        'poll': round((polled - prepared) * 1000, 1),
+        'total': round((time.perf_counter() - started) * 1000, 1),
+        **{f'step_{name}': value for name, value in timings.items()},
+        'records': result['records'],
+        'new_records': result['new_records'],
+        'notifications': broadcaster.entries + broadcaster.exits
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    회차별 결과 요약
+    
+    Returns:
+        {항목: {'median', 'min', 'max'}}
+    """
+    summary = {}
+    keys = dict.fromkeys(key for result in results for key in result)  # 회차마다 기록된 단계가 다를 수 있음
+    for key in keys:
+        values = [result[key] for result in results if key in result]
+        summary[key] = {
+            'median': round(statistics.median(values), 1),
+            'min': min(values),
+            'max': max(values)
+        }
+    return summary
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='녹화 파일 재생 벤치마크')
+    parser.add_argument('--iterations', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    parser.add_argument('--fixture', default=config.FIXTURE_NAME,
+                        help=f'녹화 이름 (기본값: {config.FIXTURE_NAME})')
+    parser.add_argument('--output', type=Path, help='측정 결과를 저장할 JSON 파일 (회차 비교용)')
+    args = parser.parse_args()
+    
+    config.SCRAPER_FIXTURE_MODE = 'replay'
+    config.FIXTURE_NAME = args.fixture
+    
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(1, args.iterations + 1):
+                result = run_iteration(Path(temp_dir) / f'benchmark_{i}.db')
+                results.append(result)
+                system_logger.info(
+                    f"[{i}/{args.iterations}] 전체 {result['total']}ms "
+                    f"(조회 {result['poll']}ms, 기록 {result['records']}건, 알림 {result['notifications']}건)"
+                )
+    except Exception as e:
+        system_logger.error(f"벤치마크 실행 실패: {str(e)}")
+        return 1
+    
+    summary = summarize(results)
+    
+    print(f"\n{'='*60}")
+    print(f"재생 벤치마크 결과 ({args.fixture}, {args.iterations}회)")
+    print(f"{'='*60}")
+    print(f"  {'항목':<20}{'중앙값':>12}{'최소':>12}{'최대':>12}")
+    for key, values in summary.items():
+        print(f"  {key:<20}{values['median']:>12}{values['min']:>12}{values['max']:>12}")
+    print(f"{'='*60}\n")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'fixture': args.fixture, 'summary': summary, 'iterations': results},
+                      f, ensure_ascii=False, indent=2)
+        system_logger.info(f"측정 결과 저장: {args.output}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+공유 브라우저 서버 모듈
+Playwright 브라우저 서버를 한 번 실행해 두고, 각 실행 파일(main.py, main_with_notification.py,
+테스트 스크립트)이 브라우저를 새로 띄우는 대신 웹소켓 주소로 연결하여 컨텍스트만 새로 만들도록 합니다.
+
+USE_BROWSER_SERVER=true일 때 사용하며, 서버에 연결하지 못하면 스크래퍼가 브라우저를 직접 실행합니다.
+
+사용 예:
+    python browser_server.py start
+    python browser_server.py status
+    python browser_server.py stop
+    python browser_server.py restart
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import subprocess
+from datetime import datetime
+from typing import Dict, Any, Optional
+import config
+from logger import system_logger
+
+# 서버 출력 로그 (접속 주소가 첫 줄에 기록됨)
+SERVER_LOG_PATH = config.LOGS_DIR / 'browser_server.log'
+
+
+def read_server_info() -> Optional[Dict[str, Any]]:
+    """
+    실행 중인 브라우저 서버 정보 불러오기
+    
+    Returns:
+        {'ws_endpoint', 'pid', 'started_at'} (서버 정보 파일이 없거나 읽을 수 없으면 None)
+    """
+    try:
+        with open(config.BROWSER_SERVER_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_server_endpoint() -> Optional[str]:
+    """
+    스크래퍼가 연결할 브라우저 서버 주소
+    
+    Returns:
+        웹소켓 주소 (공유 브라우저 서버를 사용하지 않거나 실행 중이 아니면 None)
+    """
+    if not config.USE_BROWSER_SERVER:
+        return None
+    
+    info = read_server_info()
+    return info['ws_endpoint'] if info else None
+
+
+def start_server() -> Optional[Dict[str, Any]]:
+    """
+    브라우저 서버를 백그라운드 프로세스로 실행하고 접속 주소 저장
+    
+    Returns:
+        서버 정보 (시작 실패 시 None)
+    """
+    info = read_server_info()
+    if info and is_server_running(info['ws_endpoint']):
+        system_logger.info(f"브라우저 서버가 이미 실행 중입니다: {info['ws_endpoint']}")
+        return info
+    
+    # launch-server는 launchServer 옵션을 JSON 파일로 받음
+    options_path = config.DATA_DIR / 'browser_server_options.json'
+    with open(options_path, 'w', encoding='utf-8') as f:
+        json.dump({'headless': config.HEADLESS}, f)
+    
+    command = [
+        sys.executable, '-m', 'playwright', 'launch-server',
+        '--browser', 'chromium', '--config', str(options_path)
+    ]
+    
+    # 실행한 터미널이 닫혀도 서버가 유지되도록 출력은 파일로 보내고 별도 세션으로 실행
+    with open(SERVER_LOG_PATH, 'w', encoding='utf-8') as log_file:
+        process = subprocess.Popen(
+            command, stdout=log_file, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    
+    ws_endpoint = _wait_for_endpoint(process)
+    if not ws_endpoint:
+        system_logger.error(f"브라우저 서버 시작 실패 (출력: {SERVER_LOG_PATH})")
+        if process.poll() is None:
+            process.terminate()
+        return None
+    
+    info = {
+        'ws_endpoint': ws_endpoint,
+        'pid': process.pid,
+        'started_at': datetime.now().strftime(config.DATETIME_FORMAT)
+    }
+    with open(config.BROWSER_SERVER_FILE, 'w', encoding='utf-8') as f:
+        json.dump(info, f, ensure_ascii=False, indent=2)
+    
+    system_logger.success(f"브라우저 서버 시작 완료: {ws_endpoint} (PID {process.pid})")
+    return info
+
+
+def _wait_for_endpoint(process: subprocess.Popen) -> Optional[str]:
+    """
+    서버 출력에 웹소켓 주소가 기록될 때까지 대기
+    
+    Returns:
+        웹소켓 주소 (제한 시간 안에 기록되지 않거나 프로세스가 종료되면 None)
+    """
+    deadline = time.monotonic() + config.BROWSER_SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        with open(SERVER_LOG_PATH, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if line.startswith('ws://'):
+                    return line.strip()
+        
+        if process.poll() is not None:
+            return None
+        time.sleep(0.1)
+    return None
+
+
+def is_server_running(ws_endpoint: str) -> bool:
+    """
+    브라우저 서버 연결 가능 여부 확인
+    
+    Args:
+        ws_endpoint: 웹소켓 주소
+    
+    Returns:
+        연결 가능 여부
+    """
+    from playwright.sync_api import sync_playwright
+    
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.connect(ws_endpoint, timeout=5000)
+            browser.close()
+        return True
+    except Exception:
+        return False
+
+
+def stop_server() -> bool:
+    """
+    실행 중인 브라우저 서버 종료 (서버가 실행한 Chromium 프로세스 포함)
+    
+    Returns:
+        종료 성공 여부 (실행 중인 서버가 없으면 False)
+    """
+    info = read_server_info()
+    if not info:
+        system_logger.info("실행 중인 브라우저 서버가 없습니다")
+        return False
+    
+    try:
+        # 서버는 별도 세션(프로세스 그룹)으로 실행하므로 그룹 전체를 종료
+        if hasattr(os, 'killpg'):
+            os.killpg(info['pid'], signal.SIGTERM)
+        else:
+            os.kill(info['pid'], signal.SIGTERM)
+        system_logger.success(f"브라우저 서버 종료 완료 (PID {info['pid']})")
+        stopped = True
+    except OSError as e:
+        system_logger.warning(f"브라우저 서버 종료 실패 (이미 종료되었을 수 있음): {str(e)}")
+        stopped = False
+    
+    config.BROWSER_SERVER_FILE.unlink(missing_ok=True)
+    return stopped
+
+
+def restart_server(expected_pid: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    응답하지 않는 브라우저 서버를 종료하고 새로 시작
+    
+    같은 서버를 사용하는 다른 실행 파일이 이미 새로 시작했으면 그 서버를 그대로 사용합니다.
+    
+    Args:
+        expected_pid: 재시작할 서버의 PID (연결했던 서버, 지정하지 않으면 현재 서버)
+    
+    Returns:
+        새 서버 정보 (시작 실패 시 None)
+    """
+    info = read_server_info()
+    if info and expected_pid is not None and info['pid'] != expected_pid:
+        system_logger.info(f"브라우저 서버가 이미 다시 시작되었습니다: {info['ws_endpoint']} (PID {info['pid']})")
+        return info
+    
+    system_logger.warning("브라우저 서버 재시작")
+    if info:
+        stop_server()
+    return start_server()
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='공유 Playwright 브라우저 서버 관리')
+    parser.add_argument('command', choices=['start', 'stop', 'restart', 'status'],
+                        help='start: 서버 시작, stop: 서버 종료, restart: 서버 재시작, status: 실행 상태 확인')
+    args = parser.parse_args()
+    
+    if args.command == 'start':
+        info = start_server()
+        if not info:
+            return 1
+        if not config.USE_BROWSER_SERVER:
+            system_logger.warning("USE_BROWSER_SERVER=true로 설정해야 스크래퍼가 서버에 연결합니다")
+        return 0
+    
+    if args.command == 'stop':
+        return 0 if stop_server() else 1
+    
+    if args.command == 'restart':
+        return 0 if restart_server() else 1
+    
+    info = read_server_info()
+    if info and is_server_running(info['ws_endpoint']):
+        system_logger.info(
+            f"브라우저 서버 실행 중: {info['ws_endpoint']} (PID {info['pid']}, 시작 {info['started_at']})"
+        )
+        return 0
+    
+    system_logger.info("실행 중인 브라우저 서버가 없습니다")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
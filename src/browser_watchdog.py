@@ -0,0 +1,175 @@
+"""
+브라우저 감시 모듈
+Chromium 프로세스의 메모리 사용량을 측정하고,
+응답 없이 멈춘 작업은 브라우저 프로세스를 종료하여 중단시킵니다.
+공유 브라우저 서버에 연결한 경우에는 다른 실행 파일도 서버를 사용하므로, 서버의 Chromium 대신
+이 프로세스가 실행한 Playwright 드라이버만 종료합니다.
+
+psutil이 설치되어 있지 않으면 메모리 측정과 강제 종료를 사용하지 않습니다.
+"""
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+from logger import scraping_logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Chromium 프로세스 이름 (Playwright 드라이버(node)는 제외)
+BROWSER_PROCESS_NAMES = ('chrome', 'chromium', 'headless_shell')
+
+# Playwright 드라이버 프로세스 이름 (sync_playwright()가 현재 프로세스의 자식으로 실행)
+DRIVER_PROCESS_NAMES = ('node',)
+
+
+def find_browser_processes(root_pid: Optional[int] = None) -> List['psutil.Process']:
+    """
+    Chromium 프로세스 목록
+    
+    Args:
+        root_pid: 브라우저를 실행한 프로세스 (기본값: 현재 프로세스, 공유 브라우저 서버는 서버 프로세스)
+    
+    Returns:
+        Chromium 프로세스 리스트 (psutil이 없거나 프로세스가 없으면 빈 리스트)
+    """
+    if psutil is None:
+        return []
+    
+    processes = []
+    try:
+        for child in psutil.Process(root_pid).children(recursive=True):
+            try:
+                name = child.name().lower()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if any(browser_name in name for browser_name in BROWSER_PROCESS_NAMES):
+                processes.append(child)
+    except psutil.Error:
+        pass
+    return processes
+
+
+def find_driver_processes() -> List['psutil.Process']:
+    """
+    현재 프로세스가 실행한 Playwright 드라이버 프로세스 목록
+    
+    Returns:
+        드라이버 프로세스 리스트 (psutil이 없거나 프로세스가 없으면 빈 리스트)
+    """
+    if psutil is None:
+        return []
+    
+    processes = []
+    try:
+        for child in psutil.Process().children():
+            try:
+                name = child.name().lower()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if any(driver_name in name for driver_name in DRIVER_PROCESS_NAMES):
+                processes.append(child)
+    except psutil.Error:
+        pass
+    return processes
+
+
+def browser_memory_mb(root_pid: Optional[int] = None) -> float:
+    """
+    Chromium 프로세스 전체의 메모리 사용량 (RSS 합계)
+    
+    Args:
+        root_pid: 브라우저를 실행한 프로세스 (기본값: 현재 프로세스, 공유 브라우저 서버는 서버 프로세스)
+    
+    Returns:
+        메모리 사용량 (MB, 측정할 수 없으면 0)
+    """
+    total = 0
+    for process in find_browser_processes(root_pid):
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return round(total / (1024 * 1024), 1)
+
+
+def kill_processes(processes: List['psutil.Process']) -> int:
+    """
+    프로세스 강제 종료
+    
+    Returns:
+        종료한 프로세스 수
+    """
+    killed = 0
+    for process in processes:
+        try:
+            process.kill()
+            killed += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return killed
+
+
+def kill_browser_processes(root_pid: Optional[int] = None) -> int:
+    """
+    Chromium 프로세스 강제 종료
+    
+    Args:
+        root_pid: 브라우저를 실행한 프로세스 (기본값: 현재 프로세스)
+    
+    Returns:
+        종료한 프로세스 수
+    """
+    return kill_processes(find_browser_processes(root_pid))
+
+
+class BrowserWatchdog:
+    """멈춘 브라우저 작업 감시"""
+    
+    def __init__(self):
+        self.fired = False  # 마지막 감시 중 브라우저를 강제 종료했는지 여부
+        self.root_pid: Optional[int] = None  # 브라우저를 실행한 프로세스 (공유 브라우저 서버에 연결하면 서버 PID)
+        if psutil is None:
+            scraping_logger.warning("psutil 모듈이 설치되지 않아 브라우저 감시 기능을 사용하지 않습니다")
+    
+    @contextmanager
+    def guard(self, operation: str, timeout: float):
+        """
+        작업이 제한 시간 안에 끝나지 않으면 브라우저 프로세스 강제 종료
+        
+        브라우저가 종료되면 멈춰 있던 Playwright 호출이 예외로 빠져나오므로,
+        호출한 쪽에서 브라우저를 다시 시작해야 합니다 (fired 확인).
+        공유 브라우저 서버에 연결한 경우 서버는 다른 실행 파일도 사용하므로 종료하지 않고,
+        이 프로세스의 Playwright 드라이버만 종료하여 연결을 끊습니다.
+        
+        Args:
+            operation: 작업 이름 (로그용)
+            timeout: 제한 시간 (초)
+        """
+        self.fired = False
+        if psutil is None or timeout <= 0:
+            yield
+            return
+        
+        def on_timeout():
+            self.fired = True
+            if self.root_pid is None:
+                killed = kill_browser_processes()
+                scraping_logger.error(
+                    f"'{operation}' 작업이 {timeout}초 동안 응답하지 않아 브라우저 프로세스 {killed}개를 강제 종료했습니다"
+                )
+            else:
+                killed = kill_processes(find_driver_processes())
+                scraping_logger.error(
+                    f"'{operation}' 작업이 {timeout}초 동안 응답하지 않아 Playwright 드라이버 {killed}개를 강제 종료했습니다 "
+                    f"(공유 브라우저 서버 PID {self.root_pid}는 종료하지 않음)"
+                )
+        
+        timer = threading.Timer(timeout, on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
@@ -2,11 +2,29 @@
 입출차 변경 감지 모듈
 새로운 입차 및 출차를 감지합니다.
 """
+import hashlib
+import json
 from typing import List, Dict, Any, Tuple
 from database import ParkingDatabase
 from logger import system_logger
 
 
+def compute_fingerprint(records: List[Dict[str, Any]]) -> str:
+    """
+    조회 결과 지문 계산
+    
+    이전 조회와 결과가 완전히 같은지 빠르게 비교하기 위해 사용합니다.
+    
+    Args:
+        records: 조회된 기록 리스트
+    
+    Returns:
+        조회 결과의 SHA-1 해시
+    """
+    payload = json.dumps(records, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
 class ChangeDetector:
     """입출차 변경 감지기"""
     
@@ -21,49 +39,27 @@ class ChangeDetector:
         """
         새로운 입차 및 출차 감지
         
+        감지와 저장을 한 번에 처리합니다. 새 입차는 데이터베이스에 추가되고,
+        새 출차는 저장된 기록에 출차 정보가 반영됩니다.
+        
         Args:
             new_records: 최신 조회된 기록 리스트
         
         Returns:
             (새로운 입차 리스트, 새로운 출차 리스트)
         """
-        new_entries = []
-        new_exits = []
+        new_entries, new_exits = self.db.upsert_records(new_records)
         
-        for record in new_records:
-            car_number = record.get('car_number')
-            entry_time = record.get('entry_time')
-            exit_time = record.get('exit_time')
-            
-            if not car_number or not entry_time:
-                continue
-            
-            # 데이터베이스에 기록이 있는지 확인
-            existing = self.db.record_exists(car_number, entry_time)
-            
-            if not existing:
-                # 새로운 입차
-                new_entries.append(record)
-                system_logger.info(
-                    f"새로운 입차 감지: {car_number} - {entry_time}",
-                    {'record': record}
-                )
-            else:
-                # 기존 기록이 있는 경우, 출차 여부 확인
-                if exit_time:
-                    # 출차 정보가 업데이트되었는지 확인
-                    existing_records = self.db.get_records_by_car_and_entry(car_number, entry_time)
-                    if existing_records:
-                        existing_record = existing_records[0]
-                        existing_exit_time = existing_record.get('exit_time')
-                        
-                        # 기존에 출차 정보가 없었는데 새로 생긴 경우
-                        if not existing_exit_time and exit_time:
-                            new_exits.append(record)
-                            system_logger.info(
-                                f"새로운 출차 감지: {car_number} - {exit_time}",
-                                {'record': record}
-                            )
+        for record in new_entries:
+            system_logger.info(
+                f"새로운 입차 감지: {record['car_number']} - {record['entry_time']}",
+                {'record': record}
+            )
+        for record in new_exits:
+            system_logger.info(
+                f"새로운 출차 감지: {record['car_number']} - {record.get('exit_time')}",
+                {'record': record}
+            )
         
         system_logger.info(f"변경 감지 완료 - 입차: {len(new_entries)}건, 출차: {len(new_exits)}건")
         return new_entries, new_exits
@@ -23,6 +23,21 @@ LOGS_DIR = PROJECT_ROOT / 'logs'
 
 # 데이터베이스 설정
 DATABASE_PATH = DATA_DIR / 'parking_records.db'
+DB_BUSY_TIMEOUT_MS = 5000  # 다른 프로세스가 쓰는 중일 때 대기 시간 (밀리초)
+DB_CACHE_SIZE_KB = 16384  # 페이지 캐시 크기 (KB)
+DB_MMAP_SIZE_MB = 64  # 메모리 맵 크기 (MB)
+DB_STATEMENT_CACHE_SIZE = 128  # 연결별 SQL 문 캐시 크기
+ARCHIVE_ENABLED = os.getenv('ARCHIVE_ENABLED', 'true').lower() == 'true'  # 지난달 이전 기록을 보관 DB로 분리
+ARCHIVE_DIR_NAME = 'archive'  # 보관 DB 폴더 (데이터베이스 파일과 같은 위치)
+
+# 변경 기록(델타 로그) 설정 - 데이터베이스 파일 대신 변경된 기록만 파일로 남김
+DELTA_LOG_ENABLED = os.getenv('DELTA_LOG_ENABLED', 'false').lower() == 'true'
+DELTAS_DIR = DATA_DIR / 'deltas'
+DELTA_COMPACT_SEGMENTS = int(os.getenv('DELTA_COMPACT_SEGMENTS', '500'))  # 스냅샷 이후 변경 파일이 이만큼 쌓이면 압축
+
+# 로그인 세션 저장 설정 (쿠키 및 로컬 스토리지)
+SESSION_STATE_PATH = DATA_DIR / 'session_state.json'
+USE_SAVED_SESSION = os.getenv('USE_SAVED_SESSION', 'true').lower() == 'true'
 
 # 로그 카테고리
 LOG_CATEGORIES = {
@@ -39,6 +54,71 @@ for log_dir in LOG_CATEGORIES.values():
 # Playwright 설정
 HEADLESS = True  # 브라우저를 숨김 모드로 실행
 TIMEOUT = 30000  # 타임아웃 (밀리초)
+SEARCH_RENDER_TIMEOUT = 5000  # 검색 후 테이블 갱신 대기 시간 (밀리초, 결과가 같아 테이블이 바뀌지 않는 경우 이후 현재 테이블 사용)
+
+# 공유 브라우저 서버 설정 (browser_server.py start로 실행해 두면 스크래퍼가 브라우저를 새로 띄우지 않고 연결)
+USE_BROWSER_SERVER = os.getenv('USE_BROWSER_SERVER', 'false').lower() == 'true'
+BROWSER_SERVER_FILE = DATA_DIR / 'browser_server.json'  # 실행 중인 서버의 접속 주소 및 프로세스 ID
+BROWSER_SERVER_START_TIMEOUT = 30  # 서버 시작 대기 시간 (초)
+
+# 리소스 차단 설정 (페이지 로드 시간 및 대역폭 절감)
+BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', 'true').lower() == 'true'
+BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media', 'stylesheet']
+BLOCKED_URL_PATTERNS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'wcs.naver.net',
+    'analytics'
+]
+# 차단하지 않을 리소스 (로그인/검색에 필요한 jQuery, 검색 버튼 이미지)
+RESOURCE_ALLOWLIST = ['jquery', 'bt_search']
+
+# 스크래퍼 백엔드 설정
+SCRAPER_BACKEND = os.getenv('SCRAPER_BACKEND', 'playwright')  # 'playwright' 또는 'http'
+PARKING_LOGIN_PATH = os.getenv('PARKING_LOGIN_PATH', '')  # HTTP 로그인 전송 경로 (기본값: 로그인 폼 action)
+HTTP_POOL_SIZE = 4  # HTTP 커넥션 풀 크기
+PAGE_FETCH_WORKERS = int(os.getenv('PAGE_FETCH_WORKERS', '4'))  # 여러 페이지 동시 조회 수
+PAGE_PARAM = os.getenv('PAGE_PARAM', '')  # 검색 폼의 페이지 번호 필드 (기본값: 자동 감지)
+BACKFILL_WORKERS = int(os.getenv('BACKFILL_WORKERS', '4'))  # 과거 데이터 수집 시 동시 조회 구간 수
+HTTP_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# 증분 조회 설정 (이미 저장된 기록에 도달하면 파싱 중단)
+INCREMENTAL_SCRAPING = os.getenv('INCREMENTAL_SCRAPING', 'true').lower() == 'true'
+INCREMENTAL_LOOKBACK_MINUTES = 10  # 늦게 등록되는 기록을 위해 다시 확인할 시간 (분)
+
+# 녹화/재생 설정 (실제 사이트 없이 스크래퍼를 실행하는 오프라인 벤치마크용)
+SCRAPER_FIXTURE_MODE = os.getenv('SCRAPER_FIXTURE_MODE', '')  # '' (사용 안 함), 'record' 또는 'replay'
+FIXTURES_DIR = DATA_DIR / 'fixtures'
+FIXTURE_NAME = os.getenv('FIXTURE_NAME', 'default')  # 녹화 파일 이름 (data/fixtures/<이름>.har)
+
+# 다중 사이트 설정 (sites.json이 없으면 위의 단일 사이트만 조회)
+SITES_FILE = Path(os.getenv('SITES_FILE', str(PROJECT_ROOT / 'sites.json')))
+SITES_DATA_DIR = DATA_DIR / 'sites'  # 사이트별 데이터베이스 및 로그인 세션 저장 위치
+MULTI_SITE_WORKERS = int(os.getenv('MULTI_SITE_WORKERS', '3'))  # 동시에 조회할 사이트 수
+
+# 데몬 모드 설정
+POLL_INTERVAL = int(os.getenv('POLL_INTERVAL', '30'))  # 조회 간격 (초)
+POLL_RETRY_DELAY = 10  # 조회 실패 시 재시도 대기 (초)
+
+# 브라우저 감시 설정 (장시간 실행 시 메모리 증가 및 응답 없는 작업 방지)
+CONTEXT_MAX_AGE_MINUTES = int(os.getenv('CONTEXT_MAX_AGE_MINUTES', '120'))  # 컨텍스트 교체 주기 (분)
+CONTEXT_MEMORY_LIMIT_MB = int(os.getenv('CONTEXT_MEMORY_LIMIT_MB', '600'))  # 컨텍스트 교체 메모리 한도 (MB)
+BROWSER_MAX_AGE_HOURS = int(os.getenv('BROWSER_MAX_AGE_HOURS', '24'))  # 브라우저 재시작 주기 (시간)
+BROWSER_MEMORY_LIMIT_MB = int(os.getenv('BROWSER_MEMORY_LIMIT_MB', '1200'))  # 브라우저 재시작 메모리 한도 (MB)
+STANDBY_WARMUP_RATIO = 0.8  # 한도의 이 비율에 도달하면 대기 컨텍스트를 미리 준비
+WATCHDOG_TIMEOUT = int(os.getenv('WATCHDOG_TIMEOUT', '120'))  # 조회 1회 제한 시간 (초, 초과 시 브라우저 강제 종료)
+
+# 적응형 조회 간격 설정 (과거 시간대별 입출차 빈도에 따라 조회 간격 조절)
+POLL_MIN_INTERVAL = int(os.getenv('POLL_MIN_INTERVAL', '15'))  # 최소 조회 간격 (초)
+POLL_MAX_INTERVAL = int(os.getenv('POLL_MAX_INTERVAL', '600'))  # 최대 조회 간격 (초)
+POLL_TARGET_EVENTS = 0.5  # 조회 1회당 예상 입출차 건수 목표 (작을수록 자주 조회)
+POLL_HISTORY_DAYS = 28  # 빈도 계산에 사용할 과거 기간 (일)
+POLL_ACTIVITY_BOOST = 4  # 입출차 감지 후 최소 간격으로 조회할 횟수
 
 # 날짜 형식
 DATE_FORMAT = '%Y-%m-%d'
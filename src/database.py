@@ -2,13 +2,111 @@
 데이터베이스 관리 모듈
 입출차 기록을 SQLite 데이터베이스에 저장하고 조회합니다.
 """
+import atexit
+import calendar
 import sqlite3
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import threading
+import weakref
+from functools import partial
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 import config
 from logger import database_logger
 
+# parking_records에 저장하는 입출차 기록 컬럼
+STORED_COLUMNS = (
+    'car_number', 'name', 'type', 'phone', 'entry_location', 'entry_time',
+    'exit_location', 'exit_time', 'status', 'note'
+)
+
+# 저장 시 입출차 시간에서 계산하는 정수 타임스탬프 컬럼
+TIMESTAMP_COLUMNS = ('entry_ts', 'exit_ts')
+
+# 미출차(주차 중) 조건 - 부분 인덱스 idx_open_sessions의 조건과 같은 식이어야 인덱스를 사용함
+OPEN_SESSION_CONDITION = "(exit_time IS NULL OR exit_time = '')"
+
+# 기록이 삭제되면 daily_stats에서 입출차 건수를 빼는 트리거 (건수가 모두 0이 된 집계 행은 삭제)
+# 보관 DB로 옮기는 기록은 통계에 남겨야 하므로 archive_old_records()에서는 삭제 전에 트리거를 없애고 다시 만듦
+DAILY_STATS_DELETE_TRIGGER = '''
+    CREATE TRIGGER IF NOT EXISTS trg_daily_stats_delete
+    AFTER DELETE ON parking_records
+    BEGIN
+        UPDATE daily_stats SET entries = entries - 1
+        WHERE date = COALESCE(date(OLD.entry_ts, 'unixepoch'), '')
+          AND location = COALESCE(OLD.entry_location, '') AND type = COALESCE(OLD.type, '');
+        
+        UPDATE daily_stats SET exits = exits - 1
+        WHERE OLD.exit_ts IS NOT NULL AND date = date(OLD.exit_ts, 'unixepoch')
+          AND location = COALESCE(OLD.exit_location, '') AND type = COALESCE(OLD.type, '');
+        
+        DELETE FROM daily_stats
+        WHERE entries = 0 AND exits = 0 AND type = COALESCE(OLD.type, '')
+          AND ((date = COALESCE(date(OLD.entry_ts, 'unixepoch'), '') AND location = COALESCE(OLD.entry_location, ''))
+               OR (date = date(OLD.exit_ts, 'unixepoch') AND location = COALESCE(OLD.exit_location, '')));
+    END
+'''
+
+# 사이트 시간 문자열 형식 (첫 번째가 사이트 표시 형식)
+TIME_FORMATS = (config.DATETIME_FORMAT, '%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M', '%Y-%m-%d %H:%M')
+
+
+def to_epoch(value: Optional[str]) -> Optional[int]:
+    """
+    사이트 시간 문자열을 정수 타임스탬프로 변환
+    
+    시간대 변환 없이 사이트 표시 시각을 UTC로 간주한 초 단위 값이므로,
+    SQLite에서 strftime(..., 'unixepoch')을 사용하면 표시 시각이 그대로 나옵니다.
+    
+    Args:
+        value: 시간 문자열 (예: "2026/01/05 09:57:08")
+    
+    Returns:
+        타임스탬프 (빈 값이거나 형식이 다르면 None)
+    """
+    if not value:
+        return None
+    
+    # 사이트 표시 형식(YYYY/MM/DD HH:MM:SS)은 strptime 없이 바로 변환 (저장 시 기록마다 호출됨)
+    value = value.strip()
+    if len(value) == 19 and value[4] == '/' and value[7] == '/' and value[13] == ':':
+        try:
+            return calendar.timegm((
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]), 0, 0, 0
+            ))
+        except ValueError:
+            pass
+    
+    for time_format in TIME_FORMATS:
+        try:
+            return calendar.timegm(datetime.strptime(value, time_format).timetuple())
+        except ValueError:
+            continue
+    return None
+
+
+def day_range(date: str) -> Tuple[int, int]:
+    """
+    날짜 하루의 타임스탬프 범위
+    
+    Args:
+        date: 날짜 (YYYY-MM-DD 또는 YYYY/MM/DD 형식)
+    
+    Returns:
+        (시작, 끝) - BETWEEN 조건용으로 끝 값 포함
+    """
+    start = calendar.timegm(datetime.strptime(date.replace('/', '-'), config.DATE_FORMAT).timetuple())
+    return start, start + 86399
+
+
+def _close_at_exit(db_ref: 'weakref.ref[ParkingDatabase]'):
+    """프로그램 종료 시 아직 열려 있는 데이터베이스 연결 종료 (이미 정리된 인스턴스는 무시)"""
+    db = db_ref()
+    if db is not None:
+        db.close()
+
 
 class ParkingDatabase:
     """입출차 기록 데이터베이스"""
@@ -19,12 +117,133 @@ class ParkingDatabase:
             db_path: 데이터베이스 파일 경로 (기본값: config.DATABASE_PATH)
         """
         self.db_path = db_path or config.DATABASE_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()  # 연결 하나를 여러 스레드가 공유하므로 한 번에 하나씩 사용
+        self._transaction_depth = 0
+        self._pending_changes: List[Dict[str, Any]] = []  # 커밋 전 변경 기록
+        self.committed_changes: List[Dict[str, Any]] = []  # 커밋된 새 기록 및 출차 반영 기록 (델타 로그에 기록 후 비움)
+        self._pending_metrics: Dict[str, int] = {}  # 아직 저장하지 않은 조회 지표 (flush_metrics에서 저장)
+        self.archive_dir = Path(self.db_path).parent / config.ARCHIVE_DIR_NAME
+        self.archive_prefix = f'{Path(self.db_path).stem}_'  # 연도별 보관 DB 파일 이름 (예: parking_records_2025.db)
+        self._archived_month: Optional[str] = None  # 보관 처리를 마지막으로 확인한 달 (YYYY-MM)
+        # 프로그램 종료 시 WAL 내용을 데이터베이스 파일에 반영 (GitHub Actions에서 파일을 커밋하기 전)
+        # 약한 참조로 등록하여 사용이 끝난 인스턴스가 종료 시까지 남지 않도록 함
+        self._close_at_exit = partial(_close_at_exit, weakref.ref(self))
         self._init_database()
+        self.archive_if_due()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        데이터베이스 연결 생성
+        
+        WAL 모드와 synchronous=NORMAL로 커밋마다 fsync하지 않도록 하고,
+        페이지 캐시와 메모리 맵 크기를 늘려 조회 시 디스크 읽기를 줄입니다.
+        트랜잭션은 transaction()에서 직접 시작하므로 자동 트랜잭션은 사용하지 않습니다.
+        
+        Returns:
+            설정이 적용된 연결
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=config.DB_BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=config.DB_STATEMENT_CACHE_SIZE,
+            uri=True  # 보관 DB를 읽기 전용(mode=ro)으로 연결하기 위해 사용
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={config.DB_BUSY_TIMEOUT_MS}')
+        conn.execute(f'PRAGMA cache_size=-{config.DB_CACHE_SIZE_KB}')
+        conn.execute(f'PRAGMA mmap_size={config.DB_MMAP_SIZE_MB * 1024 * 1024}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """
+        공유 연결 사용 (처음 사용할 때 연결하고 종료 전까지 유지)
+        
+        연결을 여는 동안에는 프로그램 종료 시 close()가 실행되도록 등록합니다.
+        
+        Yields:
+            데이터베이스 연결
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+                self._attach_archives(self._conn)
+                atexit.register(self._close_at_exit)
+            yield self._conn
+    
+    @contextmanager
+    def transaction(self):
+        """
+        트랜잭션 범위 지정 (정상 종료 시 커밋, 예외 발생 시 롤백)
+        
+        중첩하면 안쪽 범위는 세이브포인트가 되어 가장 바깥 범위에서 한 번만 커밋합니다.
+        여러 기록을 한 번의 커밋으로 저장할 때 사용합니다.
+        범위 안에서 저장한 변경 기록은 가장 바깥 범위가 커밋될 때 committed_changes로 옮겨집니다.
+        
+        Yields:
+            데이터베이스 연결
+        """
+        with self.connection() as conn:
+            depth = self._transaction_depth
+            pending_mark = len(self._pending_changes)
+            conn.execute('BEGIN' if depth == 0 else f'SAVEPOINT sp_{depth}')
+            self._transaction_depth += 1
+            try:
+                yield conn
+            except BaseException:
+                if depth == 0:
+                    conn.execute('ROLLBACK')
+                else:
+                    conn.execute(f'ROLLBACK TO sp_{depth}')
+                    conn.execute(f'RELEASE sp_{depth}')
+                del self._pending_changes[pending_mark:]
+                raise
+            else:
+                conn.execute('COMMIT' if depth == 0 else f'RELEASE sp_{depth}')
+                if depth == 0:
+                    self.committed_changes.extend(self._pending_changes)
+                    self._pending_changes.clear()
+            finally:
+                self._transaction_depth = depth
+    
+    def close(self):
+        """
+        연결 종료
+        
+        WAL 파일의 내용을 데이터베이스 파일에 반영하고 비우므로,
+        종료 후에는 데이터베이스 파일 하나만 복사하거나 커밋해도 됩니다.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            
+            atexit.unregister(self._close_at_exit)
+            self.flush_metrics()
+            try:
+                self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except sqlite3.Error as e:
+                database_logger.warning(f"WAL 체크포인트 실패: {str(e)}")
+            finally:
+                self._conn.close()
+                self._conn = None
+    
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료 (연결 종료)"""
+        self.close()
     
     def _init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
                 
                 # 입출차 기록 테이블 생성
@@ -57,13 +276,369 @@ class ParkingDatabase:
                     ON parking_records(entry_time)
                 ''')
                 
-                conn.commit()
+                # 조회 상태 (마지막 조회 결과 지문 등) 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS scrape_state (
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # 조회 지표 (누적 횟수) 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS poll_metrics (
+                        name TEXT PRIMARY KEY,
+                        value INTEGER NOT NULL DEFAULT 0
+                    )
+                ''')
+                
+                # 과거 데이터 수집(backfill) 진행 상황 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+                        chunk_start TEXT NOT NULL,
+                        chunk_end TEXT NOT NULL,
+                        record_count INTEGER NOT NULL,
+                        completed_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY(chunk_start, chunk_end)
+                    )
+                ''')
+                
+                self._migrate(conn)
+                
+                # 마이그레이션으로 바뀐 컬럼에 맞춰 조회용 뷰 다시 생성
+                self._attach_archives(conn)
+                
                 database_logger.success("데이터베이스 초기화 완료")
         
         except Exception as e:
             database_logger.error(f"데이터베이스 초기화 실패: {str(e)}")
             raise
     
+    def _migrate(self, conn: sqlite3.Connection):
+        """
+        스키마 버전(PRAGMA user_version)에 따라 아직 적용하지 않은 변경 적용
+        
+        Args:
+            conn: 초기화 트랜잭션 중인 연결
+        """
+        migrations = [
+            self._add_timestamp_columns, self._add_open_sessions_index, self._add_daily_stats,
+            self._add_daily_stats_delete_trigger,
+        ]
+        
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for target, migration in enumerate(migrations, start=1):
+            if version >= target:
+                continue
+            migration(conn)
+            conn.execute(f'PRAGMA user_version = {target}')
+            database_logger.info(f"데이터베이스 스키마 버전 {target} 적용 ({migration.__name__})")
+    
+    def _add_timestamp_columns(self, conn: sqlite3.Connection):
+        """스키마 버전 1: 입출차 시간 정수 타임스탬프 컬럼과 범위 인덱스 추가 (기존 기록 변환)"""
+        conn.execute('ALTER TABLE parking_records ADD COLUMN entry_ts INTEGER')
+        conn.execute('ALTER TABLE parking_records ADD COLUMN exit_ts INTEGER')
+        
+        rows = conn.execute('SELECT id, entry_time, exit_time FROM parking_records').fetchall()
+        conn.executemany(
+            'UPDATE parking_records SET entry_ts = ?, exit_ts = ? WHERE id = ?',
+            [(to_epoch(entry_time), to_epoch(exit_time), record_id) for record_id, entry_time, exit_time in rows]
+        )
+        
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_entry_ts ON parking_records(entry_ts)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_exit_ts ON parking_records(exit_ts)')
+    
+    def _add_open_sessions_index(self, conn: sqlite3.Connection):
+        """
+        스키마 버전 2: 미출차 기록만 담는 부분 인덱스 추가
+        
+        입차/출차 저장 시 SQLite가 인덱스를 함께 갱신하므로, 주차 중인 차량 조회와
+        미출차 건수 집계가 전체 기록 수가 아닌 주차 중인 차량 수에 비례합니다.
+        """
+        conn.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_open_sessions ON parking_records(entry_ts)
+            WHERE {OPEN_SESSION_CONDITION}
+        ''')
+    
+    def _add_daily_stats(self, conn: sqlite3.Connection):
+        """
+        스키마 버전 3: 날짜/위치/차량 구분별 입출차 건수 집계 테이블 추가 (기존 기록 집계)
+        
+        입차는 입차 날짜와 입차 위치, 출차는 출차 날짜와 출차 위치로 집계하며,
+        parking_records에 기록이 추가되거나 출차 시간이 생길 때 트리거가 같은 트랜잭션 안에서 갱신합니다.
+        날짜를 알 수 없는 입차는 빈 날짜('')로 집계합니다.
+        """
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                date TEXT NOT NULL,
+                location TEXT NOT NULL,
+                type TEXT NOT NULL,
+                entries INTEGER NOT NULL DEFAULT 0,
+                exits INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (date, location, type)
+            ) WITHOUT ROWID
+        ''')
+        
+        conn.execute('''
+            INSERT INTO daily_stats (date, location, type, entries, exits)
+            SELECT date, location, type, SUM(entries), SUM(exits) FROM (
+                SELECT COALESCE(date(entry_ts, 'unixepoch'), '') AS date,
+                       COALESCE(entry_location, '') AS location,
+                       COALESCE(type, '') AS type, 1 AS entries, 0 AS exits
+                FROM parking_records
+                UNION ALL
+                SELECT date(exit_ts, 'unixepoch'), COALESCE(exit_location, ''), COALESCE(type, ''), 0, 1
+                FROM parking_records
+                WHERE exit_ts IS NOT NULL
+            )
+            GROUP BY date, location, type
+        ''')
+        
+        # 새 기록 (출차까지 끝난 기록이 처음 저장되면 출차도 함께 집계)
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_daily_stats_insert
+            AFTER INSERT ON parking_records
+            BEGIN
+                INSERT INTO daily_stats (date, location, type, entries)
+                VALUES (COALESCE(date(NEW.entry_ts, 'unixepoch'), ''),
+                        COALESCE(NEW.entry_location, ''), COALESCE(NEW.type, ''), 1)
+                ON CONFLICT(date, location, type) DO UPDATE SET entries = entries + 1;
+                
+                INSERT INTO daily_stats (date, location, type, exits)
+                SELECT date(NEW.exit_ts, 'unixepoch'), COALESCE(NEW.exit_location, ''), COALESCE(NEW.type, ''), 1
+                WHERE NEW.exit_ts IS NOT NULL
+                ON CONFLICT(date, location, type) DO UPDATE SET exits = exits + 1;
+            END
+        ''')
+        
+        # 미출차 기록에 출차 정보 반영
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_daily_stats_exit
+            AFTER UPDATE OF exit_ts ON parking_records
+            WHEN OLD.exit_ts IS NULL AND NEW.exit_ts IS NOT NULL
+            BEGIN
+                INSERT INTO daily_stats (date, location, type, exits)
+                VALUES (date(NEW.exit_ts, 'unixepoch'), COALESCE(NEW.exit_location, ''), COALESCE(NEW.type, ''), 1)
+                ON CONFLICT(date, location, type) DO UPDATE SET exits = exits + 1;
+            END
+        ''')
+    
+    def _add_daily_stats_delete_trigger(self, conn: sqlite3.Connection):
+        """스키마 버전 4: 기록 삭제 시 daily_stats에서 입출차 건수를 빼는 트리거 추가"""
+        conn.execute(DAILY_STATS_DELETE_TRIGGER)
+    
+    def archive_paths(self) -> List[Path]:
+        """
+        보관 DB 파일 목록
+        
+        Returns:
+            연도순 보관 DB 파일 경로 리스트
+        """
+        return sorted(self.archive_dir.glob(f'{self.archive_prefix}[0-9][0-9][0-9][0-9].db'))
+    
+    def _attach_archives(self, conn: sqlite3.Connection):
+        """
+        보관 DB를 읽기 전용으로 연결하고 조회용 임시 뷰 생성
+        
+        archived_records는 보관 DB 기록 전체, all_records는 현재 DB와 보관 DB 기록 전체이며,
+        기록 조회는 all_records를 사용하여 보관 여부와 관계없이 같은 결과를 반환합니다.
+        연도별 파일이므로 연결 수가 SQLite 연결 한도(기본 10개)를 넘지 않습니다.
+        
+        Args:
+            conn: 데이터베이스 연결
+        """
+        columns = ', '.join(row[1] for row in conn.execute('PRAGMA main.table_info(parking_records)'))
+        if not columns:
+            return  # 테이블 생성 전 (초기화 후 다시 호출됨)
+        
+        attached = {row[1] for row in conn.execute('PRAGMA database_list')}
+        selects = []
+        for path in self.archive_paths():
+            schema = 'archive_' + path.stem[len(self.archive_prefix):]
+            if schema not in attached:
+                try:
+                    conn.execute(f'ATTACH DATABASE ? AS {schema}', (path.resolve().as_uri() + '?mode=ro',))
+                except sqlite3.Error as e:
+                    database_logger.error(f"보관 DB 연결 실패 ({path.name}): {str(e)}")
+                    continue
+            selects.append(f'SELECT {columns} FROM {schema}.parking_records')
+        
+        if not selects:
+            selects.append(f'SELECT {columns} FROM main.parking_records WHERE 0')
+        
+        conn.execute('DROP VIEW IF EXISTS temp.archived_records')
+        conn.execute('DROP VIEW IF EXISTS temp.all_records')
+        conn.execute(f"CREATE TEMP VIEW archived_records AS {' UNION ALL '.join(selects)}")
+        conn.execute(f'''
+            CREATE TEMP VIEW all_records AS
+            SELECT {columns} FROM main.parking_records
+            UNION ALL
+            SELECT {columns} FROM archived_records
+        ''')
+    
+    def archive_if_due(self) -> int:
+        """
+        달이 바뀐 뒤 처음 호출되면 지난 기록을 보관 DB로 이동
+        
+        프로그램 시작 시와 데몬 조회 사이에 호출하며, 이미 처리한 달이면 바로 반환합니다.
+        
+        Returns:
+            보관 DB로 이동한 기록 수
+        """
+        if not config.ARCHIVE_ENABLED:
+            return 0
+        
+        month = datetime.now().strftime('%Y-%m')
+        if self._archived_month == month:
+            return 0
+        
+        if self.get_state('archived_month') != month:
+            archived = self.archive_old_records()
+            if archived < 0:
+                return 0  # 실패 시 다음 호출에서 다시 시도
+            self.set_state('archived_month', month)
+        else:
+            archived = 0
+        
+        self._archived_month = month
+        return archived
+    
+    def archive_old_records(self) -> int:
+        """
+        이번 달 이전에 입차하여 출차까지 끝난 기록을 연도별 보관 DB로 이동
+        
+        보관 DB는 읽기 전용으로 두고, 현재 DB에는 이번 달 기록과 미출차 기록만 남겨
+        조회마다 쓰는 데이터베이스 파일을 작게 유지합니다.
+        올해 보관 DB에는 매달 지난달 기록을 추가만 하고, 파일 전체를 다시 쓰는 압축(VACUUM)은
+        해가 끝난 연도의 보관 DB에 기록을 추가할 때(1월에 지난해 12월 기록을 옮길 때) 한 번만 합니다.
+        daily_stats는 현재 DB에 그대로 남으므로 통계는 전체 기간 기준입니다.
+        보관 DB를 다시 연결해야 하므로 트랜잭션 밖에서 호출해야 합니다.
+        
+        Returns:
+            보관 DB로 이동한 기록 수 (실패 시 -1)
+        """
+        now = datetime.now()
+        boundary = calendar.timegm((now.year, now.month, 1, 0, 0, 0, 0, 0, 0))
+        condition = f"entry_ts < ? AND NOT {OPEN_SESSION_CONDITION} AND strftime('%Y', entry_ts, 'unixepoch') = ?"
+        
+        try:
+            with self.connection() as conn:
+                if self._transaction_depth:
+                    raise RuntimeError("트랜잭션 중에는 보관할 수 없습니다")
+                
+                years = [row[0] for row in conn.execute(f'''
+                    SELECT DISTINCT strftime('%Y', entry_ts, 'unixepoch') FROM parking_records
+                    WHERE entry_ts < ? AND NOT {OPEN_SESSION_CONDITION}
+                ''', (boundary,))]
+                if not years:
+                    return 0
+                
+                self.archive_dir.mkdir(parents=True, exist_ok=True)
+                columns = ', '.join(row[1] for row in conn.execute('PRAGMA main.table_info(parking_records)'))
+                table_sql = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'parking_records'"
+                ).fetchone()[0]
+                attached = {row[1] for row in conn.execute('PRAGMA database_list')}
+                
+                moved = 0
+                try:
+                    for year in years:
+                        path = self.archive_dir / f'{self.archive_prefix}{year}.db'
+                        
+                        # 읽기 전용으로 연결된 보관 DB는 해제 후 쓰기 모드로 다시 연결
+                        if f'archive_{year}' in attached:
+                            conn.execute(f'DETACH DATABASE archive_{year}')
+                        if path.exists():
+                            path.chmod(0o644)
+                        
+                        conn.execute('ATTACH DATABASE ? AS archive_write', (str(path),))
+                        try:
+                            conn.execute(table_sql.replace(
+                                'CREATE TABLE parking_records', 'CREATE TABLE IF NOT EXISTS archive_write.parking_records', 1
+                            ))
+                            conn.execute('CREATE INDEX IF NOT EXISTS archive_write.idx_entry_ts ON parking_records(entry_ts)')
+                            conn.execute('CREATE INDEX IF NOT EXISTS archive_write.idx_exit_ts ON parking_records(exit_ts)')
+                            
+                            # 보관 DB에 먼저 쓰고 현재 DB에서 삭제 (중간에 실패해도 기록이 사라지지 않음)
+                            # 옮긴 기록은 통계에 남도록 삭제하는 동안만 daily_stats 삭제 트리거 제거
+                            with self.transaction():
+                                conn.execute(f'''
+                                    INSERT OR IGNORE INTO archive_write.parking_records ({columns})
+                                    SELECT {columns} FROM main.parking_records WHERE {condition}
+                                ''', (boundary, year))
+                                conn.execute('DROP TRIGGER IF EXISTS main.trg_daily_stats_delete')
+                                moved += conn.execute(
+                                    f'DELETE FROM main.parking_records WHERE {condition}', (boundary, year)
+                                ).rowcount
+                                conn.execute(DAILY_STATS_DELETE_TRIGGER)
+                            
+                            # 끝난 연도의 보관 DB만 압축 (올해 보관 DB는 매달 추가되므로 압축하지 않음)
+                            if int(year) < now.year:
+                                conn.execute('VACUUM archive_write')
+                        finally:
+                            conn.execute('DETACH DATABASE archive_write')
+                        path.chmod(0o444)
+                    
+                    conn.execute('VACUUM main')
+                finally:
+                    self._attach_archives(conn)
+                
+                database_logger.success(
+                    f"{len(years)}개 연도의 지난 기록 {moved}건을 보관 DB로 이동",
+                    {'years': years, 'archive_dir': str(self.archive_dir)}
+                )
+                return moved
+        
+        except Exception as e:
+            database_logger.error(f"지난 기록 보관 실패: {str(e)}")
+            return -1
+    
+    def delete_archives(self) -> List[Path]:
+        """
+        보관 DB 파일 삭제 (연결을 닫아 보관 DB 연결을 해제한 후 삭제)
+        
+        Returns:
+            삭제한 보관 DB 파일 경로 리스트
+        """
+        with self._lock:
+            if self._transaction_depth:
+                raise RuntimeError("트랜잭션 중에는 보관 DB를 삭제할 수 없습니다")
+            
+            self.close()
+            paths = self.archive_paths()
+            for path in paths:
+                # 읽기 전용 파일이므로 쓰기 권한을 되돌린 후 삭제
+                path.chmod(0o644)
+                path.unlink()
+            return paths
+    
+    def clear_records(self) -> bool:
+        """
+        모든 입출차 기록 삭제 (보관 DB, 일별 통계, 조회 상태, 백필 진행 상황 포함)
+        
+        델타 로그의 초기화 스냅샷을 적용할 때 사용하며, 트랜잭션 밖에서 호출해야 합니다.
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            with self._lock:
+                with self.transaction() as conn:
+                    for table in ('parking_records', 'daily_stats', 'scrape_state', 'backfill_checkpoints'):
+                        conn.execute(f'DELETE FROM {table}')
+                self._pending_changes.clear()
+                self.committed_changes.clear()
+                self._archived_month = None
+                removed = self.delete_archives()
+            
+            database_logger.success(f"모든 기록 삭제 완료 (보관 DB {len(removed)}개 삭제)")
+            return True
+        
+        except Exception as e:
+            database_logger.error(f"기록 삭제 실패: {str(e)}")
+            return False
+    
     def insert_record(self, record: Dict[str, Any]) -> bool:
         """
         입출차 기록 추가
@@ -75,14 +650,14 @@ class ParkingDatabase:
             성공 여부
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
                     INSERT OR IGNORE INTO parking_records 
                     (car_number, name, type, phone, entry_location, entry_time, 
-                     exit_location, exit_time, status, note)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     exit_location, exit_time, status, note, entry_ts, exit_ts)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     record.get('car_number'),
                     record.get('name'),
@@ -93,12 +668,16 @@ class ParkingDatabase:
                     record.get('exit_location'),
                     record.get('exit_time'),
                     record.get('status'),
-                    record.get('note')
+                    record.get('note'),
+                    to_epoch(record.get('entry_time')),
+                    to_epoch(record.get('exit_time'))
                 ))
                 
-                conn.commit()
-                
                 if cursor.rowcount > 0:
+                    created_at = cursor.execute(
+                        'SELECT created_at FROM parking_records WHERE rowid = ?', (cursor.lastrowid,)
+                    ).fetchone()[0]
+                    self._pending_changes.append({**record, 'created_at': created_at})
                     database_logger.info(
                         f"새 기록 추가: {record.get('car_number')} - {record.get('entry_time')}",
                         {'record': record}
@@ -121,23 +700,172 @@ class ParkingDatabase:
         Returns:
             추가된 기록 수
         """
-        count = 0
-        for record in records:
-            if self.insert_record(record):
-                count += 1
+        return len(self.insert_new_records(records))
+    
+    def insert_new_records(self, records: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """
+        여러 입출차 기록을 한 번의 트랜잭션으로 저장하고 새로 추가된 기록의 키 반환
         
-        database_logger.info(f"총 {count}개의 새 기록 추가됨 (전체: {len(records)}개)")
-        return count
+        Args:
+            records: 입출차 기록 리스트
+        
+        Returns:
+            새로 추가된 (차량번호, 입차시간) 리스트 (입력 순서, 실패 시 빈 리스트)
+        """
+        new_entries, _ = self.upsert_records(records)
+        return [(record['car_number'], record['entry_time']) for record in new_entries]
+    
+    def upsert_records(self, records: List[Dict[str, Any]],
+                       track_changes: bool = True) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        여러 입출차 기록을 한 번의 트랜잭션으로 저장하고 새 입차와 새 출차 반환
+        
+        임시 테이블에 executemany로 한 번에 넣은 뒤 기존 기록과 비교하여 새 입차(새 키)와
+        새 출차(저장된 기록에 없던 출차 시간이 생긴 키)를 찾고, INSERT ... ON CONFLICT로
+        새 기록 추가와 출차 정보 반영을 한 번에 수행합니다.
+        
+        Args:
+            records: 입출차 기록 리스트 (created_at이 있으면 저장 시각으로 사용, 델타 로그 적용 시)
+            track_changes: 새 입차/출차 기록을 변경 기록(committed_changes)에 남길지 여부
+                (델타 로그를 적용할 때는 다시 기록하지 않음, 변경 기록에는 저장된 created_at 포함)
+        
+        Returns:
+            (새로운 입차 기록 리스트, 새로운 출차 기록 리스트) - 입력 기록 중 키별 첫 기록, 입력 순서
+            (실패 시 빈 리스트)
+        
+        Raises:
+            Exception: 바깥 트랜잭션 안에서 호출되었을 때 저장 실패 (바깥 범위의 다른 변경도 함께 롤백되도록 전달)
+        """
+        if not records:
+            return [], []
+        
+        # 타임스탬프는 저장할 때 한 번만 계산
+        columns = ', '.join(STORED_COLUMNS + TIMESTAMP_COLUMNS)
+        placeholders = ', '.join('?' * len(STORED_COLUMNS + TIMESTAMP_COLUMNS))
+        rows = [
+            tuple(record.get(column) for column in STORED_COLUMNS)
+            + (to_epoch(record.get('entry_time')), to_epoch(record.get('exit_time')), record.get('created_at'))
+            for record in records
+        ]
+        
+        try:
+            with self.transaction() as conn:
+                conn.execute(f'CREATE TEMP TABLE IF NOT EXISTS incoming_records ({columns}, created_at)')
+                conn.execute('DELETE FROM incoming_records')
+                conn.executemany(
+                    f'INSERT INTO incoming_records ({columns}, created_at) VALUES ({placeholders}, ?)', rows
+                )
+                
+                # 보관 DB로 옮긴 기록은 출차까지 끝난 기록이므로 다시 저장하지 않음
+                conn.execute('''
+                    DELETE FROM incoming_records
+                    WHERE EXISTS (
+                        SELECT 1 FROM archived_records AS archived
+                        WHERE archived.car_number = incoming_records.car_number
+                          AND archived.entry_time = incoming_records.entry_time
+                    )
+                ''')
+                
+                # 기존 기록에 없는 키 (같은 키가 여러 번 들어오면 처음 한 번만)
+                entry_keys = conn.execute('''
+                    SELECT car_number, entry_time FROM incoming_records AS incoming
+                    WHERE car_number <> '' AND entry_time <> ''
+                      AND NOT EXISTS (
+                          SELECT 1 FROM parking_records AS existing
+                          WHERE existing.car_number = incoming.car_number
+                            AND existing.entry_time = incoming.entry_time
+                      )
+                    GROUP BY car_number, entry_time
+                ''').fetchall()
+                
+                # 저장된 기록은 미출차인데 출차 시간이 생긴 키
+                exit_keys = conn.execute('''
+                    SELECT incoming.car_number, incoming.entry_time
+                    FROM incoming_records AS incoming
+                    JOIN parking_records AS existing
+                      ON existing.car_number = incoming.car_number
+                     AND existing.entry_time = incoming.entry_time
+                    WHERE incoming.exit_time <> ''
+                      AND (existing.exit_time IS NULL OR existing.exit_time = '')
+                    GROUP BY incoming.car_number, incoming.entry_time
+                ''').fetchall()
+                
+                # 새 기록 추가, 미출차 기록에는 출차 정보 반영 (저장 시각은 새 기록에만 기록)
+                conn.execute(f'''
+                    INSERT INTO parking_records ({columns}, created_at)
+                    SELECT {columns}, COALESCE(created_at, CURRENT_TIMESTAMP) FROM incoming_records
+                    WHERE car_number <> '' AND entry_time <> ''
+                    ORDER BY rowid
+                    ON CONFLICT(car_number, entry_time) DO UPDATE SET
+                        exit_location = excluded.exit_location,
+                        exit_time = excluded.exit_time,
+                        exit_ts = excluded.exit_ts,
+                        status = excluded.status,
+                        note = excluded.note
+                    WHERE excluded.exit_time <> ''
+                      AND (parking_records.exit_time IS NULL OR parking_records.exit_time = '')
+                ''')
+                
+                new_entries = self._pick_records(records, set(entry_keys))
+                new_exits = self._pick_records(records, set(exit_keys))
+                if track_changes and (new_entries or new_exits):
+                    # 델타 로그로 다시 만들어도 저장 순서(get_recent_records)가 유지되도록 저장 시각 포함
+                    created = {
+                        (car_number, entry_time): created_at
+                        for car_number, entry_time, created_at in conn.execute('''
+                            SELECT existing.car_number, existing.entry_time, existing.created_at
+                            FROM parking_records AS existing
+                            JOIN incoming_records AS incoming
+                              ON incoming.car_number = existing.car_number
+                             AND incoming.entry_time = existing.entry_time
+                        ''')
+                    }
+                    self._pending_changes.extend(
+                        {**record, 'created_at': created.get((record['car_number'], record['entry_time']))}
+                        for record in new_entries + new_exits
+                    )
+                conn.execute('DELETE FROM incoming_records')
+        
+        except Exception as e:
+            database_logger.error(f"기록 일괄 저장 실패: {str(e)}", {'count': len(records)})
+            if self._transaction_depth:
+                raise
+            return [], []
+        
+        database_logger.info(
+            f"총 {len(new_entries)}개의 새 기록 추가, {len(new_exits)}개의 출차 정보 반영 (전체: {len(records)}개)",
+            {
+                'new_keys': [f"{record['car_number']}|{record['entry_time']}" for record in new_entries],
+                'exit_keys': [f"{record['car_number']}|{record['entry_time']}" for record in new_exits]
+            }
+        )
+        return new_entries, new_exits
+    
+    @staticmethod
+    def _pick_records(records: List[Dict[str, Any]], keys: Set[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        키에 해당하는 입력 기록 선택 (키별 첫 기록, 입력 순서 유지)
+        
+        Returns:
+            선택된 기록 리스트
+        """
+        picked = []
+        for record in records:
+            key = (record.get('car_number'), record.get('entry_time'))
+            if key in keys:
+                picked.append(record)
+                keys.discard(key)
+        return picked
     
     def get_all_records(self) -> List[Dict[str, Any]]:
         """모든 입출차 기록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 
                 cursor.execute('''
-                    SELECT * FROM parking_records 
+                    SELECT * FROM all_records 
                     ORDER BY entry_time DESC
                 ''')
                 
@@ -159,15 +887,15 @@ class ParkingDatabase:
             입출차 기록 리스트
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 
                 cursor.execute('''
-                    SELECT * FROM parking_records 
-                    WHERE entry_time LIKE ?
-                    ORDER BY entry_time DESC
-                ''', (f'{date}%',))
+                    SELECT * FROM all_records 
+                    WHERE entry_ts BETWEEN ? AND ?
+                    ORDER BY entry_ts DESC
+                ''', day_range(date))
                 
                 records = [dict(row) for row in cursor.fetchall()]
                 return records
@@ -187,9 +915,9 @@ class ParkingDatabase:
             입출차 기록 리스트
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 
                 cursor.execute('''
                     SELECT * FROM parking_records 
@@ -204,6 +932,32 @@ class ParkingDatabase:
             database_logger.error(f"최근 기록 조회 실패: {str(e)}")
             return []
     
+    def get_open_sessions(self) -> List[Dict[str, Any]]:
+        """
+        현재 주차 중인(미출차) 기록 조회
+        
+        부분 인덱스 idx_open_sessions만 읽으므로 전체 기록 수와 관계없이 주차 중인 차량 수에 비례합니다.
+        
+        Returns:
+            미출차 기록 리스트 (입차 시간 순)
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
+                
+                cursor.execute(f'''
+                    SELECT * FROM parking_records
+                    WHERE {OPEN_SESSION_CONDITION}
+                    ORDER BY entry_ts
+                ''')
+                
+                return [dict(row) for row in cursor.fetchall()]
+        
+        except Exception as e:
+            database_logger.error(f"주차 중인 기록 조회 실패: {str(e)}")
+            return []
+    
     def record_exists(self, car_number: str, entry_time: str) -> bool:
         """
         기록 존재 여부 확인
@@ -216,11 +970,11 @@ class ParkingDatabase:
             존재 여부
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    SELECT COUNT(*) FROM parking_records 
+                    SELECT COUNT(*) FROM all_records 
                     WHERE car_number = ? AND entry_time = ?
                 ''', (car_number, entry_time))
                 
@@ -243,12 +997,12 @@ class ParkingDatabase:
             입출차 기록 리스트
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 
                 cursor.execute('''
-                    SELECT * FROM parking_records 
+                    SELECT * FROM all_records 
                     WHERE car_number = ? AND entry_time = ?
                 ''', (car_number, entry_time))
                 
@@ -259,34 +1013,283 @@ class ParkingDatabase:
             database_logger.error(f"기록 조회 실패: {str(e)}")
             return []
     
+    def get_incremental_state(self, since_date: str) -> Dict[str, Any]:
+        """
+        증분 조회 기준 조회
+        
+        Args:
+            since_date: 조회 시작 날짜 (YYYY-MM-DD 형식)
+        
+        Returns:
+            {'high_water': 조회 시작 날짜 이후 가장 최근 입차 시간,
+             'open_keys': 미출차 (차량번호, 입차시간) 리스트 - 전날 이전에 입차하여 오늘 출차하는 차량도
+             찾을 수 있도록 입차 날짜와 관계없이 전체 (미출차 부분 인덱스로 조회)}
+        """
+        try:
+            since, _ = day_range(since_date)
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT entry_time FROM all_records 
+                    WHERE entry_ts >= ?
+                    ORDER BY entry_ts DESC
+                    LIMIT 1
+                ''', (since,))
+                row = cursor.fetchone()
+                high_water = row[0] if row else None
+                
+                cursor.execute(f'''
+                    SELECT car_number, entry_time FROM parking_records 
+                    WHERE {OPEN_SESSION_CONDITION}
+                ''')
+                open_keys = cursor.fetchall()
+                
+                return {'high_water': high_water, 'open_keys': open_keys}
+        
+        except Exception as e:
+            database_logger.error(f"증분 조회 기준 조회 실패: {str(e)}")
+            return {'high_water': None, 'open_keys': []}
+    
+    def get_activity_histogram(self, days: int = 28) -> Dict[Tuple[int, int], int]:
+        """
+        최근 N일간 요일/시간대별 입출차 건수
+        
+        Args:
+            days: 집계할 기간 (일)
+        
+        Returns:
+            {(요일 - 0: 일요일 ~ 6: 토요일, 시): 입차 및 출차 건수}
+        """
+        try:
+            since = calendar.timegm((datetime.now() - timedelta(days=days)).timetuple())
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT CAST(strftime('%w', event_ts, 'unixepoch') AS INTEGER),
+                           CAST(strftime('%H', event_ts, 'unixepoch') AS INTEGER),
+                           COUNT(*)
+                    FROM (
+                        SELECT entry_ts AS event_ts FROM all_records WHERE entry_ts >= ?
+                        UNION ALL
+                        SELECT exit_ts AS event_ts FROM all_records WHERE exit_ts >= ?
+                    )
+                    GROUP BY 1, 2
+                ''', (since, since))
+                return {(weekday, hour): count for weekday, hour, count in cursor.fetchall()
+                        if weekday is not None and hour is not None}
+        
+        except Exception as e:
+            database_logger.error(f"시간대별 입출차 건수 조회 실패: {str(e)}")
+            return {}
+    
+    def get_state(self, key: str) -> Optional[str]:
+        """
+        조회 상태 값 조회
+        
+        Args:
+            key: 상태 키
+        
+        Returns:
+            저장된 값 (없으면 None)
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT value FROM scrape_state WHERE key = ?', (key,))
+                row = cursor.fetchone()
+                return row[0] if row else None
+        
+        except Exception as e:
+            database_logger.error(f"조회 상태 조회 실패: {str(e)}")
+            return None
+    
+    def set_state(self, key: str, value: str) -> bool:
+        """
+        조회 상태 값 저장
+        
+        Args:
+            key: 상태 키
+            value: 저장할 값
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO scrape_state (key, value, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                ''', (key, value))
+                return True
+        
+        except Exception as e:
+            database_logger.error(f"조회 상태 저장 실패: {str(e)}")
+            return False
+    
+    def increment_metric(self, name: str, amount: int = 1):
+        """
+        조회 지표 누적 (메모리에만 누적하고 flush_metrics 또는 연결 종료 시 저장)
+        
+        변경 없는 조회마다 데이터베이스에 쓰지 않도록 저장을 미룹니다.
+        
+        Args:
+            name: 지표 이름 (polls, fingerprint_skips 등)
+            amount: 증가량
+        """
+        with self._lock:
+            self._pending_metrics[name] = self._pending_metrics.get(name, 0) + amount
+    
+    def flush_metrics(self) -> bool:
+        """
+        메모리에 누적된 조회 지표 저장
+        
+        Returns:
+            성공 여부 (저장할 지표가 없으면 True)
+        """
+        with self._lock:
+            if not self._pending_metrics:
+                return True
+            
+            try:
+                with self.transaction() as conn:
+                    conn.executemany('''
+                        INSERT INTO poll_metrics (name, value) VALUES (?, ?)
+                        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+                    ''', list(self._pending_metrics.items()))
+                self._pending_metrics.clear()
+                return True
+            
+            except Exception as e:
+                database_logger.error(f"조회 지표 기록 실패: {str(e)}")
+                return False
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        조회 지표 전체 조회
+        
+        Returns:
+            {지표 이름: 누적 값} (아직 저장하지 않은 값 포함)
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT name, value FROM poll_metrics')
+                metrics = dict(cursor.fetchall())
+                for name, amount in self._pending_metrics.items():
+                    metrics[name] = metrics.get(name, 0) + amount
+                return metrics
+        
+        except Exception as e:
+            database_logger.error(f"조회 지표 조회 실패: {str(e)}")
+            return {}
+    
+    def get_completed_backfill_chunks(self) -> Set[Tuple[str, str]]:
+        """
+        완료된 과거 데이터 수집 구간 조회
+        
+        Returns:
+            완료된 (시작 날짜, 종료 날짜) 집합
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT chunk_start, chunk_end FROM backfill_checkpoints')
+                return set(cursor.fetchall())
+        
+        except Exception as e:
+            database_logger.error(f"수집 진행 상황 조회 실패: {str(e)}")
+            return set()
+    
+    def mark_backfill_chunk_completed(self, chunk_start: str, chunk_end: str, record_count: int) -> bool:
+        """
+        과거 데이터 수집 구간 완료 기록
+        
+        Args:
+            chunk_start: 구간 시작 날짜 (YYYY-MM-DD)
+            chunk_end: 구간 종료 날짜 (YYYY-MM-DD)
+            record_count: 구간에서 조회된 기록 수
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO backfill_checkpoints 
+                    (chunk_start, chunk_end, record_count)
+                    VALUES (?, ?, ?)
+                ''', (chunk_start, chunk_end, record_count))
+                return True
+        
+        except Exception as e:
+            database_logger.error(f"수집 진행 상황 기록 실패: {str(e)}")
+            return False
+    
+    def get_daily_stats(self, start_date: str, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        기간 내 날짜/위치/차량 구분별 입출차 건수 조회 (daily_stats 집계 테이블)
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 기본값: 시작 날짜)
+        
+        Returns:
+            {'date', 'location', 'type', 'entries', 'exits'} 리스트 (날짜, 위치, 차량 구분 순)
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
+                
+                cursor.execute('''
+                    SELECT date, location, type, entries, exits FROM daily_stats
+                    WHERE date BETWEEN ? AND ?
+                    ORDER BY date, location, type
+                ''', (start_date, end_date or start_date))
+                
+                return [dict(row) for row in cursor.fetchall()]
+        
+        except Exception as e:
+            database_logger.error(f"일별 통계 조회 실패: {str(e)}")
+            return []
+    
     def get_statistics(self) -> Dict[str, Any]:
-        """데이터베이스 통계 정보"""
+        """
+        데이터베이스 통계 정보
+        
+        전체/오늘 건수는 daily_stats 집계 테이블, 미출차 건수는 미출차 부분 인덱스에서 읽으므로
+        전체 기록 수와 관계없이 일정한 시간에 조회됩니다.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
-                # 전체 기록 수
-                cursor.execute('SELECT COUNT(*) FROM parking_records')
+                # 전체 기록 수 (입차 건수 합계)
+                cursor.execute('SELECT COALESCE(SUM(entries), 0) FROM daily_stats')
                 total_count = cursor.fetchone()[0]
                 
-                # 오늘 입차 기록 수
-                today = datetime.now().strftime('%Y/%m/%d')
+                # 오늘 입차/출차 기록 수
+                today = datetime.now().strftime(config.DATE_FORMAT)
                 cursor.execute('''
-                    SELECT COUNT(*) FROM parking_records 
-                    WHERE entry_time LIKE ?
-                ''', (f'{today}%',))
-                today_count = cursor.fetchone()[0]
+                    SELECT COALESCE(SUM(entries), 0), COALESCE(SUM(exits), 0) FROM daily_stats 
+                    WHERE date = ?
+                ''', (today,))
+                today_count, today_exit_count = cursor.fetchone()
                 
                 # 미출차 기록 수
-                cursor.execute('''
+                cursor.execute(f'''
                     SELECT COUNT(*) FROM parking_records 
-                    WHERE exit_time IS NULL OR exit_time = ''
+                    WHERE {OPEN_SESSION_CONDITION}
                 ''')
                 not_exited_count = cursor.fetchone()[0]
                 
                 stats = {
                     'total_records': total_count,
                     'today_records': today_count,
+                    'today_exits': today_exit_count,
                     'not_exited': not_exited_count
                 }
                 
@@ -0,0 +1,331 @@
+"""
+변경 기록(델타 로그) 모듈
+실행마다 데이터베이스 파일 전체를 커밋하는 대신, 이번 실행에서 새로 추가되거나 출차 정보가 반영된
+기록만 data/deltas/에 작은 변경 파일(세그먼트)로 남깁니다.
+
+데이터베이스는 마지막 스냅샷과 이후 세그먼트를 순서대로 적용하여 다시 만들거나,
+마지막으로 적용한 파일 이후의 세그먼트만 적용하여 최신 상태로 따라잡습니다 (sync).
+스냅샷 이후 세그먼트가 DELTA_COMPACT_SEGMENTS개 쌓이면 전체 기록을 스냅샷 하나로 압축하고
+이전 파일을 삭제합니다.
+
+파일 이름은 생성 시각(UTC)으로 시작하므로 이름순이 적용 순서입니다.
+시간대가 다른 환경(GitHub Actions와 로컬 실행 등)에서 만든 파일도 같은 기준으로 정렬되며,
+시계가 뒤처져도 새 파일 이름은 항상 기존 파일보다 뒤에 오도록 정합니다.
+    20261018T060512123456-delta.jsonl       세그먼트 (첫 줄: 컬럼 목록, 이후 한 줄에 기록 하나,
+                                            저장 시각(created_at) 포함)
+    20261018T000000000000-snapshot.jsonl.gz 스냅샷 (세그먼트와 같은 형식, gzip 압축,
+                                            첫 줄에 스냅샷에 포함된 마지막 변경 파일 이름 기록)
+
+데이터베이스를 초기화하면(reset) 이전 변경 파일을 모두 지우고 초기화 표시가 있는 빈 스냅샷을 남기므로,
+이전 기록이 남아 있는 다른 환경(GitHub Actions 캐시 등)의 데이터베이스도 sync에서 함께 비워집니다.
+
+사용 예:
+    python delta_log.py sync
+    python delta_log.py compact
+    python delta_log.py status
+"""
+import os
+import sys
+import gzip
+import json
+import argparse
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+import config
+from database import ParkingDatabase, STORED_COLUMNS
+from logger import database_logger
+
+# 변경 파일에 기록하는 컬럼 (저장 시각이 없는 이전 형식 파일은 적용 시각으로 저장됨)
+DELTA_COLUMNS = STORED_COLUMNS + ('created_at',)
+
+# 파일 이름 앞부분의 생성 시각 형식 (UTC, 마이크로초까지)
+NAME_TIME_FORMAT = '%Y%m%dT%H%M%S%f'
+NAME_TIME_LENGTH = 21
+
+SEGMENT_SUFFIX = '-delta.jsonl'
+SNAPSHOT_SUFFIX = '-snapshot.jsonl.gz'
+
+# 데이터베이스에 마지막으로 반영된 변경 파일 이름 저장 키
+POSITION_STATE_KEY = 'delta_position'
+
+# 적용 시 한 번에 저장할 기록 수
+APPLY_BATCH_SIZE = 5000
+
+
+def write_delta_file(path: Path, records: List[Dict[str, Any]], covers: Optional[str] = None,
+                     reset: bool = False):
+    """
+    변경 파일 저장 (임시 파일에 쓴 후 이름을 바꿔 중간에 실패해도 불완전한 파일이 남지 않음)
+    
+    Args:
+        path: 저장 경로 (스냅샷이면 gzip 압축)
+        records: 입출차 기록 리스트
+        covers: 스냅샷에 포함된 마지막 변경 파일 이름 (스냅샷만 사용)
+        reset: 적용 전에 데이터베이스를 비워야 하는 초기화 스냅샷 여부
+    """
+    temp_path = path.with_name(path.name + '.tmp')
+    opener = gzip.open if path.name.endswith(SNAPSHOT_SUFFIX) else open
+    with opener(temp_path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'columns': DELTA_COLUMNS, 'covers': covers, 'reset': reset}) + '\n')
+        for record in records:
+            f.write(json.dumps([record.get(column) for column in DELTA_COLUMNS],
+                               ensure_ascii=False, separators=(',', ':')) + '\n')
+    os.replace(temp_path, path)
+
+
+def read_delta_file(path: Path) -> List[Dict[str, Any]]:
+    """
+    변경 파일 읽기
+    
+    Args:
+        path: 세그먼트 또는 스냅샷 경로
+    
+    Returns:
+        입출차 기록 리스트 (파일에 기록된 순서)
+    """
+    opener = gzip.open if path.name.endswith(SNAPSHOT_SUFFIX) else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        columns = json.loads(f.readline())['columns']
+        return [dict(zip(columns, json.loads(line))) for line in f if line.strip()]
+
+
+def read_delta_header(path: Path) -> Dict[str, Any]:
+    """
+    변경 파일 첫 줄(컬럼 목록 등) 읽기
+    
+    Returns:
+        {'columns', 'covers', 'reset'} (이전 형식 파일에는 reset 없음)
+    """
+    opener = gzip.open if path.name.endswith(SNAPSHOT_SUFFIX) else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return json.loads(f.readline())
+
+
+class DeltaLog:
+    """데이터베이스 변경 기록 관리"""
+    
+    def __init__(self, db: ParkingDatabase, deltas_dir: Path = config.DELTAS_DIR):
+        """
+        Args:
+            db: 데이터베이스 인스턴스
+            deltas_dir: 변경 파일 저장 위치
+        """
+        self.db = db
+        self.deltas_dir = Path(deltas_dir)
+    
+    def list_files(self) -> List[Path]:
+        """
+        변경 파일 목록
+        
+        Returns:
+            세그먼트와 스냅샷 경로 리스트 (적용 순서)
+        """
+        if not self.deltas_dir.exists():
+            return []
+        files = list(self.deltas_dir.glob(f'*{SEGMENT_SUFFIX}')) + list(self.deltas_dir.glob(f'*{SNAPSHOT_SUFFIX}'))
+        return sorted(files, key=lambda path: path.name)
+    
+    def _new_path(self, suffix: str) -> Path:
+        """
+        생성 시각(UTC)으로 시작하는 새 변경 파일 경로
+        
+        마지막 변경 파일보다 이르면(시계 차이, 이전 형식의 지역 시각 이름) 그 직후 시각을 사용하여
+        새 파일이 항상 마지막에 적용되도록 합니다.
+        """
+        self.deltas_dir.mkdir(parents=True, exist_ok=True)
+        created = datetime.now(timezone.utc).replace(tzinfo=None)
+        files = self.list_files()
+        if files:
+            last = datetime.strptime(files[-1].name[:NAME_TIME_LENGTH], NAME_TIME_FORMAT)
+            created = max(created, last + timedelta(microseconds=1))
+        return self.deltas_dir / f"{created.strftime(NAME_TIME_FORMAT)}{suffix}"
+    
+    def _is_up_to_date(self) -> bool:
+        """데이터베이스에 모든 변경 파일이 반영되었는지 여부"""
+        files = self.list_files()
+        return not files or (self.db.get_state(POSITION_STATE_KEY) or '') >= files[-1].name
+    
+    def sync(self) -> int:
+        """
+        아직 반영하지 않은 변경 파일을 데이터베이스에 적용
+        
+        마지막 스냅샷에 데이터베이스에 없는 변경이 포함되어 있으면 스냅샷부터, 아니면 반영된 위치 이후의
+        세그먼트만 적용합니다 (빈 데이터베이스는 스냅샷부터 다시 만들어짐).
+        초기화 스냅샷을 적용할 때는 먼저 데이터베이스의 모든 기록을 삭제합니다.
+        같은 기록을 다시 적용해도 결과가 같으므로 중간에 중단되어도 다시 실행하면 됩니다.
+        
+        Returns:
+            적용한 기록 수
+        """
+        position = self.db.get_state(POSITION_STATE_KEY) or ''
+        files = self.list_files()
+        snapshots = [path for path in files if path.name.endswith(SNAPSHOT_SUFFIX)]
+        
+        if snapshots and snapshots[-1].name > position:
+            # 스냅샷이 포함한 변경을 이미 모두 반영했으면 스냅샷은 건너뜀
+            snapshot = snapshots[-1].name
+            header = read_delta_header(snapshots[-1])
+            covers = header.get('covers')
+            if covers and position >= covers:
+                self.db.set_state(POSITION_STATE_KEY, snapshot)
+                pending = [path for path in files if path.name > snapshot]
+            else:
+                pending = [path for path in files if path.name >= snapshot]
+                if header.get('reset') and not self.db.clear_records():
+                    return 0  # 삭제 실패 시 다음 sync에서 다시 시도
+        else:
+            pending = [path for path in files if path.name > position]
+        
+        if not pending:
+            return 0
+        
+        applied = 0
+        for path in pending:
+            records = read_delta_file(path)
+            with self.db.transaction():
+                for start in range(0, len(records), APPLY_BATCH_SIZE):
+                    self.db.upsert_records(records[start:start + APPLY_BATCH_SIZE], track_changes=False)
+                self.db.set_state(POSITION_STATE_KEY, path.name)
+            applied += len(records)
+        
+        database_logger.success(
+            f"변경 파일 {len(pending)}개 적용 완료 (기록 {applied}건)",
+            {'from': pending[0].name, 'to': pending[-1].name}
+        )
+        
+        # 스냅샷에서 다시 만든 경우 지난 기록을 보관 DB로 이동
+        if config.ARCHIVE_ENABLED:
+            self.db.archive_old_records()
+        return applied
+    
+    def flush(self) -> Optional[Path]:
+        """
+        이번 실행에서 커밋된 변경 기록을 세그먼트로 저장
+        
+        Returns:
+            저장한 세그먼트 경로 (변경이 없으면 None)
+        """
+        changes = self.db.committed_changes
+        if not changes:
+            return None
+        
+        # 반영하지 않은 변경 파일이 있으면 위치를 옮기지 않음 (다음 sync에서 함께 적용)
+        up_to_date = self._is_up_to_date()
+        path = self._new_path(SEGMENT_SUFFIX)
+        write_delta_file(path, changes)
+        if up_to_date:
+            self.db.set_state(POSITION_STATE_KEY, path.name)
+        
+        database_logger.info(f"변경 기록 {len(changes)}건 저장: {path.name}")
+        changes.clear()
+        return path
+    
+    def compact(self) -> Optional[Path]:
+        """
+        데이터베이스 전체 기록(보관 DB 포함)을 스냅샷으로 저장하고 이전 변경 파일 삭제
+        
+        Returns:
+            저장한 스냅샷 경로 (실패 시 None)
+        """
+        try:
+            # 스냅샷에 빠지는 기록이 없도록 먼저 모든 변경 파일 적용
+            self.sync()
+            
+            columns = ', '.join(DELTA_COLUMNS)
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = lambda cursor, row: dict(zip(DELTA_COLUMNS, row))
+                cursor.execute(f'SELECT {columns} FROM all_records ORDER BY entry_ts, id')
+                records = cursor.fetchall()
+            
+            # 초기화 표시는 이어받음 (초기화 스냅샷이 삭제되어도 이전 기록이 남은 데이터베이스가 비워지도록)
+            files = self.list_files()
+            reset = any(read_delta_header(old_path).get('reset') for old_path in files
+                        if old_path.name.endswith(SNAPSHOT_SUFFIX))
+            path = self._new_path(SNAPSHOT_SUFFIX)
+            write_delta_file(path, records, covers=files[-1].name if files else None, reset=reset)
+            self.db.set_state(POSITION_STATE_KEY, path.name)
+            
+            removed = 0
+            for old_path in self.list_files():
+                if old_path.name < path.name:
+                    old_path.unlink()
+                    removed += 1
+            
+            database_logger.success(f"스냅샷 저장 완료: {path.name} (기록 {len(records)}건, 이전 파일 {removed}개 삭제)")
+            return path
+        
+        except Exception as e:
+            database_logger.error(f"스냅샷 저장 실패: {str(e)}")
+            return None
+    
+    def reset(self) -> Path:
+        """
+        모든 변경 파일을 삭제하고 초기화 스냅샷(기록 없음) 저장
+        
+        데이터베이스를 초기화한 후 호출하며, 이 스냅샷을 적용하는 다른 환경의 데이터베이스도 비워집니다.
+        
+        Returns:
+            저장한 초기화 스냅샷 경로
+        """
+        # 이전 파일까지 반영한 데이터베이스도 초기화 스냅샷을 적용하도록 삭제 전에 이름을 정함
+        path = self._new_path(SNAPSHOT_SUFFIX)
+        for old_path in self.list_files():
+            old_path.unlink()
+        
+        write_delta_file(path, [], reset=True)
+        self.db.set_state(POSITION_STATE_KEY, path.name)
+        self.db.committed_changes.clear()
+        
+        database_logger.success(f"변경 파일 초기화 완료: {path.name}")
+        return path
+    
+    def compact_if_due(self) -> Optional[Path]:
+        """
+        마지막 스냅샷 이후 세그먼트가 DELTA_COMPACT_SEGMENTS개 이상이면 스냅샷으로 압축
+        
+        Returns:
+            저장한 스냅샷 경로 (압축하지 않았으면 None)
+        """
+        segments = 0
+        for path in reversed(self.list_files()):
+            if path.name.endswith(SNAPSHOT_SUFFIX):
+                break
+            segments += 1
+        
+        if segments < config.DELTA_COMPACT_SEGMENTS:
+            return None
+        return self.compact()
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='변경 기록(델타 로그) 관리')
+    parser.add_argument('command', choices=['sync', 'compact', 'status'],
+                        help='sync: 변경 파일을 데이터베이스에 적용, compact: 스냅샷으로 압축, status: 상태 확인')
+    args = parser.parse_args()
+    
+    db = ParkingDatabase()
+    delta_log = DeltaLog(db)
+    try:
+        if args.command == 'sync':
+            delta_log.sync()
+            return 0
+        
+        if args.command == 'compact':
+            return 0 if delta_log.compact() else 1
+        
+        files = delta_log.list_files()
+        snapshots = [path for path in files if path.name.endswith(SNAPSHOT_SUFFIX)]
+        print(f"변경 파일 위치: {delta_log.deltas_dir}")
+        print(f"  스냅샷: {snapshots[-1].name if snapshots else '없음'}")
+        print(f"  세그먼트: {len(files) - len(snapshots)}개 (전체 크기 {sum(path.stat().st_size for path in files)} bytes)")
+        print(f"  데이터베이스 반영 위치: {db.get_state(POSITION_STATE_KEY) or '없음'}")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
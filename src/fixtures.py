@@ -0,0 +1,87 @@
+"""
+스크래퍼 녹화/재생 모듈
+실제 사이트의 로그인, 포인트, 입출차 조회 응답을 HAR 파일로 녹화하고,
+Playwright 라우팅으로 재생하여 네트워크 없이 스크래퍼를 실행합니다.
+
+녹화 파일에는 실제 로그인 정보가 남지 않도록 아이디와 비밀번호를
+FIXTURE_USER_ID, FIXTURE_PASSWORD로 바꾸어 저장하고, 재생 시 같은 값으로 로그인합니다.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import quote, quote_plus
+import config
+
+# 녹화 파일에 저장되는 로그인 정보 (재생 시 로그인에 사용)
+FIXTURE_USER_ID = 'fixture_user'
+FIXTURE_PASSWORD = 'fixture_password'
+
+
+def fixture_paths(name: Optional[str] = None) -> Tuple[Path, Path]:
+    """
+    녹화 파일 경로
+    
+    Args:
+        name: 녹화 이름 (기본값: config.FIXTURE_NAME)
+    
+    Returns:
+        (HAR 파일 경로, 녹화 정보 파일 경로)
+    """
+    name = name or config.FIXTURE_NAME
+    return config.FIXTURES_DIR / f'{name}.har', config.FIXTURES_DIR / f'{name}.json'
+
+
+def save_fixture_meta(meta_path: Path, search_dates: Optional[Tuple[str, str]]):
+    """
+    녹화 정보 저장 (재생 시 같은 조회 기간으로 검색해야 녹화된 응답과 일치)
+    
+    Args:
+        meta_path: 녹화 정보 파일 경로
+        search_dates: 녹화 중 검색한 (시작 날짜, 종료 날짜)
+    """
+    meta = {
+        'recorded_at': datetime.now().strftime(config.DATETIME_FORMAT),
+        'parking_url': config.PARKING_URL,
+        'search_dates': list(search_dates) if search_dates else None
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+def load_fixture_meta(meta_path: Path) -> Dict[str, Any]:
+    """
+    녹화 정보 불러오기
+    
+    Returns:
+        녹화 정보 딕셔너리 (파일이 없으면 빈 딕셔너리)
+    """
+    if not meta_path.exists():
+        return {}
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def scrub_credentials(har_path: Path):
+    """
+    녹화된 HAR 파일에서 실제 로그인 정보를 녹화용 값으로 치환
+    
+    Args:
+        har_path: HAR 파일 경로
+    """
+    replacements = []
+    for secret, placeholder in ((config.PARKING_PASSWORD, FIXTURE_PASSWORD), (config.PARKING_USER_ID, FIXTURE_USER_ID)):
+        if not secret:
+            continue
+        # 폼 전송 본문은 URL 인코딩되어 있으므로 인코딩된 값도 치환
+        for encode in (str, quote, quote_plus):
+            replacements.append((encode(secret), encode(placeholder)))
+    
+    with open(har_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    for secret, placeholder in replacements:
+        content = content.replace(secret, placeholder)
+    
+    with open(har_path, 'w', encoding='utf-8') as f:
+        f.write(content)
@@ -0,0 +1,249 @@
+"""
+입출차 조회 HTTP 클라이언트 모듈
+로그인 세션을 공유하는 HTTP 세션으로 검색 폼을 전송하고,
+여러 페이지를 동시에 조회합니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
+import config
+from table_parser import parse_inout_table, detect_total_pages, find_page_field, is_login_page
+
+
+def create_http_session() -> requests.Session:
+    """
+    커넥션 풀을 사용하는 HTTP 세션 생성
+    
+    Returns:
+        requests 세션
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=config.HTTP_POOL_SIZE, pool_maxsize=config.HTTP_POOL_SIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': config.HTTP_USER_AGENT})
+    return session
+
+
+def session_from_cookies(cookies: List[Dict[str, Any]]) -> requests.Session:
+    """
+    브라우저 쿠키로 로그인 세션을 공유하는 HTTP 세션 생성
+    
+    Args:
+        cookies: Playwright context.cookies() 결과
+    
+    Returns:
+        requests 세션
+    """
+    session = create_http_session()
+    for cookie in cookies:
+        session.cookies.set(
+            cookie['name'], cookie['value'],
+            domain=cookie.get('domain'), path=cookie.get('path', '/')
+        )
+    return session
+
+
+class WorkerSessions:
+    """
+    작업자 스레드별 HTTP 세션
+    
+    requests 세션은 여러 스레드가 함께 사용하면 안전하지 않으므로, 작업자 스레드마다
+    원래 세션의 쿠키(로그인 세션)를 복사한 세션을 만들어 사용하고 끝나면 모두 닫습니다.
+    """
+    
+    def __init__(self, session: requests.Session):
+        """
+        Args:
+            session: 쿠키를 복사할 로그인된 HTTP 세션
+        """
+        self.session = session
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+    
+    def get(self) -> requests.Session:
+        """현재 스레드의 세션 (처음 호출 시 생성)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = create_http_session()
+            with self._lock:
+                session.cookies.update(self.session.cookies)
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+    
+    def close(self):
+        """생성한 세션 모두 닫기"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def build_search_fields(search_form: Dict[str, Any], start_date: str, end_date: str,
+                        page: Optional[int] = None) -> List[List[str]]:
+    """
+    검색 폼 필드에 조회 날짜 및 페이지 번호 설정
+    
+    Args:
+        search_form: parse_search_form() 결과
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        page: 페이지 번호 (None이면 폼 기본값 유지)
+    
+    Returns:
+        전송할 폼 필드 [[이름, 값], ...]
+    """
+    start_field, end_field = search_form['date_fields']
+    page_field = search_form.get('page_field')
+    
+    fields = []
+    for name, value in search_form['fields']:
+        if name == start_field:
+            value = start_date
+        elif name == end_field:
+            value = end_date
+        elif page is not None and name == page_field:
+            value = str(page)
+        fields.append([name, value])
+    return fields
+
+
+def submit_search(session: requests.Session, search_form: Dict[str, Any], start_date: str, end_date: str,
+                  page: Optional[int] = None) -> requests.Response:
+    """
+    검색 폼 전송
+    
+    Args:
+        session: 로그인된 HTTP 세션
+        search_form: parse_search_form() 결과
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        page: 페이지 번호
+    
+    Returns:
+        응답 객체
+    """
+    fields = build_search_fields(search_form, start_date, end_date, page)
+    timeout = config.TIMEOUT / 1000
+    
+    if search_form['method'] == 'post':
+        response = session.post(search_form['url'], data=fields, timeout=timeout)
+    else:
+        response = session.get(search_form['url'], params=fields, timeout=timeout)
+    
+    response.raise_for_status()
+    return response
+
+
+def fetch_page_records(session: requests.Session, search_form: Dict[str, Any], start_date: str, end_date: str,
+                       page: int) -> List[Dict[str, Any]]:
+    """
+    검색 결과의 특정 페이지 조회
+    
+    Returns:
+        해당 페이지의 입출차 기록 리스트
+    """
+    response = submit_search(session, search_form, start_date, end_date, page)
+    records = parse_inout_table(response.text)
+    
+    if records is None:
+        if is_login_page(response.text):
+            raise ValueError("세션이 만료되었습니다")
+        raise ValueError(f"{page}페이지에서 입출차 테이블을 찾을 수 없습니다")
+    
+    return records
+
+
+def fetch_remaining_pages(session: requests.Session, search_form: Dict[str, Any], total_pages: int,
+                          start_date: str, end_date: str,
+                          max_workers: int = config.PAGE_FETCH_WORKERS) -> List[Dict[str, Any]]:
+    """
+    첫 페이지 이후의 검색 결과 페이지를 동시에 조회
+    
+    Args:
+        session: 로그인된 HTTP 세션
+        search_form: parse_search_form() 결과
+        total_pages: 전체 페이지 수 (detect_total_pages() 결과)
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        max_workers: 동시 조회 수
+    
+    Returns:
+        2페이지 이후 기록 리스트 (페이지 순서 유지)
+    """
+    if total_pages <= 1:
+        return []
+    
+    if not search_form.get('page_field'):
+        search_form['page_field'] = find_page_field(search_form['fields'])
+    if not search_form['page_field']:
+        raise ValueError("페이지 번호 필드를 찾을 수 없습니다 (PAGE_PARAM 설정 필요)")
+    
+    pages = range(2, total_pages + 1)
+    with WorkerSessions(session) as sessions, \
+            ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pages)))) as executor:
+        # executor.map은 입력 순서대로 결과를 반환
+        results = executor.map(
+            lambda page: fetch_page_records(sessions.get(), search_form, start_date, end_date, page),
+            pages
+        )
+        records = [record for page_records in results for record in page_records]
+    
+    return records
+
+
+def search_all_pages(session: requests.Session, search_form: Dict[str, Any], start_date: str, end_date: str,
+                     max_workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    기간 검색 후 모든 페이지의 기록 조회
+    
+    Args:
+        session: 로그인된 HTTP 세션
+        search_form: parse_search_form() 결과
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        max_workers: 2페이지 이후 동시 조회 수
+    
+    Returns:
+        입출차 기록 리스트 (페이지 순서 유지)
+    """
+    response = submit_search(session, search_form, start_date, end_date)
+    records = parse_inout_table(response.text)
+    
+    if records is None:
+        if is_login_page(response.text):
+            raise ValueError("세션이 만료되었습니다")
+        raise ValueError("입출차 테이블을 찾을 수 없습니다")
+    
+    total_pages = detect_total_pages(response.text)
+    rest = fetch_remaining_pages(session, search_form, total_pages, start_date, end_date, max_workers)
+    return merge_pages(records, rest)
+
+
+def merge_pages(*page_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    페이지별 기록을 순서대로 병합 (조회 중 행이 밀려 중복된 기록 제거)
+    
+    Returns:
+        병합된 입출차 기록 리스트
+    """
+    merged = []
+    seen = set()
+    for records in page_records:
+        for record in records:
+            key = (record.get('car_number'), record.get('entry_time'))
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(record)
+    return merged
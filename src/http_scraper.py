@@ -0,0 +1,405 @@
+"""
+Real Parking HTTP 스크래핑 모듈
+브라우저 없이 HTTP 세션으로 로그인 및 입출차 조회를 수행합니다.
+HTTP 흐름이 실패하면 Playwright 스크래퍼로 전환합니다.
+"""
+import json
+from typing import List, Dict, Any, Optional
+import requests
+import config
+from logger import scraping_logger
+from parking_scraper import ParkingScraper
+from http_client import create_http_session, submit_search, fetch_remaining_pages, merge_pages
+from table_parser import (
+    ScrapeCursor,
+    parse_inout_table, parse_points, parse_login_form, parse_search_form, is_login_page, detect_total_pages,
+    find_page_field
+)
+
+
+class HttpParkingScraper(ParkingScraper):
+    """Real Parking HTTP 스크래퍼 (실패 시 Playwright로 전환)"""
+    
+    def __init__(self, site: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            site: 조회할 사이트 설정 (기본값: .env의 단일 사이트)
+        """
+        super().__init__(site)
+        self.session: Optional[requests.Session] = None
+        self.search_form: Optional[Dict[str, Any]] = None
+        self.last_html = ''
+        self.fallback: Optional[ParkingScraper] = None
+    
+    def start(self):
+        """HTTP 세션 시작"""
+        try:
+            self.session = create_http_session()
+            self.session_restored = self._load_session_cookies()
+            scraping_logger.info("HTTP 세션 시작 완료")
+        except Exception as e:
+            scraping_logger.error(f"HTTP 세션 시작 실패: {str(e)}")
+            raise
+    
+    def stop(self):
+        """HTTP 세션 및 대체 브라우저 종료"""
+        try:
+            if self.session:
+                self.session.close()
+            if self.fallback:
+                self.fallback.stop()
+            scraping_logger.info("HTTP 세션 종료 완료")
+        except Exception as e:
+            scraping_logger.error(f"HTTP 세션 종료 중 오류: {str(e)}")
+    
+    def is_browser_alive(self) -> bool:
+        """대체 브라우저 연결 상태 확인 (HTTP 세션만 사용 중이면 항상 True)"""
+        if self.fallback:
+            return self.fallback.is_browser_alive()
+        return True
+    
+    def restart_browser(self, reason: str = '') -> bool:
+        """대체 브라우저 재시작 (HTTP 세션만 사용 중이면 다시 로그인)"""
+        if self.fallback:
+            result = self.fallback.restart_browser(reason)
+            self._sync_from_fallback()
+            return result
+        
+        self.is_logged_in = False
+        return self.ensure_login() and self.navigate_to_inout_list()
+    
+    def maintain(self) -> str:
+        """대체 브라우저 메모리 및 사용 시간 점검 (HTTP 세션만 사용 중이면 생략)"""
+        if self.fallback:
+            action = self.fallback.maintain()
+            self.resource_stats = self.fallback.resource_stats
+            return action
+        return ''
+    
+    def _switch_to_fallback(self, reason: str) -> ParkingScraper:
+        """
+        Playwright 스크래퍼로 전환
+        
+        Args:
+            reason: 전환 사유 (로그 기록용)
+        
+        Returns:
+            로그인까지 완료된 Playwright 스크래퍼
+        """
+        if self.fallback:
+            return self.fallback
+        
+        scraping_logger.warning(f"HTTP 스크래핑 실패 ({reason}) - Playwright 스크래퍼로 전환합니다")
+        
+        self.fallback = ParkingScraper(self.site)
+        self.fallback.start()
+        if self.fallback.ensure_login():
+            self.fallback.navigate_to_inout_list()
+        self._sync_from_fallback()
+        return self.fallback
+    
+    def _sync_from_fallback(self):
+        """대체 스크래퍼의 상태를 현재 인스턴스에 반영"""
+        self.is_logged_in = self.fallback.is_logged_in
+        self.points_info = self.fallback.points_info
+        self.step_timings = self.fallback.step_timings
+    
+    def _request(self, method: str, url: str, fields: Optional[List[List[str]]] = None) -> requests.Response:
+        """
+        HTTP 요청 전송
+        
+        Args:
+            method: 'get' 또는 'post'
+            url: 요청 URL
+            fields: 전송할 폼 필드 [[이름, 값], ...]
+        
+        Returns:
+            응답 객체
+        """
+        timeout = config.TIMEOUT / 1000
+        if method == 'post':
+            response = self.session.post(url, data=fields or [], timeout=timeout)
+        else:
+            response = self.session.get(url, params=fields or None, timeout=timeout)
+        
+        response.raise_for_status()
+        self.last_html = response.text
+        return response
+    
+    def _load_session_cookies(self) -> bool:
+        """저장된 로그인 세션 파일에서 쿠키 불러오기 (Playwright 스크래퍼와 같은 사이트별 파일)"""
+        storage_state = self._saved_storage_state()
+        if not storage_state:
+            return False
+        
+        try:
+            with open(storage_state, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            
+            for cookie in state.get('cookies', []):
+                self.session.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain'), path=cookie.get('path', '/')
+                )
+            return bool(state.get('cookies'))
+        
+        except Exception as e:
+            scraping_logger.warning(f"로그인 세션 불러오기 실패: {str(e)}")
+            return False
+    
+    def save_session(self):
+        """현재 쿠키를 Playwright 세션 파일 형식으로 저장"""
+        session_state_path = self._session_state_path()
+        if not session_state_path or not self.session:
+            return
+        
+        try:
+            cookies = [
+                {
+                    'name': cookie.name,
+                    'value': cookie.value,
+                    'domain': cookie.domain,
+                    'path': cookie.path or '/',
+                    'expires': cookie.expires if cookie.expires is not None else -1,
+                    'httpOnly': bool(cookie.has_nonstandard_attr('HttpOnly')),
+                    'secure': bool(cookie.secure),
+                    'sameSite': 'Lax'
+                }
+                for cookie in self.session.cookies
+            ]
+            with open(session_state_path, 'w', encoding='utf-8') as f:
+                json.dump({'cookies': cookies, 'origins': []}, f, ensure_ascii=False, indent=2)
+            
+            self.session_restored = True
+            scraping_logger.info(f"로그인 세션 저장 완료: {session_state_path}")
+        except Exception as e:
+            scraping_logger.warning(f"로그인 세션 저장 실패: {str(e)}")
+    
+    def is_session_valid(self) -> bool:
+        """
+        현재 쿠키로 입출차 조회 페이지에 접근 가능한지 확인
+        
+        Returns:
+            세션 유효 여부
+        """
+        try:
+            response = self._request('get', self._inout_url())
+            if is_login_page(response.text):
+                return False
+            
+            self.search_form = parse_search_form(response.text, response.url)
+            return self.search_form is not None
+        
+        except Exception as e:
+            scraping_logger.warning(f"세션 확인 중 오류: {str(e)}")
+            return False
+    
+    def ensure_login(self) -> bool:
+        """
+        저장된 쿠키가 유효하면 로그인을 건너뛰고, 아니면 로그인 수행
+        
+        Returns:
+            로그인 상태 여부
+        """
+        if self.fallback:
+            result = self.fallback.ensure_login()
+            self._sync_from_fallback()
+            return result
+        
+        return super().ensure_login()
+    
+    def get_points_info(self) -> Dict[str, int]:
+        """
+        마지막으로 받은 페이지에서 포인트 정보 조회
+        
+        Returns:
+            포인트 정보 딕셔너리 {'basic': 기본 포인트, 'purchase': 구매 포인트}
+        """
+        if self.fallback:
+            points_info = self.fallback.get_points_info()
+            self._sync_from_fallback()
+            return points_info
+        
+        try:
+            self.points_info = parse_points(self.last_html)
+            scraping_logger.info(
+                f"포인트 정보 조회 완료 - 기본: {self.points_info['basic']}, 구매: {self.points_info['purchase']}"
+            )
+            return self.points_info
+        
+        except Exception as e:
+            scraping_logger.error(f"포인트 정보 조회 실패: {str(e)}")
+            self.points_info = {'basic': 0, 'purchase': 0}
+            return self.points_info
+    
+    def login(self) -> bool:
+        """
+        로그인 폼을 HTTP로 전송하여 로그인
+        
+        Returns:
+            로그인 성공 여부
+        """
+        if self.fallback:
+            result = self.fallback.login()
+            self._sync_from_fallback()
+            return result
+        
+        try:
+            scraping_logger.info("HTTP 로그인 시도 중...")
+            
+            response = self._request('get', self.site['url'])
+            login_form = parse_login_form(response.text, response.url)
+            if not login_form:
+                raise ValueError("로그인 폼을 찾을 수 없습니다")
+            
+            credential_fields = (
+                login_form['user_field'], login_form['password_field'], login_form['auto_login_field']
+            )
+            fields = [field for field in login_form['fields'] if field[0] not in credential_fields]
+            user_id, password = self._login_credentials()
+            fields.append([login_form['user_field'], user_id])
+            fields.append([login_form['password_field'], password])
+            if login_form['auto_login_field']:
+                fields.append([login_form['auto_login_field'], 'on'])
+            
+            login_url = login_form['url']
+            if config.PARKING_LOGIN_PATH:
+                login_url = f"{self.site['url'].rstrip('/')}/{config.PARKING_LOGIN_PATH.lstrip('/')}"
+            
+            self._request('post', login_url, fields)
+            
+            # 로그인 결과는 입출차 조회 페이지 접근 가능 여부로 확인
+            if not self.is_session_valid():
+                raise ValueError("로그인 후 입출차 조회 페이지에 접근할 수 없습니다")
+            
+            self.is_logged_in = True
+            scraping_logger.success("HTTP 로그인 성공")
+            self.save_session()
+            return True
+        
+        except Exception as e:
+            scraping_logger.error(f"HTTP 로그인 중 오류 발생: {str(e)}")
+            return self._switch_to_fallback('login').is_logged_in
+    
+    def navigate_to_inout_list(self) -> bool:
+        """
+        입출차 조회 페이지 검색 폼 준비
+        
+        Returns:
+            준비 성공 여부
+        """
+        if self.fallback:
+            return self.fallback.navigate_to_inout_list()
+        
+        if not self.is_logged_in:
+            scraping_logger.error("로그인이 필요합니다")
+            return False
+        
+        if self.search_form:
+            return True
+        
+        if self.is_session_valid():
+            scraping_logger.info("입출차 조회 페이지 이동 완료")
+            return True
+        
+        return self._switch_to_fallback('navigate').navigate_to_inout_list()
+    
+    def is_search_ready(self) -> bool:
+        """검색 폼 사용 가능 여부"""
+        if self.fallback:
+            return self.fallback.is_search_ready()
+        return self.is_logged_in and self.search_form is not None
+    
+    def open_search_session(self):
+        """
+        현재 로그인 세션을 공유하는 HTTP 검색 세션 생성
+        
+        Returns:
+            (requests 세션, 검색 폼 정보)
+        """
+        if self.fallback:
+            return self.fallback.open_search_session()
+        
+        if not self.is_search_ready():
+            raise ValueError("로그인이 필요합니다")
+        
+        session = create_http_session()
+        session.cookies.update(self.session.cookies)
+        search_form = dict(self.search_form, page_field=find_page_field(self.search_form['fields']))
+        return session, search_form
+    
+    def get_parking_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                         cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+        """
+        입출차 데이터 조회 (검색 폼을 HTTP로 전송)
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            end_date: 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            cursor: 증분 조회 기준 (지정하면 새 입차 및 출차 정보가 생긴 행만 반환)
+        
+        Returns:
+            입출차 데이터 리스트
+        """
+        if self.fallback:
+            data = self.fallback.get_parking_data(start_date, end_date, cursor)
+            self._sync_from_fallback()
+            return data
+        
+        if not self.is_search_ready():
+            scraping_logger.error("로그인이 필요합니다")
+            return []
+        
+        start_date, end_date = self._resolve_dates(start_date, end_date)
+        scraping_logger.info(f"입출차 데이터 HTTP 조회 시작: {start_date} ~ {end_date}")
+        
+        try:
+            with self._timed('search'):
+                response = submit_search(self.session, self.search_form, start_date, end_date)
+                self.last_html = response.text
+            
+            with self._timed('parse'):
+                data = parse_inout_table(response.text, cursor)
+                
+                # 검색 결과 페이지의 포인트 정보 반영 (찾지 못하면 이전 값 유지)
+                points_info = parse_points(response.text)
+                if points_info['basic'] or points_info['purchase']:
+                    self.points_info = points_info
+            
+            if data is None:
+                if is_login_page(response.text):
+                    raise ValueError("세션이 만료되었습니다")
+                raise ValueError("입출차 테이블을 찾을 수 없습니다")
+            
+            # 2페이지 이후 동시 조회
+            total_pages = 1 if cursor and cursor.stopped else detect_total_pages(response.text)
+            if total_pages > 1:
+                try:
+                    with self._timed('pages'):
+                        rest = fetch_remaining_pages(
+                            self.session, self.search_form, total_pages, start_date, end_date
+                        )
+                    if cursor:
+                        rest = cursor.filter(rest)
+                    data = merge_pages(data, rest)
+                    scraping_logger.info(f"{total_pages}페이지 조회 완료 ({self.step_timings['pages']}ms)")
+                except Exception as e:
+                    scraping_logger.warning(f"2페이지 이후 조회 실패 - 첫 페이지만 사용합니다: {str(e)}")
+            
+            if cursor:
+                scraping_logger.info(cursor.summary())
+            
+            scraping_logger.success(
+                f"입출차 데이터 {len(data)}건 조회 완료",
+                {'timings': dict(self.step_timings)}
+            )
+            return data
+        
+        except Exception as e:
+            scraping_logger.error(f"HTTP 데이터 조회 중 오류: {str(e)}")
+            self.search_form = None
+            
+            fallback = self._switch_to_fallback('search')
+            data = fallback.get_parking_data(start_date, end_date, cursor)
+            self._sync_from_fallback()
+            return data
@@ -4,7 +4,7 @@ Real Parking 입출차 모니터링 시스템
 """
 import sys
 from datetime import datetime
-from parking_scraper import ParkingScraper
+from parking_scraper import create_scraper
 from database import ParkingDatabase
 from logger import system_logger
 
@@ -50,9 +50,9 @@ def main():
         db = ParkingDatabase()
         
         # 스크래퍼 시작
-        with ParkingScraper() as scraper:
+        with create_scraper() as scraper:
             # 로그인
-            if not scraper.login():
+            if not scraper.ensure_login():
                 system_logger.error("로그인 실패")
                 return 1
             
@@ -77,7 +77,7 @@ def main():
             stats = db.get_statistics()
             print("\n[데이터베이스 통계]")
             print(f"  전체 기록: {stats.get('total_records', 0)}건")
-            print(f"  오늘 기록: {stats.get('today_records', 0)}건")
+            print(f"  오늘 기록: {stats.get('today_records', 0)}건 (출차 {stats.get('today_exits', 0)}건)")
             print(f"  미출차: {stats.get('not_exited', 0)}건")
             print()
         
@@ -3,13 +3,24 @@ Real Parking 입출차 모니터링 시스템 (알림 기능 포함)
 메인 실행 파일
 """
 import sys
+import time
+import asyncio
 import argparse
 from datetime import datetime
-from parking_scraper import ParkingScraper
+from typing import Dict, Optional
+import config
+from parking_scraper import create_scraper
+from table_parser import ScrapeCursor
+from change_detector import ChangeDetector, compute_fingerprint
 from database import ParkingDatabase
+from delta_log import DeltaLog
+from poll_scheduler import AdaptivePollScheduler
 from notification_manager import NotificationManager
 from logger import system_logger
 
+# 마지막 조회 결과 지문 저장 키
+FINGERPRINT_STATE_KEY = 'last_poll_fingerprint'
+
 
 def display_records(records):
     """입출차 기록 출력"""
@@ -41,6 +52,380 @@ def display_records(records):
     print(f"\n{'='*100}\n")
 
 
+def print_points(points):
+    """포인트 정보 출력"""
+    print(f"\n{'='*100}")
+    print(f"💰 포인트 정보")
+    print(f"{'='*100}")
+    print(f"  기본 선입 포인트: {points['basic']:,}P")
+    print(f"  구매 선입 포인트: {points['purchase']:,}P")
+    print(f"  총 포인트: {points['basic'] + points['purchase']:,}P")
+    print(f"{'='*100}\n")
+
+
+def print_statistics(db):
+    """데이터베이스 통계 출력"""
+    stats = db.get_statistics()
+    print("\n[데이터베이스 통계]")
+    print(f"  전체 기록: {stats.get('total_records', 0)}건")
+    print(f"  오늘 기록: {stats.get('today_records', 0)}건 (출차 {stats.get('today_exits', 0)}건)")
+    print(f"  미출차: {stats.get('not_exited', 0)}건")
+    
+    metrics = db.get_metrics()
+    print(f"  변경 없음으로 처리 생략: {metrics.get('fingerprint_skips', 0)}회 / 전체 조회 {metrics.get('polls', 0)}회")
+    print()
+
+
+def prepare_scraper(scraper) -> bool:
+    """
+    로그인 후 입출차 조회 페이지까지 이동
+    
+    Args:
+        scraper: 시작된 ParkingScraper 인스턴스
+    
+    Returns:
+        준비 성공 여부
+    """
+    if not scraper.ensure_login():
+        system_logger.error("로그인 실패")
+        return False
+    
+    # 포인트 정보 조회 (로그인 직후 페이지에서 확인)
+    scraper.get_points_info()
+    
+    if not scraper.navigate_to_inout_list():
+        system_logger.error("입출차 조회 페이지 이동 실패")
+        return False
+    
+    return True
+
+
+def run_poll(scraper, db, notification_manager=None, verbose: bool = True,
+             incremental: bool = config.INCREMENTAL_SCRAPING, watchdog_timeout: float = 0) -> Dict[str, int]:
+    """
+    입출차 데이터 1회 조회 및 처리
+    
+    입출차 조회 페이지가 이미 열려 있다고 가정하고 검색만 다시 수행합니다.
+    
+    Args:
+        scraper: 로그인된 ParkingScraper 인스턴스
+        db: 데이터베이스 인스턴스
+        notification_manager: 알림 관리자 (없으면 알림 생략)
+        verbose: 조회 결과 및 통계 출력 여부
+        incremental: 이미 저장된 기록은 건너뛰고 새 입차 및 출차만 처리할지 여부
+        watchdog_timeout: 브라우저 조회 제한 시간 (초, 0이면 감시하지 않음)
+            저장과 알림은 브라우저와 관계없으므로 감시하지 않음
+    
+    Returns:
+        처리 결과 {'records': 조회 수, 'new_records': 저장 수, 'entries': 입차 수, 'exits': 출차 수,
+                  'skipped': 이전 조회와 같아 처리를 생략했으면 1}
+    """
+    scraper.reset_request_stats()
+    
+    # 오늘 데이터 조회 (증분 조회 시 새 입차 및 출차 정보가 생긴 기록만 반환)
+    # 포인트 정보는 조회 중 같은 페이지 추출에서 갱신됨 (찾지 못하면 이전 값 유지)
+    system_logger.info("오늘의 입출차 데이터 조회 중...")
+    cursor = create_cursor(db, incremental)
+    with scraper.watchdog.guard('poll', watchdog_timeout):
+        records = scraper.get_today_data(cursor)
+    
+    # 응답이 없어 브라우저를 강제 종료했으면 빈 조회 결과를 처리하지 않음 (다음 회차에서 브라우저 재시작)
+    if scraper.watchdog.fired:
+        raise RuntimeError("브라우저가 응답하지 않아 조회를 중단했습니다")
+    points = scraper.points_info or {'basic': 0, 'purchase': 0}
+    
+    return process_records(records, points, db, notification_manager, verbose)
+
+
+def create_cursor(db, incremental: bool) -> Optional[ScrapeCursor]:
+    """
+    오늘 조회에 사용할 증분 조회 기준 생성
+    
+    Returns:
+        증분 조회 기준 (증분 조회를 사용하지 않으면 None)
+    """
+    if not incremental:
+        return None
+    today = datetime.now().strftime(config.DATE_FORMAT)
+    return ScrapeCursor(**db.get_incremental_state(today))
+
+
+def process_records(records, points, db, notification_manager=None, verbose: bool = True) -> Dict[str, int]:
+    """
+    조회된 기록의 변경 감지, 알림 및 저장
+    
+    Args:
+        records: 조회된 입출차 기록 리스트
+        points: 포인트 정보
+        db: 데이터베이스 인스턴스
+        notification_manager: 알림 관리자 (없으면 알림 생략)
+        verbose: 조회 결과 및 통계 출력 여부
+    
+    Returns:
+        처리 결과 (run_poll() 반환값과 동일)
+    
+    Raises:
+        Exception: 저장 실패 (조회 지문도 저장하지 않으므로 다음 조회에서 다시 처리)
+    """
+    result = {'records': len(records), 'new_records': 0, 'entries': 0, 'exits': 0, 'skipped': 0}
+    db.increment_metric('polls')
+    
+    if verbose:
+        display_records(records)
+        print_points(points)
+    
+    # 이전 조회와 결과가 같으면 변경 감지 및 저장 생략
+    fingerprint = compute_fingerprint(records)
+    if fingerprint == db.get_state(FINGERPRINT_STATE_KEY):
+        result['skipped'] = 1
+        db.increment_metric('fingerprint_skips')
+        system_logger.info("이전 조회와 결과가 같아 변경 감지 및 저장을 생략합니다")
+    else:
+        # 변경 감지 및 저장 (새 입차 추가와 출차 정보 반영, 조회 지문을 한 번에 커밋)
+        # 저장에 실패하면 예외가 전달되어 조회 지문도 함께 롤백됨
+        with db.transaction():
+            new_entries, new_exits = ChangeDetector(db).detect_changes(records) if records else ([], [])
+            db.set_state(FINGERPRINT_STATE_KEY, fingerprint)
+        
+        # 조회 지표는 실제로 저장한 조회에서만 함께 기록 (변경 없는 조회는 메모리에만 누적)
+        db.flush_metrics()
+        
+        result['new_records'] = result['entries'] = len(new_entries)
+        result['exits'] = len(new_exits)
+        system_logger.success(
+            f"데이터베이스에 {len(new_entries)}건의 새 기록 저장, {len(new_exits)}건의 출차 정보 반영 완료"
+        )
+        
+        # 알림 처리 (저장이 끝난 후 전송)
+        if notification_manager and (new_entries or new_exits):
+            system_logger.info("알림 전송 중...")
+            # 현재 포인트를 notification_manager에 전달
+            notification_manager.set_current_points(points['basic'])
+            stats = notification_manager.notify_changes(new_entries, new_exits)
+            
+            if verbose:
+                print("\n[알림 처리 결과]")
+                print(f"  새로운 입차: {stats['entries']}건")
+                print(f"  새로운 출차: {stats['exits']}건")
+                print(f"  전송된 알림: {stats['notifications']}건")
+                print()
+    
+    if verbose:
+        print_statistics(db)
+    
+    return result
+
+
+def run_daemon(scraper, db, notification_manager=None, interval: int = config.POLL_INTERVAL,
+               incremental: bool = config.INCREMENTAL_SCRAPING, scheduler=None, delta_log=None) -> int:
+    """
+    데몬 모드 실행
+    
+    브라우저, 로그인된 페이지, 데이터베이스, 방송기를 유지한 채
+    입출차 조회 페이지를 주기적으로 다시 검색합니다.
+    
+    Args:
+        scraper: 시작된 ParkingScraper 인스턴스
+        db: 데이터베이스 인스턴스
+        notification_manager: 알림 관리자 (없으면 알림 생략)
+        interval: 조회 간격 (초)
+        incremental: 증분 조회 사용 여부
+        scheduler: 적응형 조회 간격 스케줄러 (지정하면 interval 대신 사용)
+        delta_log: 변경 기록(델타 로그) (지정하면 변경이 커밋된 조회마다 변경 파일 저장)
+    
+    Returns:
+        종료 코드
+    """
+    log_daemon_start(interval, scheduler)
+    
+    if not prepare_scraper(scraper):
+        return 1
+    
+    poll_count = 0
+    while True:
+        started = time.monotonic()
+        
+        try:
+            # 응답 없는 작업으로 브라우저가 강제 종료되었거나 연결이 끊긴 경우 재시작
+            if not scraper.is_browser_alive():
+                if not scraper.restart_browser("브라우저 연결 끊김"):
+                    time.sleep(config.POLL_RETRY_DELAY)
+                    continue
+            
+            # 세션 만료 등으로 조회 페이지를 벗어난 경우 다시 로그인
+            if not scraper.is_search_ready():
+                system_logger.warning("입출차 조회 페이지를 사용할 수 없음 - 다시 로그인합니다")
+                if not prepare_scraper(scraper):
+                    time.sleep(config.POLL_RETRY_DELAY)
+                    continue
+            
+            poll_count += 1
+            result = run_poll(scraper, db, notification_manager, verbose=False, incremental=incremental,
+                              watchdog_timeout=config.WATCHDOG_TIMEOUT)
+            elapsed = time.monotonic() - started
+            
+            # 다음 조회 전 여유 시간에 브라우저 메모리 및 사용 시간 점검 (컨텍스트 교체, 브라우저 재시작)
+            scraper.maintain()
+            
+            # 달이 바뀌었으면 지난 기록을 보관 DB로 이동
+            db.archive_if_due()
+            
+            # 이번 조회에서 커밋된 변경을 바로 변경 파일로 남김 (종료 시까지 메모리에 쌓지 않음)
+            if delta_log and delta_log.flush():
+                delta_log.compact_if_due()
+            
+            system_logger.info(
+                f"[{poll_count}회차] 조회 {result['records']}건, 입차 {result['entries']}건, "
+                f"출차 {result['exits']}건, 신규 저장 {result['new_records']}건"
+                f"{' (변경 없음)' if result['skipped'] else ''} ({elapsed:.1f}초 소요)",
+                {'poll': poll_count, 'elapsed': round(elapsed, 3), 'requests': scraper.request_stats,
+                 'resources': scraper.resource_stats, **result}
+            )
+        
+        except Exception as e:
+            system_logger.error(f"데몬 조회 중 오류 발생: {str(e)}")
+            # 다음 회차에서 다시 로그인하도록 상태 초기화
+            scraper.is_logged_in = False
+            time.sleep(config.POLL_RETRY_DELAY)
+            continue
+        
+        # 다음 조회까지 대기 (조회에 걸린 시간만큼 차감)
+        time.sleep(max(0.0, next_poll_interval(interval, scheduler, result) - (time.monotonic() - started)))
+
+
+def log_daemon_start(interval: int, scheduler=None, mode: str = ''):
+    """
+    데몬 모드 시작 기록 (조회 간격 방식 포함)
+    
+    Args:
+        interval: 고정 조회 간격 (초)
+        scheduler: 적응형 조회 간격 스케줄러 (없으면 고정 간격 사용)
+        mode: 실행 방식 표시 (예: ' (비동기)')
+    """
+    if scheduler:
+        system_logger.info(
+            f"데몬 모드 시작{mode} - 적응형 조회 간격 ({scheduler.min_interval}~{scheduler.max_interval}초)"
+        )
+    else:
+        system_logger.info(f"데몬 모드 시작{mode} - {interval}초 간격으로 조회")
+
+
+def next_poll_interval(interval: int, scheduler=None, result: Optional[Dict[str, int]] = None) -> int:
+    """
+    다음 조회까지의 간격
+    
+    Args:
+        interval: 고정 조회 간격 (초)
+        scheduler: 적응형 조회 간격 스케줄러 (없으면 고정 간격 사용)
+        result: 직전 조회 처리 결과
+    
+    Returns:
+        조회 간격 (초)
+    """
+    if not scheduler:
+        return interval
+    
+    wait = scheduler.next_interval(result)
+    system_logger.info(f"다음 조회까지 {wait}초 ({scheduler.last_reason})")
+    return wait
+
+
+async def run_poll_async(scraper, db, notification_manager=None, verbose: bool = True,
+                         incremental: bool = config.INCREMENTAL_SCRAPING) -> Dict[str, int]:
+    """
+    포인트 정보와 입출차 데이터를 동시에 조회한 뒤 처리 (비동기 스크래퍼용)
+    
+    데이터베이스 작업과 안내방송은 블로킹 호출이므로 작업 스레드에서 실행하여
+    다른 사이트의 조회가 이벤트 루프에서 계속 진행되도록 합니다
+    (데이터베이스 연결은 인스턴스별 잠금으로 한 번에 하나씩 사용).
+    
+    Args:
+        scraper: 준비된 AsyncParkingScraper 인스턴스
+        db: 데이터베이스 인스턴스
+        notification_manager: 알림 관리자 (없으면 알림 생략)
+        verbose: 조회 결과 및 통계 출력 여부
+        incremental: 증분 조회 사용 여부
+    
+    Returns:
+        처리 결과 (run_poll() 반환값과 동일)
+    """
+    system_logger.info("포인트 정보 및 오늘의 입출차 데이터 동시 조회 중...")
+    cursor = await asyncio.to_thread(create_cursor, db, incremental)
+    points, records = await scraper.poll(cursor)
+    
+    return await asyncio.to_thread(process_records, records, points, db, notification_manager, verbose)
+
+
+async def run_async(db, notification_manager=None, daemon: bool = False, interval: int = config.POLL_INTERVAL,
+                    incremental: bool = config.INCREMENTAL_SCRAPING, scheduler=None, delta_log=None) -> int:
+    """
+    비동기 스크래퍼로 실행 (1회 조회 또는 데몬 모드)
+    
+    Args:
+        db: 데이터베이스 인스턴스
+        notification_manager: 알림 관리자 (없으면 알림 생략)
+        daemon: 주기적으로 조회할지 여부
+        interval: 데몬 모드 조회 간격 (초)
+        incremental: 증분 조회 사용 여부
+        scheduler: 적응형 조회 간격 스케줄러 (지정하면 interval 대신 사용)
+        delta_log: 변경 기록(델타 로그) (지정하면 변경이 커밋된 조회마다 변경 파일 저장)
+    
+    Returns:
+        종료 코드
+    """
+    from async_parking_scraper import AsyncParkingScraper
+    
+    async with AsyncParkingScraper() as scraper:
+        if not await scraper.prepare():
+            system_logger.error("로그인 또는 입출차 조회 페이지 이동 실패")
+            return 1
+        
+        if not daemon:
+            await run_poll_async(scraper, db, notification_manager, incremental=incremental)
+            return 0
+        
+        log_daemon_start(interval, scheduler, ' (비동기)')
+        poll_count = 0
+        while True:
+            started = time.monotonic()
+            
+            try:
+                # 브라우저 연결이 끊긴 경우 재시작
+                if not scraper.is_browser_alive():
+                    if not await scraper.restart_browser("브라우저 연결 끊김"):
+                        await asyncio.sleep(config.POLL_RETRY_DELAY)
+                        continue
+                
+                # 세션 만료 등으로 조회 페이지를 벗어난 경우 다시 로그인
+                if not await scraper.is_search_ready():
+                    system_logger.warning("입출차 조회 페이지를 사용할 수 없음 - 다시 로그인합니다")
+                    if not await scraper.prepare():
+                        await asyncio.sleep(config.POLL_RETRY_DELAY)
+                        continue
+                
+                poll_count += 1
+                result = await run_poll_async(scraper, db, notification_manager, verbose=False,
+                                              incremental=incremental)
+                elapsed = time.monotonic() - started
+                await asyncio.to_thread(db.archive_if_due)
+                if delta_log and await asyncio.to_thread(delta_log.flush):
+                    await asyncio.to_thread(delta_log.compact_if_due)
+                system_logger.info(
+                    f"[{poll_count}회차] 조회 {result['records']}건, 입차 {result['entries']}건, "
+                    f"출차 {result['exits']}건, 신규 저장 {result['new_records']}건"
+                    f"{' (변경 없음)' if result['skipped'] else ''} ({elapsed:.1f}초 소요)",
+                    {'poll': poll_count, 'elapsed': round(elapsed, 3), 'requests': scraper.request_stats, **result}
+                )
+            
+            except Exception as e:
+                system_logger.error(f"데몬 조회 중 오류 발생: {str(e)}")
+                scraper.is_logged_in = False
+                await asyncio.sleep(config.POLL_RETRY_DELAY)
+                continue
+            
+            await asyncio.sleep(max(0.0, next_poll_interval(interval, scheduler, result) - (time.monotonic() - started)))
+
+
 def main():
     """메인 실행 함수"""
     # 명령줄 인자 파싱
@@ -48,8 +433,22 @@ def main():
     parser.add_argument('--no-notification', action='store_true', help='알림 기능 비활성화')
     parser.add_argument('--broadcaster', choices=['assistant', 'cast'], default='cast',
                         help='방송 타입 선택 (assistant: Google Assistant SDK, cast: Chromecast)')
+    parser.add_argument('--backend', choices=['playwright', 'http'], default=config.SCRAPER_BACKEND,
+                        help='스크래퍼 백엔드 선택 (playwright: 브라우저, http: 브라우저 없이 HTTP 세션)')
+    parser.add_argument('--full-scan', action='store_true',
+                        help='증분 조회를 사용하지 않고 오늘의 전체 기록을 조회')
+    parser.add_argument('--daemon', action='store_true',
+                        help='브라우저와 로그인 세션을 유지하며 주기적으로 조회 (데몬 모드)')
+    parser.add_argument('--interval', type=int, default=config.POLL_INTERVAL,
+                        help=f'데몬 모드 조회 간격 (초, 기본값: {config.POLL_INTERVAL})')
+    parser.add_argument('--adaptive', action='store_true',
+                        help=f'데몬 모드에서 과거 시간대별 입출차 빈도에 따라 조회 간격 조절 '
+                             f'({config.POLL_MIN_INTERVAL}~{config.POLL_MAX_INTERVAL}초)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='비동기 스크래퍼로 포인트 정보와 입출차 데이터를 동시에 조회 (playwright 백엔드)')
     args = parser.parse_args()
     
+    delta_log = None
     try:
         system_logger.info("=" * 50)
         system_logger.info("Real Parking 입출차 모니터링 시스템 시작")
@@ -58,6 +457,11 @@ def main():
         # 데이터베이스 초기화
         db = ParkingDatabase()
         
+        # 변경 기록(델타 로그)으로 데이터베이스를 최신 상태로 맞춤
+        if config.DELTA_LOG_ENABLED:
+            delta_log = DeltaLog(db)
+            delta_log.sync()
+        
         # 알림 관리자 초기화 (옵션)
         notification_manager = None
         if not args.no_notification:
@@ -69,63 +473,32 @@ def main():
                 system_logger.warning("방송기 초기화 실패 - 알림 없이 계속 진행")
                 notification_manager = None
         
+        # 적응형 조회 간격 (데몬 모드)
+        scheduler = AdaptivePollScheduler(db) if args.daemon and args.adaptive else None
+        
+        # 비동기 스크래퍼 사용 시 포인트 정보와 입출차 데이터를 동시에 조회
+        if args.use_async:
+            exit_code = asyncio.run(
+                run_async(db, notification_manager, args.daemon, args.interval, not args.full_scan, scheduler,
+                          delta_log)
+            )
+            if exit_code == 0:
+                system_logger.success("프로그램 정상 종료")
+            return exit_code
+        
         # 스크래퍼 시작
-        with ParkingScraper() as scraper:
-            # 로그인
-            if not scraper.login():
-                system_logger.error("로그인 실패")
-                return 1
-            
-            # 포인트 정보 조회
-            points = scraper.get_points_info()
-            system_logger.info(f"[포인트 정보] 기본: {points['basic']}P / 구매: {points['purchase']}P")
+        with create_scraper(args.backend) as scraper:
+            if args.daemon:
+                return run_daemon(scraper, db, notification_manager, args.interval, not args.full_scan, scheduler,
+                                  delta_log)
             
-            # 입출차 조회 페이지 이동
-            if not scraper.navigate_to_inout_list():
-                system_logger.error("입출차 조회 페이지 이동 실패")
+            if not prepare_scraper(scraper):
                 return 1
             
-            # 오늘 데이터 조회
-            system_logger.info("오늘의 입출차 데이터 조회 중...")
-            records = scraper.get_today_data()
-            
-            # 결과 출력
-            display_records(records)
-            
-            # 포인트 정보 출력
-            print(f"\n{'='*100}")
-            print(f"💰 포인트 정보")
-            print(f"{'='*100}")
-            print(f"  기본 선입 포인트: {points['basic']:,}P")
-            print(f"  구매 선입 포인트: {points['purchase']:,}P")
-            print(f"  총 포인트: {points['basic'] + points['purchase']:,}P")
-            print(f"{'='*100}\n")
-            
-            # 알림 처리
-            if notification_manager and records:
-                system_logger.info("변경 감지 및 알림 전송 중...")
-                # 현재 포인트를 notification_manager에 전달
-                notification_manager.set_current_points(points['basic'])
-                stats = notification_manager.process_new_records(records)
-                
-                print("\n[알림 처리 결과]")
-                print(f"  새로운 입차: {stats['entries']}건")
-                print(f"  새로운 출차: {stats['exits']}건")
-                print(f"  전송된 알림: {stats['notifications']}건")
-                print()
-            
-            # 데이터베이스에 저장
-            if records:
-                new_count = db.insert_records(records)
-                system_logger.success(f"데이터베이스에 {new_count}건의 새 기록 저장 완료")
+            points = scraper.points_info
+            system_logger.info(f"[포인트 정보] 기본: {points['basic']}P / 구매: {points['purchase']}P")
             
-            # 통계 정보 출력
-            stats = db.get_statistics()
-            print("\n[데이터베이스 통계]")
-            print(f"  전체 기록: {stats.get('total_records', 0)}건")
-            print(f"  오늘 기록: {stats.get('today_records', 0)}건")
-            print(f"  미출차: {stats.get('not_exited', 0)}건")
-            print()
+            run_poll(scraper, db, notification_manager, incremental=not args.full_scan)
         
         system_logger.success("프로그램 정상 종료")
         return 0
@@ -139,8 +512,13 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    
+    finally:
+        # 이번 실행에서 저장된 새 기록과 출차 반영 기록만 변경 파일로 남김
+        if delta_log:
+            delta_log.flush()
+            delta_log.compact_if_due()
 
 
 if __name__ == '__main__':
     sys.exit(main())
-
@@ -0,0 +1,240 @@
+"""
+Real Parking 다중 사이트 입출차 모니터링
+sites.json의 여러 사이트(건물/계정)를 하나의 브라우저로 조회합니다.
+
+브라우저는 한 번만 실행하고 사이트별로 컨텍스트(로그인 세션)를 분리하며,
+동시에 조회하는 사이트 수는 --workers로 제한합니다.
+기록은 사이트별 데이터베이스(data/sites/<이름>.db)에 저장됩니다.
+
+사용 예:
+    python multi_site_monitor.py --daemon --interval 30 --workers 3
+"""
+import sys
+import time
+import asyncio
+import argparse
+from typing import List, Dict, Any, Optional
+from playwright.async_api import async_playwright
+import config
+from sites import load_sites
+from async_parking_scraper import AsyncParkingScraper, launch_browser
+from database import ParkingDatabase
+from notification_manager import NotificationManager
+from main_with_notification import run_poll_async
+from logger import system_logger
+
+
+def create_notification_managers(databases: List[ParkingDatabase], broadcaster_type: str) -> List[Optional[NotificationManager]]:
+    """
+    사이트별 알림 관리자 생성 (방송기는 하나를 초기화하여 공유)
+    
+    Args:
+        databases: 사이트별 데이터베이스 인스턴스
+        broadcaster_type: 방송 타입 ('assistant' 또는 'cast')
+    
+    Returns:
+        사이트별 알림 관리자 리스트 (방송기 초기화 실패 시 모두 None)
+    """
+    first = NotificationManager(databases[0], broadcaster_type)
+    if not first.initialize_broadcaster():
+        system_logger.warning("방송기 초기화 실패 - 알림 없이 계속 진행")
+        return [None] * len(databases)
+    
+    managers = [first]
+    for db in databases[1:]:
+        managers.append(NotificationManager(db, broadcaster_type, broadcaster=first.broadcaster,
+                                            broadcast_lock=first.broadcast_lock))
+    return managers
+
+
+async def poll_site(site_state: Dict[str, Any], semaphore: asyncio.Semaphore,
+                    incremental: bool) -> Optional[Dict[str, int]]:
+    """
+    사이트 1곳 조회 (필요하면 로그인 후 조회)
+    
+    Args:
+        site_state: {'site', 'scraper', 'db', 'notification_manager'}
+        semaphore: 동시 조회 사이트 수 제한
+        incremental: 증분 조회 사용 여부
+    
+    Returns:
+        처리 결과 (실패 시 None)
+    """
+    name = site_state['site']['name']
+    scraper = site_state['scraper']
+    
+    async with semaphore:
+        try:
+            # 브라우저를 다시 실행했거나 컨텍스트를 만들지 못한 경우 컨텍스트 재시작
+            if not scraper.is_browser_alive():
+                if not await scraper.restart_browser("브라우저 연결 끊김"):
+                    system_logger.error(f"[{name}] 브라우저 재시작 실패")
+                    return None
+            
+            # 처음 조회하거나 세션이 만료된 경우 로그인 후 조회 페이지로 이동
+            if not await scraper.is_search_ready():
+                if not await scraper.prepare():
+                    system_logger.error(f"[{name}] 로그인 또는 입출차 조회 페이지 이동 실패")
+                    return None
+            
+            return await run_poll_async(
+                scraper, site_state['db'], site_state['notification_manager'],
+                verbose=False, incremental=incremental
+            )
+        
+        except Exception as e:
+            system_logger.error(f"[{name}] 조회 중 오류 발생: {str(e)}")
+            scraper.is_logged_in = False
+            return None
+
+
+async def relaunch_browser(playwright, browser, states: List[Dict[str, Any]]):
+    """
+    공유 브라우저 다시 실행
+    
+    사이트별 컨텍스트는 정리만 하고, 다음 조회에서 각 사이트가 새 브라우저에 컨텍스트를 만들어 다시 로그인합니다.
+    
+    Args:
+        playwright: 시작된 async Playwright 인스턴스
+        browser: 연결이 끊긴 브라우저
+        states: 사이트별 조회 상태
+    
+    Returns:
+        새 브라우저 인스턴스
+    """
+    system_logger.warning("공유 브라우저 연결 끊김 - 브라우저를 다시 실행합니다")
+    for state in states:
+        await state['scraper'].stop()
+    try:
+        await browser.close()
+    except Exception:
+        pass
+    
+    browser = await launch_browser(playwright)
+    for state in states:
+        state['scraper'].browser = browser
+    return browser
+
+
+async def monitor_sites(sites: List[Dict[str, Any]], workers: int = config.MULTI_SITE_WORKERS,
+                        daemon: bool = False, interval: int = config.POLL_INTERVAL,
+                        incremental: bool = config.INCREMENTAL_SCRAPING, notification: bool = False,
+                        broadcaster_type: str = 'cast') -> int:
+    """
+    여러 사이트를 하나의 브라우저로 조회
+    
+    Args:
+        sites: 사이트 설정 리스트 (load_sites() 결과)
+        workers: 동시에 조회할 사이트 수
+        daemon: 주기적으로 조회할지 여부
+        interval: 데몬 모드 조회 간격 (초)
+        incremental: 증분 조회 사용 여부
+        notification: 알림 사용 여부
+        broadcaster_type: 방송 타입
+    
+    Returns:
+        종료 코드 (1회 조회에서 실패한 사이트가 있으면 1)
+    """
+    databases = [ParkingDatabase(site['database_path']) for site in sites]
+    managers = [None] * len(sites)
+    if notification:
+        managers = create_notification_managers(databases, broadcaster_type)
+    
+    semaphore = asyncio.Semaphore(max(1, workers))
+    system_logger.info(f"다중 사이트 모니터링 시작 - 사이트 {len(sites)}개, 동시 조회 {workers}개")
+    
+    async with async_playwright() as playwright:
+        browser = await launch_browser(playwright)
+        states = []
+        try:
+            # 사이트별 컨텍스트 생성 (브라우저는 공유)
+            for site, db, manager in zip(sites, databases, managers):
+                scraper = AsyncParkingScraper(site, browser)
+                await scraper.start()
+                states.append({'site': site, 'scraper': scraper, 'db': db, 'notification_manager': manager})
+            
+            round_count = 0
+            while True:
+                started = time.monotonic()
+                round_count += 1
+                
+                # 공유 브라우저 연결이 끊긴 경우 다시 실행 (실패하면 다음 회차에 다시 시도)
+                if not browser.is_connected():
+                    try:
+                        browser = await relaunch_browser(playwright, browser, states)
+                    except Exception as e:
+                        system_logger.error(f"브라우저 재실행 실패: {str(e)}")
+                        if not daemon:
+                            return 1
+                        await asyncio.sleep(config.POLL_RETRY_DELAY)
+                        continue
+                
+                results = await asyncio.gather(*(poll_site(state, semaphore, incremental) for state in states))
+                
+                elapsed = time.monotonic() - started
+                failed = 0
+                for state, result in zip(states, results):
+                    name = state['site']['name']
+                    if result is None:
+                        failed += 1
+                        continue
+                    system_logger.info(
+                        f"[{name}] 조회 {result['records']}건, 입차 {result['entries']}건, "
+                        f"출차 {result['exits']}건, 신규 저장 {result['new_records']}건"
+                        f"{' (변경 없음)' if result['skipped'] else ''}",
+                        {'site': name, 'round': round_count, **result}
+                    )
+                system_logger.info(
+                    f"[{round_count}회차] 사이트 {len(states)}개 조회 완료 - 실패 {failed}개 ({elapsed:.1f}초 소요)"
+                )
+                
+                if not daemon:
+                    return 1 if failed else 0
+                
+                # 달이 바뀌었으면 사이트별로 지난 기록을 보관 DB로 이동
+                for db in databases:
+                    await asyncio.to_thread(db.archive_if_due)
+                
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+        
+        finally:
+            for state in states:
+                await state['scraper'].stop()
+            await browser.close()
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='Real Parking 다중 사이트 입출차 모니터링')
+    parser.add_argument('--workers', type=int, default=config.MULTI_SITE_WORKERS,
+                        help=f'동시에 조회할 사이트 수 (기본값: {config.MULTI_SITE_WORKERS})')
+    parser.add_argument('--daemon', action='store_true', help='주기적으로 조회 (데몬 모드)')
+    parser.add_argument('--interval', type=int, default=config.POLL_INTERVAL,
+                        help=f'데몬 모드 조회 간격 (초, 기본값: {config.POLL_INTERVAL})')
+    parser.add_argument('--full-scan', action='store_true',
+                        help='증분 조회를 사용하지 않고 오늘의 전체 기록을 조회')
+    parser.add_argument('--notification', action='store_true', help='알림 기능 활성화')
+    parser.add_argument('--broadcaster', choices=['assistant', 'cast'], default='cast',
+                        help='방송 타입 선택 (assistant: Google Assistant SDK, cast: Chromecast)')
+    args = parser.parse_args()
+    
+    try:
+        sites = load_sites()
+        return asyncio.run(monitor_sites(
+            sites, args.workers, args.daemon, args.interval, not args.full_scan,
+            args.notification, args.broadcaster
+        ))
+    
+    except KeyboardInterrupt:
+        system_logger.info("사용자에 의해 프로그램 중단")
+        return 0
+    
+    except Exception as e:
+        system_logger.error(f"다중 사이트 모니터링 중 오류 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,7 @@
 알림 관리 모듈
 입출차 변경을 감지하고 Google Home으로 안내방송을 전송합니다.
 """
+import threading
 from typing import List, Dict, Any, Optional
 from database import ParkingDatabase
 from change_detector import ChangeDetector
@@ -26,23 +27,29 @@ def is_resident_car(car_number: str) -> bool:
 class NotificationManager:
     """알림 관리자"""
     
-    def __init__(self, db: ParkingDatabase, broadcaster_type: str = 'cast'):
+    def __init__(self, db: ParkingDatabase, broadcaster_type: str = 'cast', broadcaster=None,
+                 broadcast_lock: Optional[threading.Lock] = None):
         """
         Args:
             db: 데이터베이스 인스턴스
             broadcaster_type: 방송 타입 ('assistant' 또는 'cast')
+            broadcaster: 공유할 방송기 (여러 사이트에서 하나의 방송기 사용 시, 초기화된 상태여야 함)
+            broadcast_lock: 방송기를 공유하는 알림 관리자끼리 공유할 잠금 (알림을 여러 스레드에서 처리할 때 사용)
         """
         self.db = db
         self.detector = ChangeDetector(db)
         self.current_points = 0  # 현재 포인트 저장
         
         # 방송기 선택
-        if broadcaster_type == 'assistant':
+        if broadcaster is not None:
+            self.broadcaster = broadcaster
+        elif broadcaster_type == 'assistant':
             self.broadcaster = GoogleAssistantBroadcaster()
         else:
             self.broadcaster = GoogleHomeCastBroadcaster()
         
         self.broadcaster_type = broadcaster_type
+        self.broadcast_lock = broadcast_lock or threading.Lock()
     
     def set_current_points(self, points: int):
         """
@@ -82,53 +89,72 @@ class NotificationManager:
         """
         새로운 기록 처리 및 알림 전송
         
+        변경 감지 시 기록이 데이터베이스에 저장됩니다.
+        
         Args:
             new_records: 최신 조회된 기록 리스트
         
+        Returns:
+            처리 결과 통계 {'entries': 입차 수, 'exits': 출차 수, 'notifications': 알림 수}
+        """
+        try:
+            # 변경 감지 (저장 포함)
+            new_entries, new_exits = self.detector.detect_changes(new_records)
+        
+        except Exception as e:
+            system_logger.error(f"변경 감지 중 오류: {str(e)}")
+            return {'entries': 0, 'exits': 0, 'notifications': 0}
+        
+        return self.notify_changes(new_entries, new_exits)
+    
+    def notify_changes(self, new_entries: List[Dict[str, Any]], new_exits: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        감지된 입차 및 출차 알림 전송
+        
+        Args:
+            new_entries: 새로운 입차 리스트
+            new_exits: 새로운 출차 리스트
+        
         Returns:
             처리 결과 통계 {'entries': 입차 수, 'exits': 출차 수, 'notifications': 알림 수}
         """
         stats = {
-            'entries': 0,
-            'exits': 0,
+            'entries': len(new_entries),
+            'exits': len(new_exits),
             'notifications': 0
         }
         
         try:
-            # 변경 감지
-            new_entries, new_exits = self.detector.detect_changes(new_records)
-            
-            stats['entries'] = len(new_entries)
-            stats['exits'] = len(new_exits)
-            
-            # 입차 알림
-            for entry in new_entries:
-                car_number, name, location = self.detector.get_entry_info(entry)
-                is_resident = is_resident_car(car_number)
-                
-                car_type = "세대 차량" if is_resident else "방문차량"
-                system_logger.info(f"입차 알림 전송: [{car_type}] {car_number} - {name}")
+            # 방송기를 공유하는 다른 사이트의 알림과 겹치지 않도록 한 번에 하나씩 재생
+            with self.broadcast_lock:
+                # 입차 알림
+                for entry in new_entries:
+                    car_number, name, location = self.detector.get_entry_info(entry)
+                    is_resident = is_resident_car(car_number)
+                    
+                    car_type = "세대 차량" if is_resident else "방문차량"
+                    system_logger.info(f"입차 알림 전송: [{car_type}] {car_number} - {name}")
+                    
+                    if self.broadcaster.broadcast_entry(car_number, name, location, is_resident):
+                        stats['notifications'] += 1
                 
-                if self.broadcaster.broadcast_entry(car_number, name, location, is_resident):
-                    stats['notifications'] += 1
-            
-            # 출차 알림
-            for exit_record in new_exits:
-                car_number, name, location = self.detector.get_exit_info(exit_record)
-                is_resident = is_resident_car(car_number)
+                # 출차 알림
+                for exit_record in new_exits:
+                    car_number, name, location = self.detector.get_exit_info(exit_record)
+                    is_resident = is_resident_car(car_number)
+                    
+                    car_type = "세대 차량" if is_resident else "방문차량"
+                    system_logger.info(f"출차 알림 전송: [{car_type}] {car_number} - {name}")
+                    
+                    # 방문차량 출차 시 포인트 정보 포함
+                    if self.broadcaster.broadcast_exit(car_number, name, location, is_resident, 
+                                                      self.current_points if not is_resident else 0):
+                        stats['notifications'] += 1
                 
-                car_type = "세대 차량" if is_resident else "방문차량"
-                system_logger.info(f"출차 알림 전송: [{car_type}] {car_number} - {name}")
+                system_logger.success(
+                    f"알림 처리 완료 - 입차: {stats['entries']}건, 출차: {stats['exits']}건, 알림: {stats['notifications']}건"
+                )
                 
-                # 방문차량 출차 시 포인트 정보 포함
-                if self.broadcaster.broadcast_exit(car_number, name, location, is_resident, 
-                                                  self.current_points if not is_resident else 0):
-                    stats['notifications'] += 1
-            
-            system_logger.success(
-                f"알림 처리 완료 - 입차: {stats['entries']}건, 출차: {stats['exits']}건, 알림: {stats['notifications']}건"
-            )
-            
             return stats
         
         except Exception as e:
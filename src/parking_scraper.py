@@ -2,47 +2,752 @@
 Real Parking 웹 스크래핑 모듈
 Playwright를 사용하여 입출차 정보를 수집합니다.
 """
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from urllib.parse import urlparse
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
 import config
 from logger import scraping_logger
+from sites import default_site
+from table_parser import (
+    ScrapeCursor, row_to_record, parse_inout_table, records_from_json, parse_search_form, detect_total_pages,
+    find_page_field
+)
+from http_client import session_from_cookies, fetch_remaining_pages, merge_pages
+from browser_watchdog import BrowserWatchdog, browser_memory_mb
+from browser_server import get_server_endpoint, read_server_info, restart_server
+from fixtures import (
+    FIXTURE_USER_ID, FIXTURE_PASSWORD, fixture_paths, save_fixture_meta, load_fixture_meta, scrub_credentials
+)
 
 
-class ParkingScraper:
+# 검색 준비 스크립트 (인자: [시작 날짜, 종료 날짜])
+# 조회 날짜를 입력하고 테이블의 행 추가/삭제나 내용 변경을 감시 (변경되면 테이블이 갱신된 것으로 판단)
+# 기존 행이 없던 경우나 행을 그대로 두고 내용만 바꾸는 경우도 감지함
+PREPARE_SEARCH_SCRIPT = '''([startDate, endDate]) => {
+    const inputs = document.querySelectorAll('input[type="text"]');
+    if (inputs.length >= 3) {
+        inputs[1].value = startDate;
+        inputs[2].value = endDate;
+    }
+    
+    const inTable = node => {
+        const element = node && (node.nodeType === 1 ? node : node.parentElement);
+        return !!element && (element.matches('table, tbody, tr') || !!element.closest('tbody'));
+    };
+    window.__searchPending = true;
+    window.__searchRendered = false;
+    new MutationObserver((mutations, observer) => {
+        if (mutations.some(m => inTable(m.target) || [...m.addedNodes, ...m.removedNodes].some(inTable))) {
+            window.__searchRendered = true;
+            observer.disconnect();
+        }
+    }).observe(document.body, {childList: true, subtree: true, characterData: true});
+}'''
+
+# 검색 후 테이블 갱신 여부 (폼 전송으로 새 문서가 열렸으면 감시 표시가 없으므로 갱신된 것으로 판단)
+ROWS_REFRESHED_SCRIPT = '''() => !window.__searchPending || window.__searchRendered'''
+
+# 입출차 조회 페이지 경로와 페이지 요소 선택자
+INOUT_LIST_PATH = '/pay/inoutList'
+SEARCH_RESOURCE_TYPES = ('document', 'xhr', 'fetch')  # 검색 결과를 받는 요청 종류 (폼 전송 또는 XHR)
+SEARCH_BUTTON_SELECTOR = 'button img[src*="bt_search"]'
+LOGIN_ID_SELECTOR = '#userid'
+
+# 로그인 스크립트 (인자: [아이디, 비밀번호], 사이트의 jQuery로 값 설정)
+FILL_LOGIN_SCRIPT = '''([userId, password]) => {
+    $('#userid').val(userId);
+    $('#userpw').val(password);
+    $('#autoLogin').prop('checked', true);
+}'''
+
+SUBMIT_LOGIN_SCRIPT = '''() => {
+    $('#btn_login').click();
+}'''
+
+# 페이지 추출 스크립트 (인자: {cursor: 증분 조회 기준 또는 null, rows: 테이블 행 추출 여부})
+# 한 번의 호출로 포인트 정보, 테이블 행, 전체 페이지 수를 반환하며,
+# 행은 RECORD_COLUMNS 순서의 셀 텍스트 배열로 반환하여 전송량을 줄임
+# (textContent는 innerText와 달리 레이아웃 계산이 필요 없고 숨겨진 드롭다운 메뉴의 텍스트도 포함)
+EXTRACT_SCRIPT = '''({cursor, rows: includeRows}) => {
+    const clean = (node) => (node ? node.textContent.replace(/\\s+/g, ' ').trim() : '');
+    
+    // 포인트 정보 (예: "기본 선입 포인트 : 6000" "구매 선입 포인트 : 0", 찾지 못하면 null)
+    const bodyText = document.body ? document.body.textContent : '';
+    const basicMatch = bodyText.match(/기본 선입 포인트[\\s:]+([0-9]+)/);
+    const purchaseMatch = bodyText.match(/구매 선입 포인트[\\s:]+([0-9]+)/);
+    const points = (basicMatch || purchaseMatch)
+        ? [basicMatch ? parseInt(basicMatch[1]) : 0, purchaseMatch ? parseInt(purchaseMatch[1]) : 0]
+        : null;
+    
+    // 전체 페이지 수 (페이지 영역 링크 번호 중 가장 큰 값, table_parser.detect_total_pages와 동일)
+    let totalPages = 1;
+    for (const link of document.querySelectorAll('[class*="pag"] a')) {
+        const text = clean(link);
+        if (/^\\d+$/.test(text)) totalPages = Math.max(totalPages, parseInt(text));
+        for (const attribute of ['href', 'onclick']) {
+            const value = link.getAttribute(attribute) || '';
+            for (const match of value.matchAll(/\\((\\d+)\\)|page\\w*=(\\d+)/gi)) {
+                totalPages = Math.max(totalPages, parseInt(match[1] || match[2]));
+            }
+        }
+    }
+    
+    const rows = [];
+    const openKeys = new Set(cursor ? cursor.openKeys : []);
+    let scanned = 0;
+    let stopped = false;
+    let previousEntry = null;
+    
+    for (const row of (includeRows ? document.querySelectorAll('tbody tr') : [])) {
+        const cells = Array.from(row.querySelectorAll('td'), clean);
+        
+        // 11개의 컬럼이 있고 차량번호와 입차시간이 있는 행만 처리 (정상 데이터)
+        if (cells.length !== 11 || !cells[1] || !cells[6]) continue;
+        const entryTime = cells[6];
+        
+        // 증분 조회: 새 입차 또는 출차 정보가 생긴 미출차 기록만 처리
+        if (cursor && cursor.highWater) {
+            scanned++;
+            const previous = previousEntry;
+            previousEntry = entryTime;
+            
+            if (entryTime < cursor.highWater) {
+                if (openKeys.has(cells[1] + '|' + entryTime)) {
+                    if (!cells[8]) continue;
+                } else if (entryTime < cursor.cutoff && previous !== null && previous >= entryTime) {
+                    stopped = true;
+                    break;
+                } else {
+                    continue;
+                }
+            }
+        }
+        
+        rows.push(cells);
+    }
+    
+    return {points: points, rows: rows, scanned: scanned, stopped: stopped, totalPages: totalPages};
+}'''
+
+
+def should_block_request(url: str, resource_type: str, site_url: Optional[str] = None) -> bool:
+    """
+    요청 차단 여부 판단
+    
+    Args:
+        url: 요청 URL
+        resource_type: 요청 리소스 타입 (image, font, script 등)
+        site_url: 조회 중인 사이트 URL (기본값: config.PARKING_URL)
+    
+    Returns:
+        차단 여부 (허용 목록에 있으면 항상 허용)
+    """
+    if any(pattern in url for pattern in config.RESOURCE_ALLOWLIST):
+        return False
+    
+    if any(pattern in url for pattern in config.BLOCKED_URL_PATTERNS):
+        return True
+    
+    if resource_type in config.BLOCKED_RESOURCE_TYPES:
+        return True
+    
+    # 다른 도메인의 스크립트 차단 (로그인/검색에 필요한 사이트 스크립트는 허용)
+    if resource_type == 'script':
+        return urlparse(url).hostname != urlparse(site_url or config.PARKING_URL).hostname
+    
+    return False
+
+
+def parse_search_body(content_type: str, body: str, cursor: Optional[ScrapeCursor] = None):
+    """
+    검색 응답 본문 파싱
+    
+    Args:
+        content_type: 응답 Content-Type
+        body: 응답 본문
+        cursor: 증분 조회 기준
+    
+    Returns:
+        (파싱된 데이터 리스트, 파싱 방식) - 데이터는 DOM 파싱이 필요하면 None
+    """
+    if 'json' in content_type:
+        data = records_from_json(json.loads(body))
+        source = 'json'
+        if data and cursor:
+            data = cursor.filter(data)
+    else:
+        data = parse_inout_table(body, cursor)
+        source = 'html'
+    
+    # 빈 결과는 스크립트가 테이블을 채우는 경우일 수 있으므로 DOM으로 확인
+    # (증분 조회로 모든 행을 건너뛴 경우는 제외)
+    if not data and not (cursor and cursor.scanned):
+        return None, source
+    return data, source
+
+
+def records_from_extract(extract: Dict[str, Any], cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+    """
+    EXTRACT_SCRIPT의 행 배열을 입출차 기록으로 변환하고 증분 조회 기준에 반영
+    
+    Returns:
+        파싱된 데이터 리스트
+    """
+    data = [record for record in map(row_to_record, extract['rows']) if record]
+    if cursor:
+        cursor.scanned += extract['scanned']
+        cursor.kept += len(data)
+        cursor.stopped = cursor.stopped or extract['stopped']
+    return data
+
+
+def points_from_extract(extract: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """
+    EXTRACT_SCRIPT의 포인트 정보 변환
+    
+    Returns:
+        포인트 정보 딕셔너리 {'basic': 기본 포인트, 'purchase': 구매 포인트} (페이지에 없으면 None)
+    """
+    if not extract.get('points'):
+        return None
+    basic, purchase = extract['points']
+    return {'basic': basic, 'purchase': purchase}
+
+
+class BaseParkingScraper:
+    """
+    동기/비동기 스크래퍼 공통 부분
+    
+    Playwright 호출 방식(동기/비동기)과 관계없는 상태, URL, 로그인 세션 파일, 검색 응답 파싱,
+    여러 페이지 처리를 모아 두고, 하위 클래스는 페이지를 직접 다루는 호출만 구현합니다.
+    """
+    
+    def __init__(self, site: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            site: 조회할 사이트 설정 (기본값: .env의 단일 사이트)
+        """
+        self.site = site or default_site()
+        self.home_url = self.site['url']  # 로그인 후 이동한 페이지 (포인트 정보 표시)
+        self.session_restored = False
+        self.is_logged_in = False
+        self.points_info: Dict[str, int] = {}
+        self.step_timings: Dict[str, float] = {}  # 단계별 소요 시간 (밀리초)
+        self.last_parse_source = ''  # 마지막 조회의 파싱 방식 (json, html, dom)
+        self.last_search_html = ''  # 마지막 검색 응답 HTML (페이지 수 확인용)
+        self.last_total_pages = 1  # 마지막으로 추출한 검색 결과 전체 페이지 수
+        self.request_stats: Dict[str, Any] = {}
+        self.reset_request_stats()
+    
+    def reset_request_stats(self):
+        """요청 차단 통계 초기화 (조회 1회 단위로 집계)"""
+        self.request_stats = {
+            'blocked_requests': 0,
+            'blocked_by_type': {},
+            'loaded_requests': 0,
+            'loaded_bytes': 0
+        }
+    
+    def _should_block(self, request) -> bool:
+        """
+        요청 차단 여부 판단 (차단하면 통계에 집계)
+        
+        Args:
+            request: Playwright 요청 객체
+        
+        Returns:
+            차단 여부 (허용 목록에 있으면 항상 허용)
+        """
+        if not should_block_request(request.url, request.resource_type, self.site['url']):
+            return False
+        
+        resource_type = request.resource_type
+        blocked_by_type = self.request_stats['blocked_by_type']
+        blocked_by_type[resource_type] = blocked_by_type.get(resource_type, 0) + 1
+        self.request_stats['blocked_requests'] += 1
+        return True
+    
+    def _on_response(self, response):
+        """허용된 요청의 응답 크기 집계"""
+        self.request_stats['loaded_requests'] += 1
+        try:
+            self.request_stats['loaded_bytes'] += int(response.headers.get('content-length', 0))
+        except ValueError:
+            pass
+    
+    @contextmanager
+    def _timed(self, step: str):
+        """
+        스크래퍼 단계의 실제 소요 시간 기록
+        
+        Args:
+            step: 단계 이름 (login, navigate, search, parse 등)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.step_timings[step] = round((time.perf_counter() - started) * 1000, 1)
+    
+    def _inout_url(self) -> str:
+        """입출차 조회 페이지 URL"""
+        return f"{self.site['url'].rstrip('/')}{INOUT_LIST_PATH}"
+    
+    def _is_search_response(self, response) -> bool:
+        """
+        입출차 검색 결과 응답인지 여부
+        
+        경로가 입출차 조회 페이지와 같은 문서/XHR 요청의 최종 응답만 해당하며,
+        같은 경로 아래의 스크립트 등 다른 리소스와 리다이렉트 응답은 제외합니다.
+        """
+        return (urlparse(response.url).path.endswith(INOUT_LIST_PATH)
+                and response.request.resource_type in SEARCH_RESOURCE_TYPES
+                and not 300 <= response.status < 400)
+    
+    def _session_state_path(self) -> Optional[Path]:
+        """로그인 세션 파일 경로 (저장된 세션을 사용하지 않으면 None)"""
+        if not config.USE_SAVED_SESSION:
+            return None
+        return self.site['session_state_path']
+    
+    def _saved_storage_state(self) -> Optional[str]:
+        """컨텍스트에 불러올 저장된 로그인 세션 파일 (없으면 None)"""
+        path = self._session_state_path()
+        return str(path) if path and path.exists() else None
+    
+    def _login_credentials(self) -> List[str]:
+        """로그인 정보 [아이디, 비밀번호]"""
+        return [self.site['user_id'], self.site['password']]
+    
+    def _accept_session_probe(self, session_valid: bool) -> bool:
+        """
+        저장된 세션 확인 결과 반영
+        
+        Args:
+            session_valid: 입출차 조회 페이지에 접근 가능했는지 여부
+        
+        Returns:
+            로그인을 건너뛸 수 있는지 여부
+        """
+        if session_valid:
+            # 세션 확인에서 열린 입출차 조회 페이지에도 포인트 정보가 표시됨
+            self._mark_logged_in(self._inout_url())
+            scraping_logger.success("저장된 로그인 세션 재사용")
+            return True
+        
+        if self.session_restored:
+            scraping_logger.info("저장된 로그인 세션 만료 - 다시 로그인합니다")
+            self.session_restored = False
+        return False
+    
+    def _mark_logged_in(self, url: str):
+        """로그인 상태와 포인트 정보를 조회할 페이지 기록"""
+        self.is_logged_in = True
+        self.home_url = url
+    
+    def _is_logged_in_url(self, current_url: str) -> bool:
+        """로그인 버튼 클릭 후 URL이 로그인 페이지를 벗어났는지 여부"""
+        return current_url != self.site['url'] and not current_url.endswith('/')
+    
+    def _apply_search_body(self, content_type: str, body: str,
+                           cursor: Optional[ScrapeCursor] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        검색 응답 본문 파싱 결과 반영
+        
+        Args:
+            content_type: 응답 Content-Type
+            body: 응답 본문
+            cursor: 증분 조회 기준
+        
+        Returns:
+            파싱된 데이터 리스트 (결과가 비어 있어 DOM 파싱이 필요하면 None)
+        """
+        if 'html' in content_type:
+            self.last_search_html = body
+        data, self.last_parse_source = parse_search_body(content_type, body, cursor)
+        return data
+    
+    def _apply_extract(self, extract: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        EXTRACT_SCRIPT 결과의 포인트 정보와 전체 페이지 수 반영
+        
+        Returns:
+            포인트 정보 (페이지에 없으면 None, 이전 값 유지)
+        """
+        points_info = points_from_extract(extract)
+        if points_info:
+            self.points_info = points_info
+        self.last_total_pages = extract['totalPages']
+        return points_info
+    
+    def _remaining_total_pages(self, cursor: Optional[ScrapeCursor] = None) -> int:
+        """
+        2페이지 이후 조회가 필요한 경우 전체 페이지 수
+        
+        Returns:
+            전체 페이지 수 (첫 페이지에서 증분 조회가 끝났거나 한 페이지뿐이면 1)
+        """
+        if cursor and cursor.stopped:
+            return 1
+        if self.last_search_html:
+            return detect_total_pages(self.last_search_html)
+        return self.last_total_pages
+    
+    def _pages_search_form(self, html: str, page_url: str) -> Dict[str, Any]:
+        """
+        2페이지 이후를 조회할 검색 폼
+        
+        Args:
+            html: 검색 응답 HTML 또는 현재 페이지 HTML
+            page_url: 현재 페이지 URL
+        
+        Raises:
+            ValueError: 검색 폼을 찾을 수 없음
+        """
+        search_form = parse_search_form(html, page_url)
+        if not search_form:
+            raise ValueError("검색 폼을 찾을 수 없습니다")
+        return search_form
+    
+    def _merge_remaining_pages(self, data: List[Dict[str, Any]], rest: List[Dict[str, Any]], total_pages: int,
+                               cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+        """
+        첫 페이지 데이터와 2페이지 이후 데이터 병합
+        
+        Returns:
+            전체 페이지 데이터 (페이지 순서 유지)
+        """
+        scraping_logger.info(f"{total_pages}페이지 조회 완료 ({self.step_timings['pages']}ms)")
+        if cursor:
+            rest = cursor.filter(rest)
+        return merge_pages(data, rest)
+    
+    def _resolve_dates(self, start_date: Optional[str], end_date: Optional[str]):
+        """
+        조회 기간 기본값 설정
+        
+        Returns:
+            (시작 날짜, 종료 날짜) - 시작 날짜 기본값은 오늘, 종료 날짜 기본값은 시작 날짜
+        """
+        if not start_date:
+            start_date = datetime.now().strftime(config.DATE_FORMAT)
+        if not end_date:
+            end_date = start_date
+        return start_date, end_date
+
+
+class ParkingScraper(BaseParkingScraper):
     """Real Parking 웹사이트 스크래퍼"""
     
-    def __init__(self):
+    def __init__(self, site: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            site: 조회할 사이트 설정 (기본값: .env의 단일 사이트)
+        """
+        super().__init__(site)
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.is_logged_in = False
-        self.points_info: Dict[str, int] = {}
+        self.fixture_mode = config.SCRAPER_FIXTURE_MODE  # '', 'record' 또는 'replay'
+        self.fixture_dates: Optional[tuple] = None  # 녹화된 검색 기간 (시작 날짜, 종료 날짜)
+        self.watchdog = BrowserWatchdog()
+        self.browser_started_at = 0.0  # 브라우저 시작 시각 (time.monotonic)
+        self.shared_browser = False  # 공유 브라우저 서버에 연결했는지 여부
+        self.context_started_at = 0.0  # 현재 컨텍스트 시작 시각 (time.monotonic)
+        self.standby: Optional[tuple] = None  # 미리 준비한 대기 컨텍스트 (컨텍스트, 페이지, 시작 시각)
+        self.resource_stats: Dict[str, Any] = {}  # 마지막 점검 시 브라우저 메모리 및 사용 시간
+        self.shared_reconnect_failed = False  # 응답이 없어 공유 브라우저 서버에 다시 연결했지만 실패했는지 여부
     
     def start(self):
         """브라우저 시작"""
         try:
             self.playwright = sync_playwright().start()
-            self.browser = self.playwright.chromium.launch(headless=config.HEADLESS)
-            self.page = self.browser.new_page()
-            self.page.set_default_timeout(config.TIMEOUT)
+            self.browser = self._launch_browser()
+            self.browser_started_at = time.monotonic()
+            
+            # 저장된 로그인 세션이 있으면 컨텍스트에 불러오기
+            storage_state = self._saved_storage_state()
+            self.context, self.page = self._new_context(storage_state)
+            self.context_started_at = time.monotonic()
+            self.session_restored = storage_state is not None
             scraping_logger.info("브라우저 시작 완료")
         except Exception as e:
             scraping_logger.error(f"브라우저 시작 실패: {str(e)}")
             raise
     
+    def _launch_browser(self) -> Browser:
+        """
+        브라우저 실행 (공유 브라우저 서버가 실행 중이면 연결하여 컨텍스트만 새로 생성)
+        
+        Returns:
+            브라우저 인스턴스
+        """
+        endpoint = get_server_endpoint()
+        if endpoint:
+            try:
+                browser = self.playwright.chromium.connect(endpoint)
+                self.shared_browser = True
+                # 서버가 실행한 Chromium 프로세스의 메모리 측정 및 서버 재시작에 사용할 서버 PID 기록
+                self.watchdog.root_pid = (read_server_info() or {}).get('pid')
+                scraping_logger.info(f"공유 브라우저 서버 연결: {endpoint}")
+                return browser
+            except Exception as e:
+                scraping_logger.warning(f"공유 브라우저 서버 연결 실패 - 브라우저를 직접 실행합니다: {str(e)}")
+        
+        self.shared_browser = False
+        self.watchdog.root_pid = None
+        return self.playwright.chromium.launch(headless=config.HEADLESS)
+    
+    def _new_context(self, storage_state=None):
+        """
+        요청 차단 및 녹화/재생 설정을 적용한 컨텍스트와 페이지 생성
+        
+        Args:
+            storage_state: 불러올 로그인 세션 (파일 경로 또는 storage_state() 결과)
+        
+        Returns:
+            (컨텍스트, 페이지)
+        """
+        context_options = {}
+        har_path, _ = fixture_paths()
+        if self.fixture_mode == 'record':
+            config.FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+            context_options = {'record_har_path': str(har_path), 'record_har_content': 'embed'}
+        
+        context = self.browser.new_context(storage_state=storage_state, **context_options)
+        
+        # 이미지, 폰트, 스타일시트, 분석 스크립트 차단
+        if config.BLOCK_RESOURCES:
+            context.route('**/*', self._route_request)
+        context.on('response', self._on_response)
+        
+        # 재생: 나중에 등록한 라우트가 먼저 처리되므로 모든 요청이 녹화 파일에서 응답
+        if self.fixture_mode == 'replay':
+            self._start_replay(context, har_path)
+        
+        page = context.new_page()
+        page.set_default_timeout(config.TIMEOUT)
+        return context, page
+    
+    def _start_replay(self, context: BrowserContext, har_path):
+        """
+        녹화된 HAR 파일로 모든 요청에 응답 (녹화되지 않은 요청은 중단)
+        
+        Args:
+            context: 재생할 컨텍스트
+            har_path: HAR 파일 경로
+        """
+        if not har_path.exists():
+            raise FileNotFoundError(f"녹화 파일이 없습니다: {har_path} (SCRAPER_FIXTURE_MODE=record로 먼저 녹화)")
+        
+        context.route_from_har(str(har_path), not_found='abort')
+        
+        meta = load_fixture_meta(fixture_paths()[1])
+        if meta.get('search_dates'):
+            self.fixture_dates = tuple(meta['search_dates'])
+        scraping_logger.info(f"녹화 파일 재생: {har_path} (녹화 시각: {meta.get('recorded_at', '알 수 없음')})")
+    
+    def _finish_recording(self):
+        """녹화 정보 저장 및 녹화 파일의 로그인 정보 치환 (컨텍스트 종료 후 호출)"""
+        har_path, meta_path = fixture_paths()
+        if not har_path.exists():
+            return
+        
+        save_fixture_meta(meta_path, self.fixture_dates)
+        scrub_credentials(har_path)
+        scraping_logger.info(f"녹화 완료: {har_path}")
+    
+    def _route_request(self, route):
+        """요청 라우팅 (차단 대상은 중단, 나머지는 그대로 진행)"""
+        if self._should_block(route.request):
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _session_state_path(self) -> Optional[Path]:
+        """로그인 세션 파일 경로 (녹화/재생 중에는 로그인 과정까지 포함하도록 사용하지 않음)"""
+        if self.fixture_mode:
+            return None
+        return super()._session_state_path()
+    
+    def _login_credentials(self) -> List[str]:
+        """로그인 정보 (재생 중에는 녹화 파일에 저장된 로그인 정보 사용)"""
+        if self.fixture_mode == 'replay':
+            return [FIXTURE_USER_ID, FIXTURE_PASSWORD]
+        return super()._login_credentials()
+    
     def stop(self):
-        """브라우저 종료"""
+        """브라우저 종료 (강제 종료된 브라우저도 남은 자원을 모두 정리)"""
+        if self.standby:
+            self._close_quietly(self.standby[0].close)
+            self.standby = None
+        if self.context:
+            # 녹화 중이면 컨텍스트 종료 시 HAR 파일이 기록됨
+            self._close_quietly(self.context.close)
+            if self.fixture_mode == 'record':
+                self._finish_recording()
+        if self.browser:
+            self._close_quietly(self.browser.close)
+        if hasattr(self, 'playwright'):
+            self._close_quietly(self.playwright.stop)
+        
+        self.page = None
+        self.context = None
+        self.browser = None
+        scraping_logger.info("브라우저 종료 완료")
+    
+    def _close_quietly(self, close):
+        """종료 함수 실행 (실패해도 나머지 정리를 계속하도록 기록만 함)"""
         try:
-            if self.page:
-                self.page.close()
-            if self.browser:
-                self.browser.close()
-            if hasattr(self, 'playwright'):
-                self.playwright.stop()
-            scraping_logger.info("브라우저 종료 완료")
+            close()
         except Exception as e:
             scraping_logger.error(f"브라우저 종료 중 오류: {str(e)}")
     
+    def is_browser_alive(self) -> bool:
+        """
+        브라우저 연결 상태 확인
+        
+        Returns:
+            연결 여부 (감시 중 강제 종료되었거나 연결이 끊기면 False)
+        """
+        try:
+            return bool(self.browser) and self.browser.is_connected() and not self.watchdog.fired
+        except Exception:
+            return False
+    
+    def restart_browser(self, reason: str = '') -> bool:
+        """
+        브라우저 전체 재시작 후 저장된 세션으로 다시 로그인
+        
+        공유 브라우저 서버는 다른 실행 파일도 사용하므로, 이 프로세스의 작업이 응답하지 않아 드라이버를
+        종료한 경우(감시 중 강제 종료)에는 먼저 같은 서버에 다시 연결합니다.
+        서버 연결이 끊겼거나, 다시 연결했지만 실패했거나, 서버 메모리가 한도를 넘은 경우에만
+        서버를 새로 시작한 후 연결합니다.
+        
+        Args:
+            reason: 재시작 사유 (로그 기록용)
+        
+        Returns:
+            입출차 조회 페이지까지 준비 성공 여부
+        """
+        scraping_logger.warning(f"브라우저 재시작{f' ({reason})' if reason else ''}")
+        
+        reconnect = self.shared_browser and self.watchdog.fired and not self.shared_reconnect_failed
+        if self.is_browser_alive():
+            self.save_session()
+        self.stop()
+        
+        if self.shared_browser and not reconnect:
+            scraping_logger.warning(f"공유 브라우저 서버(PID {self.watchdog.root_pid})를 재시작합니다 - 서버를 사용하는 다른 실행 파일도 다시 연결합니다")
+            restart_server(self.watchdog.root_pid)
+        
+        self.is_logged_in = False
+        self.watchdog.fired = False
+        self.start()
+        
+        with self.watchdog.guard('restart', config.WATCHDOG_TIMEOUT):
+            ready = self.ensure_login() and self.navigate_to_inout_list()
+        
+        # 같은 서버에 다시 연결해도 준비하지 못하면 다음 재시작에서 서버를 재시작
+        self.shared_reconnect_failed = reconnect and not ready
+        return ready
+    
+    def _prepare_standby(self) -> bool:
+        """
+        대기 컨텍스트 준비
+        
+        현재 컨텍스트의 로그인 세션을 복사한 새 컨텍스트에서 입출차 조회 페이지까지 미리 열어 두어,
+        컨텍스트를 교체할 때 조회가 지연되지 않도록 합니다.
+        
+        Returns:
+            준비 성공 여부
+        """
+        context = None
+        try:
+            context, page = self._new_context(self.context.storage_state())
+            page.goto(self._inout_url(), wait_until='domcontentloaded')
+            page.wait_for_selector(SEARCH_BUTTON_SELECTOR, state='attached')
+            
+            self.standby = (context, page, time.monotonic())
+            scraping_logger.info("대기 컨텍스트 준비 완료")
+            return True
+        
+        except Exception as e:
+            scraping_logger.warning(f"대기 컨텍스트 준비 실패: {str(e)}")
+            if context:
+                self._close_quietly(context.close)
+            return False
+    
+    def recycle_context(self, reason: str = '') -> bool:
+        """
+        현재 컨텍스트를 대기 컨텍스트로 교체하고 기존 컨텍스트 종료
+        
+        Args:
+            reason: 교체 사유 (로그 기록용)
+        
+        Returns:
+            교체 성공 여부
+        """
+        if not self.standby and not self._prepare_standby():
+            return False
+        
+        old_context = self.context
+        self.context, self.page, self.context_started_at = self.standby
+        self.standby = None
+        self._close_quietly(old_context.close)
+        
+        scraping_logger.info(f"컨텍스트 교체 완료{f' ({reason})' if reason else ''}")
+        return True
+    
+    def maintain(self) -> str:
+        """
+        브라우저 메모리 및 사용 시간 점검 (조회 사이의 여유 시간에 호출)
+        
+        - 브라우저 메모리 또는 사용 시간이 한도를 넘으면 브라우저 재시작
+        - 컨텍스트 메모리 또는 사용 시간이 한도를 넘으면 대기 컨텍스트로 교체
+        - 한도에 가까워지면 대기 컨텍스트를 미리 준비
+        
+        Returns:
+            수행한 작업 ('browser', 'context', 'standby' 또는 '')
+        """
+        if not self.browser or self.fixture_mode:
+            return ''
+        
+        now = time.monotonic()
+        memory = browser_memory_mb(self.watchdog.root_pid)
+        context_age = (now - self.context_started_at) / 60
+        browser_age = (now - self.browser_started_at) / 3600
+        self.resource_stats = {
+            'browser_memory_mb': memory,
+            'context_age_minutes': round(context_age, 1),
+            'browser_age_hours': round(browser_age, 2)
+        }
+        
+        # 공유 브라우저 서버는 다른 실행 파일도 사용하므로 메모리가 한도를 넘을 때만 재시작 (사용 시간 기준 재시작 안 함)
+        if memory > config.BROWSER_MEMORY_LIMIT_MB or (not self.shared_browser
+                                                       and browser_age > config.BROWSER_MAX_AGE_HOURS):
+            self.restart_browser(f"메모리 {memory}MB, 사용 시간 {browser_age:.1f}시간")
+            return 'browser'
+        
+        with self.watchdog.guard('recycle', config.WATCHDOG_TIMEOUT):
+            if memory > config.CONTEXT_MEMORY_LIMIT_MB or context_age > config.CONTEXT_MAX_AGE_MINUTES:
+                if self.recycle_context(f"메모리 {memory}MB, 사용 시간 {context_age:.0f}분"):
+                    return 'context'
+                return ''
+            
+            ratio = config.STANDBY_WARMUP_RATIO
+            if not self.standby and (memory > config.CONTEXT_MEMORY_LIMIT_MB * ratio
+                                     or context_age > config.CONTEXT_MAX_AGE_MINUTES * ratio):
+                if self._prepare_standby():
+                    return 'standby'
+        
+        return ''
+    
     def get_points_info(self) -> Dict[str, int]:
         """
         포인트 정보 조회
@@ -51,33 +756,11 @@ class ParkingScraper:
             포인트 정보 딕셔너리 {'basic': 기본 포인트, 'purchase': 구매 포인트}
         """
         try:
-            # 포인트 정보는 오른쪽 상단에 표시됨
-            # 예: "기본 선입 포인트 : 6000" "구매 선입 포인트 : 0"
-            
-            points_info = self.page.evaluate('''() => {
-                const result = {
-                    basic: 0,
-                    purchase: 0
-                };
-                
-                // Settings 드롭다운 메뉴에서 포인트 정보 찾기
-                const dropdownText = document.body.innerText;
-                
-                // 기본 선입 포인트 추출
-                const basicMatch = dropdownText.match(/기본 선입 포인트[\\s:]+([0-9]+)/);
-                if (basicMatch) {
-                    result.basic = parseInt(basicMatch[1]);
-                }
-                
-                // 구매 선입 포인트 추출
-                const purchaseMatch = dropdownText.match(/구매 선입 포인트[\\s:]+([0-9]+)/);
-                if (purchaseMatch) {
-                    result.purchase = parseInt(purchaseMatch[1]);
-                }
-                
-                return result;
-            }''')
+            # 포인트 정보는 오른쪽 상단에 표시됨 (테이블 행은 추출하지 않음)
+            with self._timed('points'):
+                extract = self._extract_page(include_rows=False)
             
+            points_info = points_from_extract(extract) or {'basic': 0, 'purchase': 0}
             self.points_info = points_info
             scraping_logger.info(
                 f"포인트 정보 조회 완료 - 기본: {points_info['basic']}, 구매: {points_info['purchase']}"
@@ -86,7 +769,78 @@ class ParkingScraper:
         
         except Exception as e:
             scraping_logger.error(f"포인트 정보 조회 실패: {str(e)}")
-            return {'basic': 0, 'purchase': 0}
+            self.points_info = {'basic': 0, 'purchase': 0}
+            return self.points_info
+    
+    def _extract_page(self, cursor: Optional[ScrapeCursor] = None, include_rows: bool = True) -> Dict[str, Any]:
+        """
+        한 번의 evaluate로 포인트 정보, 테이블 행, 전체 페이지 수 추출
+        
+        포인트 정보를 찾으면 points_info를, 전체 페이지 수는 last_total_pages를 갱신합니다.
+        
+        Args:
+            cursor: 증분 조회 기준
+            include_rows: 테이블 행 추출 여부
+        
+        Returns:
+            EXTRACT_SCRIPT 결과 {'points', 'rows', 'scanned', 'stopped', 'totalPages'}
+        """
+        extract = self.page.evaluate(
+            EXTRACT_SCRIPT, {'cursor': cursor.to_js() if cursor else None, 'rows': include_rows}
+        )
+        self._apply_extract(extract)
+        return extract
+    
+    def save_session(self):
+        """현재 로그인 세션(쿠키, 로컬 스토리지)을 파일로 저장"""
+        session_state_path = self._session_state_path()
+        if not session_state_path or not self.context:
+            return
+        
+        try:
+            self.context.storage_state(path=str(session_state_path))
+            self.session_restored = True
+            scraping_logger.info(f"로그인 세션 저장 완료: {session_state_path}")
+        except Exception as e:
+            scraping_logger.warning(f"로그인 세션 저장 실패: {str(e)}")
+    
+    def is_session_valid(self) -> bool:
+        """
+        저장된 세션으로 입출차 조회 페이지에 접근 가능한지 확인
+        
+        로그인 페이지로 되돌아가면 세션이 만료된 것으로 판단합니다.
+        
+        Returns:
+            세션 유효 여부
+        """
+        try:
+            self.page.goto(self._inout_url(), wait_until='domcontentloaded')
+            
+            if self.page.query_selector(LOGIN_ID_SELECTOR):
+                return False
+            return self.page.query_selector(SEARCH_BUTTON_SELECTOR) is not None
+        
+        except Exception as e:
+            scraping_logger.warning(f"세션 확인 중 오류: {str(e)}")
+            return False
+    
+    def ensure_login(self) -> bool:
+        """
+        저장된 세션이 유효하면 로그인을 건너뛰고, 아니면 로그인 수행
+        
+        Returns:
+            로그인 상태 여부
+        """
+        session_valid = False
+        if self.session_restored:
+            with self._timed('session_probe'):
+                session_valid = self.is_session_valid()
+        
+        if self._accept_session_probe(session_valid):
+            return True
+        
+        with self._timed('login'):
+            return self.login()
     
     def login(self) -> bool:
         """
@@ -99,42 +853,34 @@ class ParkingScraper:
             scraping_logger.info("로그인 시도 중...")
             
             # 로그인 페이지 접속
-            self.page.goto(config.PARKING_URL)
-            scraping_logger.info(f"로그인 페이지 접속: {config.PARKING_URL}")
+            site_url = self.site['url']
+            self.page.goto(site_url)
+            scraping_logger.info(f"로그인 페이지 접속: {site_url}")
             
             # jQuery를 사용하여 값 설정 및 로그인
-            self.page.evaluate(f'''() => {{
-                $('#userid').val('{config.PARKING_USER_ID}');
-                $('#userpw').val('{config.PARKING_PASSWORD}');
-                $('#autoLogin').prop('checked', true);
-            }}''')
+            self.page.evaluate(FILL_LOGIN_SCRIPT, self._login_credentials())
             
             scraping_logger.info("로그인 정보 입력 완료")
             
-            # 로그인 버튼 클릭
-            self.page.evaluate('''() => {
-                $('#btn_login').click();
-            }''')
-            
-            scraping_logger.info("로그인 버튼 클릭")
+            # 로그인 버튼 클릭 후 페이지 이동 완료까지 대기
+            try:
+                with self._timed('login_wait'):
+                    with self.page.expect_navigation(wait_until='domcontentloaded'):
+                        self.page.evaluate(SUBMIT_LOGIN_SCRIPT)
+                scraping_logger.info(f"로그인 버튼 클릭 ({self.step_timings['login_wait']}ms 대기)")
+            except PlaywrightTimeout:
+                # 페이지 이동 없이 로그인 결과가 표시되는 경우 아래에서 요소로 확인
+                scraping_logger.warning("로그인 후 페이지 이동이 감지되지 않음")
             
-            # 페이지 로드 대기 (최대 10초)
             try:
-                # 5초 대기
-                self.page.wait_for_timeout(5000)
-                
                 # 로그인 성공 확인 (URL 변경 또는 특정 요소 확인)
                 current_url = self.page.url
                 
-                # 콘솔 메시지 확인
-                console_messages = self.page.evaluate('''() => {
-                    return window.console_messages || [];
-                }''')
-                
                 # URL이 변경되었거나 로그인 페이지가 아니면 성공
-                if current_url != config.PARKING_URL and not current_url.endswith('/'):
-                    self.is_logged_in = True
+                if self._is_logged_in_url(current_url):
+                    self._mark_logged_in(current_url)
                     scraping_logger.success(f"로그인 성공 - 현재 URL: {current_url}")
+                    self.save_session()
                     return True
                 
                 # 페이지에 로그인 후 요소가 있는지 확인
@@ -142,8 +888,9 @@ class ParkingScraper:
                     # 사용자 이름이 표시되는 요소 확인
                     user_element = self.page.query_selector('a[href="#"]:has-text("a01045429365")')
                     if user_element:
-                        self.is_logged_in = True
+                        self._mark_logged_in(current_url)
                         scraping_logger.success(f"로그인 성공 - 사용자 요소 확인")
+                        self.save_session()
                         return True
                 except:
                     pass
@@ -170,25 +917,47 @@ class ParkingScraper:
                 scraping_logger.error("로그인이 필요합니다")
                 return False
             
-            inout_url = f"{config.PARKING_URL.rstrip('/')}/pay/inoutList"
-            self.page.goto(inout_url)
-            scraping_logger.info("입출차 조회 페이지 이동 완료")
+            # 세션 확인 과정에서 이미 조회 페이지가 열려 있으면 이동 생략
+            if self.page.url.startswith(self._inout_url()) and self.is_search_ready():
+                scraping_logger.info("입출차 조회 페이지가 이미 열려 있음")
+                return True
+            
+            with self._timed('navigate'):
+                self.page.goto(self._inout_url(), wait_until='domcontentloaded')
+                
+                # 검색 버튼이 나타날 때까지 대기
+                self.page.wait_for_selector(SEARCH_BUTTON_SELECTOR, state='attached')
             
-            # 페이지 로드 대기
-            self.page.wait_for_load_state('networkidle')
+            scraping_logger.info(f"입출차 조회 페이지 이동 완료 ({self.step_timings['navigate']}ms)")
             return True
         
         except Exception as e:
             scraping_logger.error(f"페이지 이동 중 오류: {str(e)}")
             return False
     
-    def get_parking_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+    def is_search_ready(self) -> bool:
+        """
+        입출차 조회 페이지의 검색 버튼이 사용 가능한지 확인
+        
+        Returns:
+            검색 가능 여부 (세션 만료 등으로 페이지를 벗어나면 False)
+        """
+        try:
+            if not self.is_logged_in or not self.page:
+                return False
+            return self.page.query_selector(SEARCH_BUTTON_SELECTOR) is not None
+        except Exception:
+            return False
+    
+    def get_parking_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                         cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
         """
         입출차 데이터 조회
         
         Args:
             start_date: 시작 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
             end_date: 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            cursor: 증분 조회 기준 (지정하면 새 입차 및 출차 정보가 생긴 행만 반환)
         
         Returns:
             입출차 데이터 리스트
@@ -198,37 +967,45 @@ class ParkingScraper:
                 scraping_logger.error("로그인이 필요합니다")
                 return []
             
-            # 기본값 설정
-            if not start_date:
-                start_date = datetime.now().strftime(config.DATE_FORMAT)
-            if not end_date:
-                end_date = start_date
+            start_date, end_date = self._resolve_dates(start_date, end_date)
+            if self.fixture_mode == 'record':
+                self.fixture_dates = (start_date, end_date)
             
             scraping_logger.info(f"입출차 데이터 조회 시작: {start_date} ~ {end_date}")
             
-            # 날짜 설정
-            self.page.evaluate(f'''() => {{
-                const inputs = document.querySelectorAll('input[type="text"]');
-                if (inputs.length >= 3) {{
-                    inputs[1].value = '{start_date}';
-                    inputs[2].value = '{end_date}';
-                }}
-            }}''')
+            # 날짜 설정 및 테이블 변경 감시
+            self.page.evaluate(PREPARE_SEARCH_SCRIPT, [start_date, end_date])
             
             scraping_logger.info("날짜 설정 완료")
             
-            # 검색 버튼 클릭
-            search_button = self.page.query_selector('button img[src*="bt_search"]')
+            # 검색 버튼 클릭 (검색 응답을 바로 파싱할 수 있으면 DOM 파싱 생략)
+            data = None
+            self.last_search_html = ''
+            search_button = self.page.query_selector(SEARCH_BUTTON_SELECTOR)
             if search_button:
-                search_button.click()
-                scraping_logger.info("검색 버튼 클릭")
-                
-                # 결과 로드 대기
-                self.page.wait_for_timeout(2000)
+                with self._timed('search'):
+                    data = self._search_and_wait(search_button, cursor)
+                scraping_logger.info(f"검색 버튼 클릭 ({self.step_timings['search']}ms 대기)")
+            
+            # 응답을 파싱하지 못한 경우 렌더링된 테이블 파싱 (포인트 정보와 페이지 수도 함께 추출)
+            if data is None:
+                self.last_parse_source = 'dom'
+                with self._timed('parse'):
+                    data = self._parse_table_data(cursor)
+            else:
+                with self._timed('points'):
+                    self._extract_page(include_rows=False)
+            
+            # 여러 페이지로 나뉜 경우 나머지 페이지 조회
+            data = self._fetch_remaining_pages(data, start_date, end_date, cursor)
+            
+            if cursor:
+                scraping_logger.info(cursor.summary())
             
-            # 데이터 파싱
-            data = self._parse_table_data()
-            scraping_logger.success(f"입출차 데이터 {len(data)}건 조회 완료")
+            scraping_logger.success(
+                f"입출차 데이터 {len(data)}건 조회 완료 (파싱: {self.last_parse_source})",
+                {'timings': dict(self.step_timings), 'requests': dict(self.request_stats)}
+            )
             
             return data
         
@@ -236,49 +1013,132 @@ class ParkingScraper:
             scraping_logger.error(f"데이터 조회 중 오류: {str(e)}")
             return []
     
-    def _parse_table_data(self) -> List[Dict[str, Any]]:
+    def _search_and_wait(self, search_button,
+                         cursor: Optional[ScrapeCursor] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        검색 버튼 클릭 후 검색 결과 응답을 파싱하고 테이블이 갱신될 때까지 대기
+        
+        검색 결과 응답(JSON 또는 HTML)을 바로 파싱하고, 이후 테이블에서 읽는 행(응답을 파싱하지
+        못한 경우)과 포인트 정보, 페이지 수가 이전 결과가 되지 않도록 테이블이 바뀔 때까지 기다립니다.
+        (폼 전송으로 페이지가 다시 로드되는 경우와 XHR로 테이블만 갱신되는 경우 모두 처리)
+        결과가 이전과 같아 테이블이 바뀌지 않으면 SEARCH_RENDER_TIMEOUT 후 현재 테이블을 사용합니다.
+        
+        Args:
+            search_button: 검색 버튼 요소
+            cursor: 증분 조회 기준
+        
+        Returns:
+            검색 응답에서 파싱한 데이터 리스트 (DOM 파싱이 필요하면 None)
+        """
+        with self.page.expect_response(self._is_search_response) as response_info:
+            search_button.click()
+        
+        with self._timed('parse'):
+            data = self._parse_search_response(response_info.value, cursor)
+        
+        try:
+            self.page.wait_for_function(ROWS_REFRESHED_SCRIPT, timeout=config.SEARCH_RENDER_TIMEOUT)
+        except PlaywrightTimeout:
+            scraping_logger.warning("검색 후 테이블이 바뀌지 않음 - 현재 테이블을 사용합니다")
+        self.page.wait_for_load_state('domcontentloaded')
+        
+        return data
+    
+    def _parse_search_response(self, response, cursor: Optional[ScrapeCursor] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        검색 응답 본문 파싱
+        
+        Args:
+            response: 검색 요청의 Playwright 응답 객체
+            cursor: 증분 조회 기준
+        
+        Returns:
+            파싱된 데이터 리스트 (JSON/HTML로 파싱할 수 없거나 결과가 비어 있으면 None)
+        """
+        try:
+            content_type = response.headers.get('content-type', '')
+            if 'json' not in content_type and 'html' not in content_type:
+                return None
+            
+            return self._apply_search_body(content_type, response.text(), cursor)
+        
+        except Exception as e:
+            scraping_logger.warning(f"검색 응답 파싱 실패 - 테이블에서 파싱합니다: {str(e)}")
+            return None
+    
+    def _fetch_remaining_pages(self, data: List[Dict[str, Any]], start_date: str, end_date: str,
+                               cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
+        """
+        검색 결과가 여러 페이지인 경우 2페이지 이후를 동시에 조회하여 병합
+        
+        브라우저의 로그인 쿠키를 공유하는 HTTP 세션으로 각 페이지를 병렬 조회합니다.
+        
+        Args:
+            data: 첫 페이지 데이터
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            cursor: 증분 조회 기준 (첫 페이지에서 이미 조회가 끝났으면 나머지 페이지 생략)
+        
+        Returns:
+            전체 페이지 데이터 (페이지 순서 유지, 실패 시 첫 페이지 데이터)
+        """
+        try:
+            # 페이지 수는 검색 응답 HTML 또는 페이지 추출 결과로 확인 (페이지 HTML은 여러 페이지일 때만 요청)
+            total_pages = self._remaining_total_pages(cursor)
+            if total_pages <= 1:
+                return data
+            
+            # 녹화/재생 중에는 브라우저 밖의 HTTP 요청을 녹화할 수 없으므로 첫 페이지만 사용
+            if self.fixture_mode:
+                scraping_logger.warning("녹화/재생 중에는 2페이지 이후를 조회하지 않습니다")
+                return data
+            
+            search_form = self._pages_search_form(self.last_search_html or self.page.content(), self.page.url)
+            
+            with self._timed('pages'):
+                session = session_from_cookies(self.context.cookies())
+                try:
+                    rest = fetch_remaining_pages(session, search_form, total_pages, start_date, end_date)
+                finally:
+                    session.close()
+            
+            return self._merge_remaining_pages(data, rest, total_pages, cursor)
+        
+        except Exception as e:
+            scraping_logger.warning(f"2페이지 이후 조회 실패 - 첫 페이지만 사용합니다: {str(e)}")
+            return data
+    
+    def open_search_session(self):
+        """
+        브라우저 로그인 세션을 공유하는 HTTP 검색 세션 생성
+        
+        입출차 조회 페이지가 열려 있어야 합니다. 사용 후 세션을 닫아야 합니다.
+        
+        Returns:
+            (requests 세션, 검색 폼 정보)
+        """
+        search_form = parse_search_form(self.page.content(), self.page.url)
+        if not search_form:
+            raise ValueError("검색 폼을 찾을 수 없습니다")
+        
+        search_form['page_field'] = find_page_field(search_form['fields'])
+        return session_from_cookies(self.context.cookies()), search_form
+    
+    def _parse_table_data(self, cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
         """
         테이블 데이터 파싱
         
+        Args:
+            cursor: 증분 조회 기준 (지정하면 저장된 기록에 도달했을 때 파싱 중단)
+        
         Returns:
             파싱된 데이터 리스트
         """
         try:
-            # JavaScript로 테이블 데이터 추출
-            data = self.page.evaluate('''() => {
-                const rows = document.querySelectorAll('tbody tr');
-                const result = [];
-                
-                for (const row of rows) {
-                    const cells = row.querySelectorAll('td');
-                    
-                    // 11개의 컬럼이 있는 행만 처리 (정상 데이터)
-                    if (cells.length === 11) {
-                        const carNumber = cells[1]?.innerText?.trim() || '';
-                        const entryTime = cells[6]?.innerText?.trim() || '';
-                        
-                        // 차량번호와 입차시간이 있는 경우만 추가
-                        if (carNumber && entryTime) {
-                            result.push({
-                                no: cells[0]?.innerText?.trim() || '',
-                                car_number: carNumber,
-                                name: cells[2]?.innerText?.trim() || '',
-                                type: cells[3]?.innerText?.trim() || '',
-                                phone: cells[4]?.innerText?.trim() || '',
-                                entry_location: cells[5]?.innerText?.trim() || '',
-                                entry_time: entryTime,
-                                exit_location: cells[7]?.innerText?.trim() || '',
-                                exit_time: cells[8]?.innerText?.trim() || '',
-                                status: cells[9]?.innerText?.trim() || '',
-                                note: cells[10]?.innerText?.trim() || ''
-                            });
-                        }
-                    }
-                }
-                
-                return result;
-            }''')
+            # JavaScript로 테이블 데이터 추출 (포인트 정보와 페이지 수도 함께 갱신)
+            extract = self._extract_page(cursor)
             
+            data = records_from_extract(extract, cursor)
             scraping_logger.info(f"테이블에서 {len(data)}건의 데이터 파싱 완료")
             return data
         
@@ -286,15 +1146,22 @@ class ParkingScraper:
             scraping_logger.error(f"테이블 파싱 중 오류: {str(e)}")
             return []
     
-    def get_today_data(self) -> List[Dict[str, Any]]:
+    def get_today_data(self, cursor: Optional[ScrapeCursor] = None) -> List[Dict[str, Any]]:
         """
         오늘 입출차 데이터 조회
         
+        Args:
+            cursor: 증분 조회 기준
+        
         Returns:
             오늘의 입출차 데이터 리스트
         """
+        # 재생 중에는 녹화할 때 검색한 기간으로 조회해야 녹화된 응답과 일치
+        if self.fixture_dates and self.fixture_mode == 'replay':
+            return self.get_parking_data(*self.fixture_dates, cursor)
+        
         today = datetime.now().strftime(config.DATE_FORMAT)
-        return self.get_parking_data(today, today)
+        return self.get_parking_data(today, today, cursor)
     
     def get_recent_days_data(self, days: int = 7) -> List[Dict[str, Any]]:
         """
@@ -323,3 +1190,27 @@ class ParkingScraper:
         """컨텍스트 매니저 종료"""
         self.stop()
 
+
+def create_scraper(backend: Optional[str] = None, site: Optional[Dict[str, Any]] = None) -> ParkingScraper:
+    """
+    설정된 백엔드의 스크래퍼 생성
+    
+    Args:
+        backend: 'playwright' 또는 'http' (기본값: config.SCRAPER_BACKEND)
+        site: 조회할 사이트 설정 (기본값: .env의 단일 사이트)
+    
+    Returns:
+        스크래퍼 인스턴스 (컨텍스트 매니저로 사용)
+    """
+    backend = backend or config.SCRAPER_BACKEND
+    
+    # 녹화/재생은 브라우저 라우팅으로 동작하므로 Playwright 백엔드만 지원
+    if backend == 'http' and config.SCRAPER_FIXTURE_MODE:
+        scraping_logger.warning("녹화/재생 모드에서는 Playwright 백엔드를 사용합니다")
+        backend = 'playwright'
+    
+    if backend == 'http':
+        from http_scraper import HttpParkingScraper
+        return HttpParkingScraper(site)
+    
+    return ParkingScraper(site)
@@ -0,0 +1,110 @@
+"""
+적응형 조회 간격 모듈
+과거 입출차 기록의 요일/시간대별 빈도로 다음 조회까지의 간격을 결정합니다.
+
+입출차가 잦은 시간대(출퇴근 시간)에는 자주, 드문 시간대(새벽)에는 드물게 조회하고,
+입출차가 감지되면 이어지는 입출차를 놓치지 않도록 잠시 최소 간격으로 조회합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import config
+from logger import system_logger
+
+
+class AdaptivePollScheduler:
+    """과거 입출차 빈도 기반 조회 간격 결정"""
+    
+    def __init__(self, db, min_interval: int = config.POLL_MIN_INTERVAL,
+                 max_interval: int = config.POLL_MAX_INTERVAL,
+                 target_events: float = config.POLL_TARGET_EVENTS,
+                 history_days: int = config.POLL_HISTORY_DAYS,
+                 activity_boost: int = config.POLL_ACTIVITY_BOOST):
+        """
+        Args:
+            db: 데이터베이스 인스턴스
+            min_interval: 최소 조회 간격 (초)
+            max_interval: 최대 조회 간격 (초)
+            target_events: 조회 1회당 예상 입출차 건수 목표
+            history_days: 빈도 계산에 사용할 과거 기간 (일)
+            activity_boost: 입출차 감지 후 최소 간격으로 조회할 횟수
+        """
+        self.db = db
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.target_events = target_events
+        self.history_days = history_days
+        self.activity_boost = activity_boost
+        
+        self.hourly_rates: Dict[Tuple[int, int], float] = {}  # {(요일, 시): 시간당 평균 입출차 건수}
+        self.rates_date: Optional[str] = None  # 빈도를 마지막으로 계산한 날짜 (하루 한 번 갱신)
+        self.boost_remaining = 0
+        self.last_reason = ''
+    
+    def refresh_rates(self, now: Optional[datetime] = None):
+        """과거 기록으로 요일/시간대별 시간당 평균 입출차 건수 계산"""
+        now = now or datetime.now()
+        histogram = self.db.get_activity_histogram(self.history_days)
+        
+        # 같은 요일/시간대는 기간 내 주 수만큼 관측됨
+        weeks = max(self.history_days / 7, 1.0)
+        self.hourly_rates = {slot: count / weeks for slot, count in histogram.items()}
+        self.rates_date = now.strftime(config.DATE_FORMAT)
+        
+        busiest = max(self.hourly_rates.items(), key=lambda item: item[1], default=None)
+        system_logger.info(
+            f"시간대별 입출차 빈도 갱신 - 최근 {self.history_days}일, 시간대 {len(self.hourly_rates)}개"
+            + (f", 최대 {busiest[1]:.1f}건/시간" if busiest else "")
+        )
+    
+    def expected_rate(self, now: datetime) -> float:
+        """
+        현재 시각의 시간당 예상 입출차 건수
+        
+        다음 시간대가 바쁘면 미리 간격을 줄이도록 현재/다음 시간대를 분 단위로 보간합니다.
+        
+        Args:
+            now: 기준 시각
+        
+        Returns:
+            시간당 예상 입출차 건수
+        """
+        next_hour = now + timedelta(hours=1)
+        current = self.hourly_rates.get((now.isoweekday() % 7, now.hour), 0.0)
+        upcoming = self.hourly_rates.get((next_hour.isoweekday() % 7, next_hour.hour), 0.0)
+        
+        weight = now.minute / 60
+        return current * (1 - weight) + upcoming * weight
+    
+    def next_interval(self, result: Optional[Dict[str, int]] = None, now: Optional[datetime] = None) -> int:
+        """
+        다음 조회까지의 간격 결정
+        
+        Args:
+            result: 직전 조회 처리 결과 (run_poll() 반환값)
+            now: 기준 시각 (기본값: 현재 시각)
+        
+        Returns:
+            조회 간격 (초, 최소/최대 간격 범위 내)
+        """
+        now = now or datetime.now()
+        if self.rates_date != now.strftime(config.DATE_FORMAT):
+            self.refresh_rates(now)
+        
+        # 입출차가 감지되면 이어지는 입출차를 위해 잠시 최소 간격으로 조회
+        if result and (result.get('entries') or result.get('exits') or result.get('new_records')):
+            self.boost_remaining = self.activity_boost
+        
+        if self.boost_remaining > 0:
+            self.boost_remaining -= 1
+            self.last_reason = f"입출차 감지 후 집중 조회 (남은 횟수 {self.boost_remaining})"
+            return self.min_interval
+        
+        # 조회 1회당 예상 입출차 건수가 목표치가 되도록 간격 결정
+        rate = self.expected_rate(now)
+        if rate <= 0:
+            self.last_reason = "과거 입출차 없음"
+            return self.max_interval
+        
+        interval = int(self.target_events * 3600 / rate)
+        self.last_reason = f"예상 {rate:.1f}건/시간"
+        return max(self.min_interval, min(self.max_interval, interval))
@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from database import ParkingDatabase
+from delta_log import DeltaLog
 from logger import system_logger
 
 
@@ -29,10 +30,12 @@ def reset_database():
         # 기존 기록 수 확인
         stats = db.get_statistics()
         total_records = stats.get('total_records', 0)
+        delta_files = DeltaLog(db).list_files()
         
         print(f"\n현재 저장된 기록 수: {total_records}건")
+        print(f"변경 파일 수: {len(delta_files)}개")
         
-        if total_records == 0:
+        if total_records == 0 and not delta_files:
             print("✅ 데이터베이스가 이미 비어있습니다.")
             return True
         
@@ -43,15 +46,26 @@ def reset_database():
             print("❌ 초기화가 취소되었습니다.")
             return False
         
-        # 데이터베이스 파일 삭제
+        # 데이터베이스 파일 삭제 (연결을 닫아 WAL 내용을 정리한 후 삭제)
+        db.close()
         if db_path.exists():
             db_path.unlink()
             print(f"✅ 기존 데이터베이스 파일 삭제: {db_path}")
+        for suffix in ('-wal', '-shm'):
+            Path(f'{db_path}{suffix}').unlink(missing_ok=True)
+        
+        # 보관 DB 삭제
+        for archive_path in db.delete_archives():
+            print(f"✅ 보관 데이터베이스 파일 삭제: {archive_path}")
         
         # 새 데이터베이스 생성 (테이블 구조만)
         db = ParkingDatabase()
         print("✅ 빈 데이터베이스 생성 완료")
         
+        # 변경 파일 초기화 (초기화 스냅샷을 적용하는 다른 환경의 데이터베이스도 비워짐)
+        snapshot_path = DeltaLog(db).reset()
+        print(f"✅ 변경 파일 {len(delta_files)}개 삭제, 초기화 스냅샷 생성: {snapshot_path.name}")
+        
         # 확인
         stats = db.get_statistics()
         print(f"\n초기화 후 기록 수: {stats.get('total_records', 0)}건")
@@ -60,7 +74,7 @@ def reset_database():
         print("✅ 데이터베이스 초기화 완료!")
         print("="*60)
         print("\n다음 단계:")
-        print("1. git add data/parking_records.db")
+        print("1. git add -A data/deltas")
         print("2. git commit -m 'Reset parking records database'")
         print("3. git push")
         
@@ -0,0 +1,94 @@
+"""
+다중 사이트 설정 모듈
+sites.json에서 조회할 사이트(건물/계정) 목록을 불러옵니다.
+
+sites.json 형식:
+    [
+        {"name": "building_a", "url": "http://a.realparking.net:9080/",
+         "user_id": "아이디", "password": "비밀번호"},
+        ...
+    ]
+"""
+import re
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+import config
+from logger import system_logger
+
+DEFAULT_SITE_NAME = 'default'
+
+
+def _site_paths(name: str) -> Dict[str, Optional[Path]]:
+    """
+    사이트별 데이터베이스 및 로그인 세션 파일 경로
+    
+    기본 사이트는 기존 경로(config.DATABASE_PATH, config.SESSION_STATE_PATH)를 그대로 사용합니다.
+    """
+    if name == DEFAULT_SITE_NAME:
+        return {'database_path': None, 'session_state_path': config.SESSION_STATE_PATH}
+    
+    config.SITES_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return {
+        'database_path': config.SITES_DATA_DIR / f'{name}.db',
+        'session_state_path': config.SITES_DATA_DIR / f'{name}_session_state.json'
+    }
+
+
+def default_site() -> Dict[str, Any]:
+    """
+    .env에 설정된 단일 사이트
+    
+    Returns:
+        사이트 설정 딕셔너리
+    """
+    return {
+        'name': DEFAULT_SITE_NAME,
+        'url': config.PARKING_URL,
+        'user_id': config.PARKING_USER_ID,
+        'password': config.PARKING_PASSWORD,
+        **_site_paths(DEFAULT_SITE_NAME)
+    }
+
+
+def load_sites(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    조회할 사이트 목록 불러오기
+    
+    Args:
+        path: 사이트 목록 파일 경로 (기본값: config.SITES_FILE)
+    
+    Returns:
+        사이트 설정 리스트 (파일이 없으면 .env의 단일 사이트)
+    """
+    path = path or config.SITES_FILE
+    if not path.exists():
+        return [default_site()]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    
+    sites = []
+    for entry in entries:
+        name = entry.get('name', '')
+        if not re.fullmatch(r'[A-Za-z0-9_-]+', name):
+            raise ValueError(f"사이트 이름은 영문, 숫자, _, - 만 사용할 수 있습니다: {name!r}")
+        if name == DEFAULT_SITE_NAME:
+            raise ValueError(f"'{DEFAULT_SITE_NAME}'는 예약된 사이트 이름입니다")
+        if not entry.get('url') or not entry.get('user_id'):
+            raise ValueError(f"사이트 '{name}'에 url 또는 user_id가 없습니다")
+        
+        sites.append({
+            'name': name,
+            'url': entry['url'],
+            'user_id': entry['user_id'],
+            'password': entry.get('password', ''),
+            **_site_paths(name)
+        })
+    
+    names = [site['name'] for site in sites]
+    if len(set(names)) != len(names):
+        raise ValueError("사이트 이름이 중복되었습니다")
+    
+    system_logger.info(f"사이트 {len(sites)}개 불러옴: {', '.join(names)}")
+    return sites
@@ -0,0 +1,418 @@
+"""
+입출차 페이지 HTML 파싱 모듈
+브라우저 없이 HTML에서 입출차 테이블, 검색 폼, 포인트 정보를 추출합니다.
+"""
+import re
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from urllib.parse import urljoin
+from lxml import html as lxml_html
+import config
+
+
+# 입출차 테이블 컬럼 순서 (11개)
+RECORD_COLUMNS = [
+    'no',
+    'car_number',
+    'name',
+    'type',
+    'phone',
+    'entry_location',
+    'entry_time',
+    'exit_location',
+    'exit_time',
+    'status',
+    'note'
+]
+
+# 포인트 정보 패턴 (예: "기본 선입 포인트 : 6000")
+BASIC_POINTS_PATTERN = re.compile(r'기본 선입 포인트[\s:]+([0-9]+)')
+PURCHASE_POINTS_PATTERN = re.compile(r'구매 선입 포인트[\s:]+([0-9]+)')
+
+# 페이지 이동 링크 패턴 (예: "javascript:fn_link_page(3)", "?pageIndex=3")
+PAGE_LINK_PATTERN = re.compile(r'(?:\((\d+)\)|page\w*=(\d+))', re.IGNORECASE)
+PAGE_FIELD_PATTERN = re.compile(r'^(page|pageindex|pageno|pagenum|currentpage|curpage|cpage)$', re.IGNORECASE)
+
+
+def row_to_record(cells: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    테이블 행의 셀 텍스트를 입출차 기록으로 변환
+    
+    Args:
+        cells: 셀 텍스트 리스트 (RECORD_COLUMNS 순서)
+    
+    Returns:
+        입출차 기록 딕셔너리 (11개 컬럼이 아니거나 차량번호/입차시간이 없으면 None)
+    """
+    if len(cells) != len(RECORD_COLUMNS):
+        return None
+    
+    record = dict(zip(RECORD_COLUMNS, cells))
+    
+    # 차량번호와 입차시간이 있는 경우만 추가
+    if not record['car_number'] or not record['entry_time']:
+        return None
+    
+    return record
+
+
+class ScrapeCursor:
+    """
+    증분 조회 기준
+    
+    이미 저장된 가장 최근 입차 시간(high-water mark)과 미출차 기록을 바탕으로,
+    새 입차이거나 출차 정보가 생길 수 있는 행만 남깁니다.
+    입차 시간 내림차순 테이블에서 더 이상 처리할 행이 없는 구간에 도달하면 파싱을 중단합니다.
+    """
+    
+    def __init__(self, high_water: Optional[str], open_keys: Iterable[Tuple[str, str]],
+                 lookback_minutes: int = config.INCREMENTAL_LOOKBACK_MINUTES):
+        """
+        Args:
+            high_water: 저장된 가장 최근 입차 시간 (없으면 모든 행 처리)
+            open_keys: 미출차 기록의 (차량번호, 입차시간) 목록
+            lookback_minutes: 늦게 등록되는 기록을 위해 high-water mark를 앞당길 시간 (분)
+        """
+        self.high_water = ''
+        if high_water:
+            try:
+                shifted = datetime.strptime(high_water, config.DATETIME_FORMAT) - timedelta(minutes=lookback_minutes)
+                self.high_water = shifted.strftime(config.DATETIME_FORMAT)
+            except ValueError:
+                self.high_water = high_water
+        
+        self.open_keys = set(tuple(key) for key in open_keys)
+        self.cutoff = min([self.high_water] + [entry for _, entry in self.open_keys]) if self.high_water else ''
+        
+        self.scanned = 0
+        self.kept = 0
+        self.stopped = False
+        self._previous_entry = None
+    
+    def accept(self, record: Dict[str, Any]) -> Optional[bool]:
+        """
+        행 처리 여부 판단
+        
+        Args:
+            record: 입출차 기록
+        
+        Returns:
+            True: 처리 대상, False: 건너뜀, None: 이후 행은 모두 이미 저장된 기록 (파싱 중단)
+        """
+        self.scanned += 1
+        entry_time = record.get('entry_time', '')
+        previous_entry, self._previous_entry = self._previous_entry, entry_time
+        
+        if not self.high_water or entry_time >= self.high_water:
+            keep = True
+        elif (record.get('car_number'), entry_time) in self.open_keys:
+            # 미출차 기록은 출차 정보가 생긴 경우만 처리
+            keep = bool(record.get('exit_time'))
+        elif entry_time < self.cutoff and previous_entry is not None and previous_entry >= entry_time:
+            self.stopped = True
+            return None
+        else:
+            keep = False
+        
+        if keep:
+            self.kept += 1
+        return keep
+    
+    def filter(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        기록 리스트에서 처리 대상만 남김
+        
+        Returns:
+            처리 대상 기록 리스트
+        """
+        result = []
+        for record in records:
+            decision = self.accept(record)
+            if decision is None:
+                break
+            if decision:
+                result.append(record)
+        return result
+    
+    def to_js(self) -> Dict[str, Any]:
+        """브라우저 테이블 파싱 스크립트에 전달할 기준 값"""
+        return {
+            'highWater': self.high_water,
+            'cutoff': self.cutoff,
+            'openKeys': [f'{car_number}|{entry_time}' for car_number, entry_time in self.open_keys]
+        }
+    
+    def summary(self) -> str:
+        """증분 조회 결과 요약"""
+        stopped = ', 저장된 기록에서 조기 종료' if self.stopped else ''
+        return f"증분 조회: {self.scanned}행 확인, {self.kept}건 처리{stopped}"
+
+
+def _text(element) -> str:
+    """요소의 텍스트 (공백 정리)"""
+    return ' '.join(' '.join(element.itertext()).split())
+
+
+def _parse_document(html_text: str):
+    """HTML 문자열을 lxml 문서로 변환"""
+    return lxml_html.fromstring(html_text)
+
+
+def parse_inout_table(html_text: str, cursor: Optional[ScrapeCursor] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    입출차 테이블 파싱
+    
+    Args:
+        html_text: 입출차 조회 페이지 또는 테이블 HTML
+        cursor: 증분 조회 기준 (지정하면 처리 대상 행만 반환하고 저장된 기록에서 중단)
+    
+    Returns:
+        입출차 기록 리스트 (테이블 본문이 없으면 None)
+    """
+    if not html_text or not html_text.strip():
+        return None
+    
+    doc = _parse_document(html_text)
+    rows = doc.xpath('//tbody/tr')
+    
+    # tbody 없이 행만 내려오는 HTML 조각 처리
+    if not rows and not doc.xpath('//tbody'):
+        rows = doc.xpath('//tr[td]')
+        if not rows:
+            return None
+    
+    records = []
+    for row in rows:
+        record = row_to_record([_text(td) for td in row.xpath('./td')])
+        if not record:
+            continue
+        
+        if cursor:
+            decision = cursor.accept(record)
+            if decision is None:
+                break
+            if not decision:
+                continue
+        
+        records.append(record)
+    
+    return records
+
+
+def records_from_json(payload: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    검색 응답 JSON을 입출차 기록으로 변환
+    
+    행이 11개 값의 배열이거나 RECORD_COLUMNS 키를 가진 객체인 경우만 처리합니다.
+    
+    Args:
+        payload: 응답 JSON (행 리스트 또는 행 리스트를 값으로 가진 객체)
+    
+    Returns:
+        입출차 기록 리스트 (알 수 없는 형식이면 None)
+    """
+    rows = payload
+    if isinstance(payload, dict):
+        rows = next((value for value in payload.values() if isinstance(value, list)), None)
+    
+    if not isinstance(rows, list):
+        return None
+    
+    records = []
+    for row in rows:
+        if isinstance(row, list):
+            cells = row
+        elif isinstance(row, dict) and 'car_number' in row and 'entry_time' in row:
+            cells = [row.get(column) for column in RECORD_COLUMNS]
+        else:
+            return None
+        
+        record = row_to_record([str(cell).strip() if cell is not None else '' for cell in cells])
+        if record:
+            records.append(record)
+    
+    return records
+
+
+def parse_points(html_text: str) -> Dict[str, int]:
+    """
+    포인트 정보 파싱
+    
+    Args:
+        html_text: 페이지 HTML
+    
+    Returns:
+        포인트 정보 딕셔너리 {'basic': 기본 포인트, 'purchase': 구매 포인트}
+    """
+    result = {'basic': 0, 'purchase': 0}
+    if not html_text:
+        return result
+    
+    text = _text(_parse_document(html_text))
+    
+    basic_match = BASIC_POINTS_PATTERN.search(text)
+    if basic_match:
+        result['basic'] = int(basic_match.group(1))
+    
+    purchase_match = PURCHASE_POINTS_PATTERN.search(text)
+    if purchase_match:
+        result['purchase'] = int(purchase_match.group(1))
+    
+    return result
+
+
+def _form_fields(form) -> List[List[str]]:
+    """폼의 전송 대상 필드 목록 [[이름, 값], ...]"""
+    fields = []
+    for element in form.xpath('.//input[@name] | .//select[@name] | .//textarea[@name]'):
+        name = element.get('name')
+        
+        if element.tag == 'input':
+            input_type = (element.get('type') or 'text').lower()
+            if input_type in ('button', 'submit', 'image', 'reset', 'file'):
+                continue
+            if input_type in ('checkbox', 'radio') and element.get('checked') is None:
+                continue
+            value = element.get('value') or ('on' if input_type in ('checkbox', 'radio') else '')
+        elif element.tag == 'select':
+            selected = element.xpath('.//option[@selected]') or element.xpath('.//option')
+            value = (selected[0].get('value') or _text(selected[0])) if selected else ''
+        else:
+            value = element.text or ''
+        
+        fields.append([name, value])
+    
+    return fields
+
+
+def _describe_form(form, page_url: str) -> Dict[str, Any]:
+    """폼의 전송 정보 (URL, 메서드, 필드)"""
+    return {
+        'url': urljoin(page_url, form.get('action') or page_url),
+        'method': (form.get('method') or 'get').lower(),
+        'fields': _form_fields(form)
+    }
+
+
+def parse_login_form(html_text: str, page_url: str) -> Optional[Dict[str, Any]]:
+    """
+    로그인 폼 파싱
+    
+    Args:
+        html_text: 로그인 페이지 HTML
+        page_url: 로그인 페이지 URL (상대 경로 기준)
+    
+    Returns:
+        {'url', 'method', 'fields', 'user_field', 'password_field', 'auto_login_field'}
+        (로그인 폼이 없으면 None)
+    """
+    doc = _parse_document(html_text)
+    user_inputs = doc.xpath('//input[@id="userid"]')
+    password_inputs = doc.xpath('//input[@id="userpw"]')
+    if not user_inputs or not password_inputs:
+        return None
+    
+    forms = user_inputs[0].xpath('./ancestor::form')
+    if forms:
+        form_info = _describe_form(forms[-1], page_url)
+    else:
+        form_info = {'url': page_url, 'method': 'post', 'fields': []}
+    
+    auto_login = doc.xpath('//input[@id="autoLogin"]')
+    form_info.update({
+        'user_field': user_inputs[0].get('name') or 'userid',
+        'password_field': password_inputs[0].get('name') or 'userpw',
+        'auto_login_field': auto_login[0].get('name') if auto_login else None
+    })
+    return form_info
+
+
+def parse_search_form(html_text: str, page_url: str) -> Optional[Dict[str, Any]]:
+    """
+    입출차 검색 폼 파싱
+    
+    브라우저 스크래퍼와 같은 규칙으로, 문서의 두 번째/세 번째 텍스트 입력란을
+    시작/종료 날짜 필드로 사용합니다.
+    
+    Args:
+        html_text: 입출차 조회 페이지 HTML
+        page_url: 입출차 조회 페이지 URL (상대 경로 기준)
+    
+    Returns:
+        {'url', 'method', 'fields', 'date_fields'} (검색 폼이 없으면 None)
+    """
+    doc = _parse_document(html_text)
+    
+    search_images = doc.xpath('//button//img[contains(@src, "bt_search")]')
+    if not search_images:
+        return None
+    
+    forms = search_images[0].xpath('./ancestor::form')
+    if not forms:
+        forms = doc.xpath('//form[.//input[@type="text"]]')
+    if not forms:
+        return None
+    
+    form_info = _describe_form(forms[-1], page_url)
+    
+    text_inputs = doc.xpath('//input[@type="text"]')
+    if len(text_inputs) < 3:
+        return None
+    form_info['date_fields'] = [text_inputs[1].get('name'), text_inputs[2].get('name')]
+    
+    return form_info
+
+
+def is_login_page(html_text: str) -> bool:
+    """로그인 폼이 있는 페이지인지 확인"""
+    if not html_text:
+        return False
+    return bool(_parse_document(html_text).xpath('//input[@id="userid"]'))
+
+
+def detect_total_pages(html_text: str) -> int:
+    """
+    검색 결과의 전체 페이지 수 확인
+    
+    페이지 영역(class에 "pag"가 포함된 요소)의 링크 번호 중 가장 큰 값을 사용합니다.
+    
+    Args:
+        html_text: 검색 결과 페이지 HTML
+    
+    Returns:
+        전체 페이지 수 (페이지 영역이 없으면 1)
+    """
+    if not html_text:
+        return 1
+    
+    doc = _parse_document(html_text)
+    total = 1
+    for link in doc.xpath('//*[contains(@class, "pag")]//a'):
+        text = _text(link)
+        if text.isdigit():
+            total = max(total, int(text))
+        
+        for attribute in ('href', 'onclick'):
+            for match in PAGE_LINK_PATTERN.finditer(link.get(attribute) or ''):
+                total = max(total, int(match.group(1) or match.group(2)))
+    
+    return total
+
+
+def find_page_field(fields: List[List[str]]) -> Optional[str]:
+    """
+    검색 폼에서 페이지 번호 필드 이름 찾기
+    
+    Args:
+        fields: 폼 필드 [[이름, 값], ...]
+    
+    Returns:
+        페이지 번호 필드 이름 (config.PAGE_PARAM 우선, 찾지 못하면 None)
+    """
+    if config.PAGE_PARAM:
+        return config.PAGE_PARAM
+    
+    for name, _ in fields:
+        if PAGE_FIELD_PATTERN.match(name or ''):
+            return name
+    return None
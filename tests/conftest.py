@@ -0,0 +1,38 @@
+"""
+테스트 공통 설정
+src/ 모듈을 직접 import 할 수 있도록 경로를 추가하고, 임시 데이터베이스를 제공합니다.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from database import ParkingDatabase  # noqa: E402
+
+
+def make_record(car_number: str, entry_time: str, exit_time: str = '', **fields):
+    """테스트용 입출차 기록"""
+    record = {
+        'car_number': car_number,
+        'name': '홍길동',
+        'type': '방문',
+        'phone': '',
+        'entry_location': '정문',
+        'entry_time': entry_time,
+        'exit_location': '정문' if exit_time else '',
+        'exit_time': exit_time,
+        'status': '출차' if exit_time else '입차',
+        'note': '',
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def db(tmp_path):
+    """임시 경로의 데이터베이스"""
+    database = ParkingDatabase(tmp_path / 'parking_records.db')
+    yield database
+    database.close()
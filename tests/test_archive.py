@@ -0,0 +1,84 @@
+"""
+보관 DB 테스트
+지난달 이전에 출차까지 끝난 기록만 보관 DB로 옮기고, 이번 달 기록과 미출차 기록은 현재 DB에 남아야 합니다.
+올해 보관 DB는 매달 추가만 하고 압축(VACUUM)은 끝난 연도의 보관 DB에만 해야 합니다.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import make_record
+
+NOW = datetime.now()
+THIS_MONTH = NOW.replace(day=1)
+LAST_MONTH = THIS_MONTH - timedelta(days=1)
+LAST_YEAR = NOW.year - 1
+
+
+def at(day: datetime, time: str) -> str:
+    return f"{day.strftime('%Y/%m/%d')} {time}"
+
+
+def live_cars(db):
+    with db.connection() as conn:
+        return sorted(row[0] for row in conn.execute('SELECT car_number FROM main.parking_records'))
+
+
+def trace_vacuums(db):
+    """보관 DB 압축 문 기록"""
+    statements = []
+    with db.connection() as conn:
+        conn.set_trace_callback(statements.append)
+    return lambda: [sql for sql in statements if sql.startswith('VACUUM archive_write')]
+
+
+def test_current_month_and_open_sessions_stay_in_live_database(db):
+    db.upsert_records([
+        make_record('LAST', at(LAST_MONTH, '08:00:00'), at(LAST_MONTH, '09:00:00')),
+        make_record('NOW', at(THIS_MONTH, '08:00:00'), at(THIS_MONTH, '09:00:00')),
+        make_record('OPEN', at(LAST_MONTH, '23:00:00')),
+    ])
+    
+    assert db.archive_old_records() == 1
+    assert [path.name for path in db.archive_paths()] == [f'parking_records_{LAST_MONTH.year}.db']
+    assert live_cars(db) == ['NOW', 'OPEN']
+    assert len(db.get_all_records()) == 3
+
+
+def test_current_year_archive_is_appended_without_vacuum(db):
+    if NOW.month == 1:
+        pytest.skip('1월에는 올해 보관할 지난달이 없음')
+    
+    vacuums = trace_vacuums(db)
+    db.upsert_records([make_record('LAST', at(LAST_MONTH, '08:00:00'), at(LAST_MONTH, '09:00:00'))])
+    assert db.archive_old_records() == 1
+    assert vacuums() == []
+    
+    # 다음 달에 추가해도 기존 기록은 그대로 남음
+    db.upsert_records([make_record('MORE', at(LAST_MONTH, '10:00:00'), at(LAST_MONTH, '11:00:00'))])
+    assert db.archive_old_records() == 1
+    assert vacuums() == []
+    assert sorted(record['car_number'] for record in db.get_all_records()) == ['LAST', 'MORE']
+
+
+def test_finished_year_archive_is_vacuumed(db):
+    vacuums = trace_vacuums(db)
+    db.upsert_records([make_record('OLD', f'{LAST_YEAR}/12/31 08:00:00', f'{LAST_YEAR}/12/31 09:00:00')])
+    
+    assert db.archive_old_records() == 1
+    assert vacuums() == ['VACUUM archive_write']
+    assert [path.name for path in db.archive_paths()] == [f'parking_records_{LAST_YEAR}.db']
+
+
+def test_archive_if_due_runs_once_per_month(db):
+    db.upsert_records([make_record('LAST', at(LAST_MONTH, '08:00:00'), at(LAST_MONTH, '09:00:00'))])
+    
+    # 데이터베이스를 열 때 이번 달 보관 처리를 이미 마쳤으므로 다시 보관하지 않음
+    assert db.archive_if_due() == 0
+    
+    # 달이 바뀐 뒤 처음 호출
+    db.set_state('archived_month', LAST_MONTH.strftime('%Y-%m'))
+    db._archived_month = None
+    assert db.archive_if_due() == 1
+    assert db.get_state('archived_month') == NOW.strftime('%Y-%m')
+    assert live_cars(db) == []
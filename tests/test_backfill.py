@@ -0,0 +1,96 @@
+"""
+과거 데이터 수집 테스트
+오늘이 포함된 구간은 완료 표시하지 않고, 작업자마다 별도의 HTTP 세션을 사용해야 합니다.
+"""
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import backfill
+import config
+from conftest import make_record
+from database import ParkingDatabase
+
+TODAY = datetime.now()
+
+
+def day(offset: int) -> str:
+    return (TODAY + timedelta(days=offset)).strftime(config.DATE_FORMAT)
+
+
+class FakeScraper:
+    """로그인된 세션만 제공하는 스크래퍼"""
+    
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.cookies.set('JSESSIONID', 'abc', domain='parking.example', path='/')
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def ensure_login(self):
+        return True
+    
+    def navigate_to_inout_list(self):
+        return True
+    
+    def open_search_session(self):
+        return self.session, {'fields': []}
+
+
+@pytest.fixture
+def search_calls(tmp_path, monkeypatch):
+    """임시 데이터베이스로 수집하고 구간별 조회에 사용된 세션 기록"""
+    monkeypatch.setattr(config, 'DATABASE_PATH', tmp_path / 'parking_records.db')
+    scraper = FakeScraper()
+    monkeypatch.setattr(backfill, 'create_scraper', lambda backend: scraper)
+    
+    calls = []
+    lock = threading.Lock()
+    
+    def fake_search(session, search_form, start_date, end_date):
+        with lock:
+            calls.append((start_date, session, threading.get_ident()))
+        return [make_record(f'CAR{start_date}', f"{start_date.replace('-', '/')} 08:00:00")]
+    
+    monkeypatch.setattr(backfill, 'search_all_pages', fake_search)
+    return SimpleNamespace(calls=calls, shared=scraper.session)
+
+
+def completed_chunks():
+    db = ParkingDatabase()
+    try:
+        return {start for start, end in db.get_completed_backfill_chunks()}
+    finally:
+        db.close()
+
+
+def test_chunk_including_today_is_not_checkpointed(search_calls):
+    assert backfill.backfill(day(-2), day(0), workers=2) == 0
+    
+    assert completed_chunks() == {day(-2), day(-1)}
+    
+    # 다시 실행하면 오늘 구간만 다시 수집
+    search_calls.calls.clear()
+    assert backfill.backfill(day(-2), day(0), workers=2) == 0
+    assert [start for start, _, _ in search_calls.calls] == [day(0)]
+
+
+def test_workers_use_their_own_sessions(search_calls):
+    assert backfill.backfill(day(-6), day(-1), workers=3) == 0
+    
+    sessions = {}
+    for _, session, thread in search_calls.calls:
+        assert session is not search_calls.shared
+        assert session.cookies.get('JSESSIONID') == 'abc'
+        sessions.setdefault(thread, set()).add(id(session))
+    
+    # 같은 작업자 스레드는 같은 세션, 다른 작업자 스레드는 다른 세션
+    assert all(len(ids) == 1 for ids in sessions.values())
+    assert len({next(iter(ids)) for ids in sessions.values()}) == len(sessions)
@@ -0,0 +1,236 @@
+"""
+브라우저 감시 및 공유 브라우저 서버 재시작 테스트
+"""
+import asyncio
+import json
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+
+import pytest
+
+import browser_server
+import config
+import multi_site_monitor
+import parking_scraper
+from browser_watchdog import BrowserWatchdog, browser_memory_mb, find_browser_processes, kill_browser_processes, psutil
+from conftest import make_record
+from main_with_notification import run_poll
+from parking_scraper import ParkingScraper
+
+
+@pytest.fixture
+def fake_server(tmp_path):
+    """'chrome' 이름의 자식 프로세스를 실행한 서버 프로세스 (공유 브라우저 서버 대신)"""
+    if psutil is None:
+        pytest.skip('psutil 없음')
+    
+    chrome = tmp_path / 'chrome'
+    shutil.copy(shutil.which('sleep'), chrome)
+    server = subprocess.Popen(['sh', '-c', f'"{chrome}" 30 & wait'], start_new_session=True)
+    deadline = time.monotonic() + 5
+    while not find_browser_processes(server.pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    yield server
+    server.kill()
+    server.wait()
+
+
+def test_kill_browser_processes_of_shared_server(fake_server):
+    assert len(find_browser_processes(fake_server.pid)) == 1
+    
+    assert kill_browser_processes(fake_server.pid) == 1
+    fake_server.wait(timeout=5)
+
+
+def test_shared_server_memory_is_measured(fake_server):
+    assert browser_memory_mb(fake_server.pid) > 0
+
+
+def test_guard_on_shared_server_kills_only_own_driver(fake_server, tmp_path):
+    driver_path = tmp_path / 'node'
+    shutil.copy(shutil.which('sleep'), driver_path)
+    driver = subprocess.Popen([str(driver_path), '30'])
+    try:
+        watchdog = BrowserWatchdog()
+        watchdog.root_pid = fake_server.pid
+        with watchdog.guard('poll', 0.2):
+            driver.wait(timeout=5)
+        
+        assert watchdog.fired
+        assert len(find_browser_processes(fake_server.pid)) == 1
+        assert fake_server.poll() is None
+    finally:
+        driver.kill()
+        driver.wait()
+
+
+@pytest.fixture
+def shared_scraper(monkeypatch):
+    """브라우저 대신 재시작 과정만 기록하는 공유 브라우저 서버 스크래퍼"""
+    scraper = ParkingScraper()
+    scraper.shared_browser = True
+    scraper.watchdog.root_pid = 111
+    scraper.ready = True
+    restarts = []
+    monkeypatch.setattr(parking_scraper, 'restart_server', restarts.append)
+    monkeypatch.setattr(scraper, 'start', lambda: None)
+    monkeypatch.setattr(scraper, 'stop', lambda: None)
+    monkeypatch.setattr(scraper, 'ensure_login', lambda: scraper.ready)
+    monkeypatch.setattr(scraper, 'navigate_to_inout_list', lambda: True)
+    scraper.restarts = restarts
+    return scraper
+
+
+def test_hung_shared_scraper_reconnects_before_restarting_server(shared_scraper):
+    shared_scraper.watchdog.fired = True
+    shared_scraper.ready = False
+    assert not shared_scraper.restart_browser('응답 없음')
+    assert shared_scraper.restarts == []
+    
+    # 같은 서버에 다시 연결해도 준비하지 못하면 서버 재시작
+    shared_scraper.watchdog.fired = True
+    shared_scraper.ready = True
+    assert shared_scraper.restart_browser('응답 없음')
+    assert shared_scraper.restarts == [111]
+
+
+def test_disconnected_shared_server_is_restarted(shared_scraper):
+    assert shared_scraper.restart_browser('연결 끊김')
+    assert shared_scraper.restarts == [111]
+
+
+def test_restart_server_reuses_server_restarted_by_another_process(tmp_path, monkeypatch):
+    server_file = tmp_path / 'browser_server.json'
+    info = {'ws_endpoint': 'ws://127.0.0.1:1/new', 'pid': 222, 'started_at': ''}
+    server_file.write_text(json.dumps(info), encoding='utf-8')
+    monkeypatch.setattr(config, 'BROWSER_SERVER_FILE', server_file)
+    monkeypatch.setattr(browser_server, 'start_server', lambda: pytest.fail('서버를 다시 시작하면 안 됨'))
+    
+    assert browser_server.restart_server(expected_pid=111) == info
+
+
+def test_restart_server_replaces_hung_server(tmp_path, monkeypatch):
+    server_file = tmp_path / 'browser_server.json'
+    server_file.write_text(json.dumps({'ws_endpoint': 'ws://127.0.0.1:1/old', 'pid': 111, 'started_at': ''}),
+                           encoding='utf-8')
+    monkeypatch.setattr(config, 'BROWSER_SERVER_FILE', server_file)
+    stopped = []
+    monkeypatch.setattr(browser_server, 'stop_server', lambda: stopped.append(True))
+    monkeypatch.setattr(browser_server, 'start_server', lambda: {'pid': 333})
+    
+    assert browser_server.restart_server(expected_pid=111) == {'pid': 333}
+    assert stopped == [True]
+
+
+class FakeWatchdog:
+    """감시 범위만 기록하는 감시기"""
+    
+    def __init__(self):
+        self.fired = False
+        self.guarding = False
+    
+    @contextmanager
+    def guard(self, operation, timeout):
+        self.guarding = True
+        try:
+            yield
+        finally:
+            self.guarding = False
+
+
+class FakeScraper:
+    """조회 결과를 바로 반환하는 스크래퍼"""
+    
+    def __init__(self, records):
+        self.records = records
+        self.watchdog = FakeWatchdog()
+        self.points_info = {'basic': 0, 'purchase': 0}
+        self.guarded_calls = []
+    
+    def reset_request_stats(self):
+        pass
+    
+    def get_today_data(self, cursor=None):
+        self.guarded_calls.append(self.watchdog.guarding)
+        return self.records
+
+
+def test_poll_guard_covers_only_browser_scrape(db, monkeypatch):
+    scraper = FakeScraper([make_record('A', '2026/10/18 08:00:00')])
+    processed = []
+    monkeypatch.setattr('main_with_notification.process_records',
+                        lambda *args, **kwargs: processed.append(scraper.watchdog.guarding) or {})
+    
+    run_poll(scraper, db, verbose=False, watchdog_timeout=30)
+    
+    assert scraper.guarded_calls == [True]
+    assert processed == [False]
+
+
+def test_poll_after_watchdog_kill_is_not_processed(db):
+    scraper = FakeScraper([])
+    scraper.watchdog.fired = True
+    
+    with pytest.raises(RuntimeError):
+        run_poll(scraper, db, verbose=False, watchdog_timeout=30)
+    assert db.get_metrics() == {}
+
+
+class FakeBrowser:
+    """연결 상태만 가진 공유 브라우저"""
+    
+    def __init__(self):
+        self.connected = True
+    
+    def is_connected(self):
+        return self.connected
+    
+    async def close(self):
+        self.connected = False
+
+
+class FakeSiteScraper:
+    """컨텍스트 재시작과 조회 준비만 기록하는 사이트별 비동기 스크래퍼"""
+    
+    def __init__(self, browser):
+        self.browser = browser
+        self.context = object()
+        self.restarts = []
+        self.is_logged_in = True
+    
+    def is_browser_alive(self):
+        return self.browser.is_connected() and self.context is not None
+    
+    async def restart_browser(self, reason=''):
+        self.restarts.append(self.browser)
+        self.context = object()
+        return True
+    
+    async def stop(self):
+        self.context = None
+    
+    async def is_search_ready(self):
+        return True
+
+
+def test_disconnected_shared_browser_is_relaunched_for_every_site(monkeypatch):
+    old, new = FakeBrowser(), FakeBrowser()
+    monkeypatch.setattr(multi_site_monitor, 'launch_browser', lambda playwright: asyncio.sleep(0, new))
+    monkeypatch.setattr(multi_site_monitor, 'run_poll_async', lambda *args, **kwargs: asyncio.sleep(0, {}))
+    states = [{'site': {'name': name}, 'scraper': FakeSiteScraper(old), 'db': None, 'notification_manager': None}
+              for name in ('A', 'B')]
+    
+    async def relaunch_and_poll():
+        old.connected = False
+        browser = await multi_site_monitor.relaunch_browser(None, old, states)
+        semaphore = asyncio.Semaphore(1)
+        results = [await multi_site_monitor.poll_site(state, semaphore, incremental=True) for state in states]
+        return browser, results
+    
+    browser, results = asyncio.run(relaunch_and_poll())
+    
+    assert browser is new
+    assert results == [{}, {}]
+    assert [state['scraper'].restarts for state in states] == [[new], [new]]
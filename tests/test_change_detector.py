@@ -0,0 +1,66 @@
+"""
+입출차 변경 감지 테스트
+새 키는 입차로, 저장된 미출차 기록에 생긴 출차 시간은 한 번만 출차로 감지하고,
+이미 저장된 출차 정보는 덮어쓰지 않아야 합니다.
+"""
+import pytest
+
+from change_detector import ChangeDetector
+from conftest import make_record
+
+ENTRY = '2026/10/18 08:00:00'
+
+
+@pytest.fixture
+def detector(db):
+    return ChangeDetector(db)
+
+
+def cars(records):
+    return [record['car_number'] for record in records]
+
+
+def test_new_key_is_reported_as_entry(detector, db):
+    entries, exits = detector.detect_changes([make_record('A', ENTRY), make_record('A', ENTRY)])
+    
+    assert cars(entries) == ['A']
+    assert exits == []
+    assert len(db.get_records_by_car_and_entry('A', ENTRY)) == 1
+    
+    # 같은 조회 결과는 다시 감지하지 않음
+    assert detector.detect_changes([make_record('A', ENTRY)]) == ([], [])
+
+
+def test_new_key_with_exit_is_reported_only_as_entry(detector):
+    entries, exits = detector.detect_changes([make_record('A', ENTRY, '2026/10/18 09:00:00')])
+    
+    assert cars(entries) == ['A']
+    assert exits == []
+
+
+def test_exit_of_open_session_is_reported_once(detector, db):
+    detector.detect_changes([make_record('A', ENTRY)])
+    
+    scraped = [make_record('A', ENTRY, '2026/10/18 09:00:00')]
+    entries, exits = detector.detect_changes(scraped)
+    assert entries == []
+    assert cars(exits) == ['A']
+    assert exits[0]['exit_time'] == '2026/10/18 09:00:00'
+    
+    assert detector.detect_changes(scraped) == ([], [])
+    stored = db.get_records_by_car_and_entry('A', ENTRY)[0]
+    assert stored['exit_time'] == '2026/10/18 09:00:00'
+    assert stored['status'] == '출차'
+
+
+def test_existing_exit_is_not_overwritten(detector, db):
+    detector.detect_changes([make_record('A', ENTRY, '2026/10/18 09:00:00', exit_location='정문')])
+    
+    changed = make_record('A', ENTRY, '2026/10/18 10:00:00', exit_location='후문', note='수정')
+    assert detector.detect_changes([changed]) == ([], [])
+    
+    # 출차 정보가 지워진 조회 결과로도 덮어쓰지 않음
+    assert detector.detect_changes([make_record('A', ENTRY)]) == ([], [])
+    
+    stored = db.get_records_by_car_and_entry('A', ENTRY)[0]
+    assert (stored['exit_time'], stored['exit_location'], stored['note']) == ('2026/10/18 09:00:00', '정문', '')
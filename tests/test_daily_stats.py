@@ -0,0 +1,94 @@
+"""
+일별 통계(daily_stats) 테스트
+기록 추가, 출차 반영, 삭제, 보관 후에도 daily_stats는 전체 기록(all_records)을 직접 집계한 결과와 같아야 합니다.
+"""
+from datetime import datetime, timedelta
+
+from conftest import make_record
+
+LAST_MONTH = datetime.now().replace(day=1) - timedelta(days=1)
+
+
+def at(day: datetime, time: str) -> str:
+    return f"{day.strftime('%Y/%m/%d')} {time}"
+
+
+def daily_stats(db):
+    with db.connection() as conn:
+        return conn.execute('SELECT date, location, type, entries, exits FROM daily_stats ORDER BY 1, 2, 3').fetchall()
+
+
+def grouped_records(db):
+    """all_records를 날짜/위치/차량 구분별로 직접 집계"""
+    with db.connection() as conn:
+        return conn.execute('''
+            SELECT date, location, type, SUM(entries), SUM(exits) FROM (
+                SELECT COALESCE(date(entry_ts, 'unixepoch'), '') AS date,
+                       COALESCE(entry_location, '') AS location,
+                       COALESCE(type, '') AS type, 1 AS entries, 0 AS exits
+                FROM all_records
+                UNION ALL
+                SELECT date(exit_ts, 'unixepoch'), COALESCE(exit_location, ''), COALESCE(type, ''), 0, 1
+                FROM all_records
+                WHERE exit_ts IS NOT NULL
+            )
+            GROUP BY 1, 2, 3
+            ORDER BY 1, 2, 3
+        ''').fetchall()
+
+
+def assert_stats_match(db):
+    assert daily_stats(db) == grouped_records(db)
+
+
+def test_insert_and_exit_update(db):
+    db.upsert_records([
+        make_record('A', '2026/10/17 22:00:00'),
+        make_record('B', '2026/10/18 08:00:00', '2026/10/18 09:00:00', exit_location='후문'),
+        make_record('C', '2026/10/18 08:30:00', type='세대'),
+        make_record('D', '시간 없음'),
+    ])
+    assert_stats_match(db)
+    
+    # 전날 입차한 차량의 출차는 출차 날짜와 출차 위치로 집계
+    db.upsert_records([make_record('A', '2026/10/17 22:00:00', '2026/10/18 07:00:00', exit_location='후문')])
+    assert_stats_match(db)
+    assert ('2026-10-18', '후문', '방문', 0, 2) in daily_stats(db)
+    
+    # 이미 반영된 출차는 다시 집계하지 않음
+    db.upsert_records([make_record('A', '2026/10/17 22:00:00', '2026/10/18 07:00:00', exit_location='후문')])
+    assert_stats_match(db)
+
+
+def test_delete(db):
+    db.upsert_records([
+        make_record('A', '2026/10/18 08:00:00', '2026/10/18 09:00:00', exit_location='후문'),
+        make_record('B', '2026/10/18 08:30:00'),
+        make_record('C', '2026/10/19 08:30:00', type='세대'),
+    ])
+    
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM parking_records WHERE car_number IN ('A', 'C')")
+    assert_stats_match(db)
+    assert daily_stats(db) == [('2026-10-18', '정문', '방문', 1, 0)]
+    
+    db.clear_records()
+    assert daily_stats(db) == []
+
+
+def test_archive_keeps_stats(db):
+    db.upsert_records([
+        make_record('OLD', '2025/03/01 08:00:00', '2025/03/01 09:00:00'),
+        make_record('LAST', at(LAST_MONTH, '08:00:00'), at(LAST_MONTH, '09:00:00')),
+        make_record('OPEN', at(LAST_MONTH, '23:00:00')),
+    ])
+    before = daily_stats(db)
+    
+    assert db.archive_old_records() == 2
+    assert daily_stats(db) == before
+    assert_stats_match(db)
+    
+    # 보관 후에도 삭제 트리거가 다시 동작
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM parking_records WHERE car_number = 'OPEN'")
+    assert_stats_match(db)
@@ -0,0 +1,151 @@
+"""
+데이터베이스 테스트
+스키마 마이그레이션, 시간 변환과 날짜 범위 조회, 연결 종료 등록을 확인합니다.
+"""
+import calendar
+import gc
+import sqlite3
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+import database
+from conftest import make_record
+from database import ParkingDatabase, day_range, to_epoch
+
+# 스키마 버전 0의 입출차 기록 테이블 (정수 타임스탬프 컬럼 없음)
+VERSION_0_SCHEMA = """
+    CREATE TABLE parking_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        car_number TEXT NOT NULL,
+        name TEXT,
+        type TEXT,
+        phone TEXT,
+        entry_location TEXT,
+        entry_time TEXT NOT NULL,
+        exit_location TEXT,
+        exit_time TEXT,
+        status TEXT,
+        note TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(car_number, entry_time)
+    )
+"""
+
+
+def epoch(*values: int) -> int:
+    return calendar.timegm(values + (0,) * (9 - len(values)))
+
+
+def cars(records):
+    return sorted(record['car_number'] for record in records)
+
+
+def stats(db, start_date, end_date):
+    return [(row['date'], row['entries'], row['exits']) for row in db.get_daily_stats(start_date, end_date)]
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2026/01/05 09:57:08', epoch(2026, 1, 5, 9, 57, 8)),
+    (' 2026/01/05 09:57:08 ', epoch(2026, 1, 5, 9, 57, 8)),
+    ('2026-01-05 09:57:08', epoch(2026, 1, 5, 9, 57, 8)),
+    ('2026/01/05 09:57', epoch(2026, 1, 5, 9, 57)),
+    ('2026-01-05 09:57', epoch(2026, 1, 5, 9, 57)),
+    ('2026/13/05 09:57:08', None),
+    ('입차 중', None),
+    ('', None),
+    (None, None),
+])
+def test_to_epoch(value, expected):
+    assert to_epoch(value) == expected
+
+
+def test_day_range_accepts_both_date_formats():
+    start = epoch(2026, 10, 18)
+    assert day_range('2026-10-18') == (start, start + 86399)
+    assert day_range('2026/10/18') == day_range('2026-10-18')
+
+
+def test_migration_from_version_0_fills_timestamps(tmp_path):
+    path = tmp_path / 'parking_records.db'
+    conn = sqlite3.connect(path)
+    conn.execute(VERSION_0_SCHEMA)
+    conn.executemany(
+        'INSERT INTO parking_records (car_number, type, entry_location, entry_time, exit_location, exit_time) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        [('A', '방문', '정문', '2026/10/17 08:00:00', '정문', '2026/10/17 09:30:00'),
+         ('B', '방문', '정문', '2026-10-18 07:00:00', '', ''),
+         ('C', '방문', '정문', '알 수 없음', '', None)]
+    )
+    conn.commit()
+    conn.close()
+    
+    db = ParkingDatabase(path)
+    try:
+        with db.connection() as conn:
+            assert conn.execute('PRAGMA user_version').fetchone()[0] == 4
+            rows = conn.execute('SELECT car_number, entry_ts, exit_ts FROM parking_records ORDER BY car_number')
+            assert rows.fetchall() == [
+                ('A', epoch(2026, 10, 17, 8), epoch(2026, 10, 17, 9, 30)),
+                ('B', epoch(2026, 10, 18, 7), None),
+                ('C', None, None),
+            ]
+        
+        # 변환된 타임스탬프로 날짜별 조회와 일별 집계
+        assert cars(db.get_records_by_date('2026-10-17')) == ['A']
+        assert cars(db.get_records_by_date('2026/10/18')) == ['B']
+        assert stats(db, '2026-10-17', '2026-10-18') == [('2026-10-17', 1, 1), ('2026-10-18', 1, 0)]
+    finally:
+        db.close()
+    
+    # 다시 열어도 마이그레이션을 반복하지 않음
+    ParkingDatabase(path).close()
+
+
+def test_records_by_date_include_whole_day_and_archives(db):
+    db.upsert_records([
+        make_record('BEFORE', '2025/03/01 23:59:59', '2025/03/02 00:10:00'),
+        make_record('FIRST', '2025/03/02 00:00:00', '2025/03/02 01:00:00'),
+        make_record('LAST', '2025/03/02 23:59:59', '2025/03/03 00:30:00'),
+        make_record('AFTER', '2025/03/03 00:00:00', '2025/03/03 01:00:00'),
+    ])
+    assert db.archive_old_records() == 4
+    db.upsert_records([make_record('LIVE', '2026/10/18 12:00:00')])
+    
+    for date in ('2025-03-02', '2025/03/02'):
+        assert [record['car_number'] for record in db.get_records_by_date(date)] == ['LAST', 'FIRST']
+    assert cars(db.get_records_by_date('2026-10-18')) == ['LIVE']
+    assert db.get_records_by_date('2025-03-04') == []
+    
+    assert db.get_incremental_state('2025-03-03')['high_water'] == '2026/10/18 12:00:00'
+    assert db.get_incremental_state('2026-10-19')['high_water'] is None
+    
+    # 출차는 출차 날짜로 집계
+    assert stats(db, '2025-03-02', '2025-03-03') == [('2025-03-02', 2, 2), ('2025-03-03', 1, 2)]
+
+
+def test_unclosed_database_is_not_kept_alive_until_exit(tmp_path):
+    db = ParkingDatabase(tmp_path / 'parking_records.db')
+    db.upsert_records([make_record('A', '2026/10/18 08:00:00')])
+    db_ref = weakref.ref(db)
+    
+    del db
+    gc.collect()
+    assert db_ref() is None
+
+
+def test_close_unregisters_exit_handler(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(database, 'atexit', SimpleNamespace(register=registered.append, unregister=registered.remove))
+    db = ParkingDatabase(tmp_path / 'parking_records.db')
+    assert registered == [db._close_at_exit]
+    
+    db.close()
+    assert registered == []
+    
+    # 닫은 후 다시 사용하면 다시 등록
+    db.get_recent_records()
+    assert registered == [db._close_at_exit]
+    db.close()
+    assert registered == []
@@ -0,0 +1,158 @@
+"""
+변경 기록(델타 로그) 테스트
+변경 파일로 다시 만든 데이터베이스는 저장 시각(created_at)을 포함해 원래 데이터베이스와 같아야 합니다.
+"""
+import json
+
+import pytest
+
+from conftest import make_record
+from database import ParkingDatabase
+from delta_log import DeltaLog, SNAPSHOT_SUFFIX, write_delta_file, read_delta_header
+
+# 입차 순서와 저장 순서가 다른 기록 (C는 나중에 백필된 이른 시각의 기록)
+RECORDS = [
+    make_record('A', '2026/10/18 08:00:00', created_at='2026-10-18 08:00:05'),
+    make_record('B', '2026/10/18 09:00:00', created_at='2026-10-18 09:00:05'),
+    make_record('C', '2026/10/18 07:00:00', created_at='2026-10-18 10:00:05'),
+]
+
+
+@pytest.fixture
+def deltas_dir(tmp_path):
+    return tmp_path / 'deltas'
+
+
+def rebuild(tmp_path, deltas_dir, name='rebuilt'):
+    """변경 파일만으로 새 데이터베이스 생성"""
+    (tmp_path / name).mkdir()
+    rebuilt = ParkingDatabase(tmp_path / name / 'parking_records.db')
+    DeltaLog(rebuilt, deltas_dir).sync()
+    return rebuilt
+
+
+def recent(db):
+    return [(record['car_number'], record['created_at']) for record in db.get_recent_records()]
+
+
+def test_round_trip_keeps_created_at_order(db, tmp_path, deltas_dir):
+    db.upsert_records(RECORDS)
+    db.upsert_records([make_record('A', '2026/10/18 08:00:00', '2026/10/18 11:00:00')])
+    DeltaLog(db, deltas_dir).flush()
+    
+    rebuilt = rebuild(tmp_path, deltas_dir)
+    try:
+        assert recent(rebuilt) == recent(db)
+        assert recent(rebuilt)[0] == ('C', '2026-10-18 10:00:05')
+        assert rebuilt.get_recent_records()[-1]['exit_time'] == '2026/10/18 11:00:00'
+    finally:
+        rebuilt.close()
+
+
+def test_compacted_snapshot_keeps_created_at(db, tmp_path, deltas_dir):
+    delta_log = DeltaLog(db, deltas_dir)
+    for record in RECORDS:
+        db.upsert_records([record])
+        delta_log.flush()
+    
+    snapshot = delta_log.compact()
+    assert [path.name for path in delta_log.list_files()] == [snapshot.name]
+    
+    rebuilt = rebuild(tmp_path, deltas_dir)
+    try:
+        assert recent(rebuilt) == recent(db)
+    finally:
+        rebuilt.close()
+
+
+def test_old_format_file_without_created_at(db, deltas_dir):
+    deltas_dir.mkdir()
+    path = deltas_dir / '20261018T080000000000-delta.jsonl'
+    columns = ['car_number', 'entry_time', 'exit_time']
+    path.write_text(
+        json.dumps({'columns': columns, 'covers': None}) + '\n' +
+        json.dumps(['A', '2026/10/18 08:00:00', '']) + '\n',
+        encoding='utf-8'
+    )
+    
+    assert DeltaLog(db, deltas_dir).sync() == 1
+    records = db.get_recent_records()
+    assert records[0]['car_number'] == 'A'
+    assert records[0]['created_at']
+
+
+def test_reset_clears_database_restored_from_cache(db, tmp_path, deltas_dir):
+    # 초기화 전 기록이 남아 있는 데이터베이스 (GitHub Actions 캐시에서 복원된 경우)
+    db.upsert_records(RECORDS + [make_record('OLD', '2025/03/01 08:00:00', '2025/03/01 09:00:00')])
+    delta_log = DeltaLog(db, deltas_dir)
+    delta_log.flush()
+    assert db.archive_old_records() == 1
+    assert db.archive_paths()
+    
+    # 다른 곳에서 초기화 후 새 기록 저장
+    other = rebuild(tmp_path, deltas_dir, 'other')
+    try:
+        other_log = DeltaLog(other, deltas_dir)
+        other.clear_records()
+        reset_path = other_log.reset()
+        assert read_delta_header(reset_path)['reset'] is True
+        other.upsert_records([make_record('NEW', '2026/10/18 12:00:00')])
+        other_log.flush()
+    finally:
+        other.close()
+    
+    delta_log.sync()
+    assert [record['car_number'] for record in db.get_recent_records()] == ['NEW']
+    assert db.archive_paths() == []
+    assert db.get_statistics()['total_records'] == 1
+    with db.connection() as conn:
+        assert conn.execute('SELECT SUM(entries) FROM daily_stats').fetchone()[0] == 1
+
+
+def test_compact_keeps_reset_marker(db, tmp_path, deltas_dir):
+    stale = rebuild(tmp_path, deltas_dir, 'stale')
+    stale.upsert_records(RECORDS)
+    stale.close()
+    
+    delta_log = DeltaLog(db, deltas_dir)
+    delta_log.reset()
+    db.upsert_records([make_record('NEW', '2026/10/18 12:00:00')])
+    delta_log.flush()
+    snapshot = delta_log.compact()
+    assert read_delta_header(snapshot)['reset'] is True
+    
+    stale = ParkingDatabase(tmp_path / 'stale' / 'parking_records.db')
+    try:
+        DeltaLog(stale, deltas_dir).sync()
+        assert [record['car_number'] for record in stale.get_recent_records()] == ['NEW']
+    finally:
+        stale.close()
+
+
+def test_up_to_date_database_skips_reset_snapshot(db, deltas_dir, monkeypatch):
+    delta_log = DeltaLog(db, deltas_dir)
+    delta_log.reset()
+    db.upsert_records([make_record('NEW', '2026/10/18 12:00:00')])
+    delta_log.flush()
+    write_delta_file(deltas_dir / f'99991231T000000000000{SNAPSHOT_SUFFIX}', db.get_recent_records(),
+                     covers=delta_log.list_files()[-1].name, reset=True)
+    monkeypatch.setattr(db, 'clear_records', lambda: pytest.fail('이미 반영한 초기화 스냅샷을 다시 적용함'))
+    
+    delta_log.sync()
+    assert [record['car_number'] for record in db.get_recent_records()] == ['NEW']
+
+
+def test_new_file_sorts_after_file_from_clock_ahead(db, tmp_path, deltas_dir):
+    # 지역 시각(KST)으로 이름을 정한 이전 형식 파일은 UTC 시각보다 앞서 있음
+    deltas_dir.mkdir()
+    write_delta_file(deltas_dir / '99991231T235959999998-delta.jsonl', [RECORDS[0]])
+    delta_log = DeltaLog(db, deltas_dir)
+    db.upsert_records([RECORDS[1]])
+    path = delta_log.flush()
+    
+    assert path.name == '99991231T235959999999-delta.jsonl'
+    rebuilt = rebuild(tmp_path, deltas_dir)
+    try:
+        assert sorted(record['car_number'] for record in rebuilt.get_recent_records()) == ['A', 'B']
+    finally:
+        rebuilt.close()
@@ -0,0 +1,89 @@
+"""
+적응형 조회 간격 테스트
+고정된 시각과 시간대별 입출차 건수로 조회 간격을 계산합니다.
+"""
+from datetime import datetime
+
+import pytest
+
+from poll_scheduler import AdaptivePollScheduler
+
+SATURDAY, SUNDAY = 6, 0  # get_activity_histogram()의 요일 (0: 일요일 ~ 6: 토요일)
+NOW = datetime(2026, 10, 17, 8, 0)  # 토요일
+
+
+class FakeDatabase:
+    """고정된 시간대별 입출차 건수를 반환하는 데이터베이스"""
+    
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.calls = 0
+    
+    def get_activity_histogram(self, days):
+        self.calls += 1
+        return self.histogram
+
+
+def scheduler_for(histogram, **options):
+    """1주 기간으로 건수가 그대로 시간당 건수가 되고, 간격이 3600 / 건수(초)인 스케줄러"""
+    options = {'min_interval': 10, 'max_interval': 600, 'target_events': 1, 'history_days': 7,
+               'activity_boost': 2, **options}
+    return AdaptivePollScheduler(FakeDatabase(histogram), **options)
+
+
+@pytest.mark.parametrize('minute, interval', [(0, 60), (30, 40), (45, 34)])
+def test_current_and_next_hour_are_blended(minute, interval):
+    scheduler = scheduler_for({(SATURDAY, 8): 60, (SATURDAY, 9): 120})
+    
+    assert scheduler.next_interval(now=NOW.replace(minute=minute)) == interval
+
+
+def test_blending_crosses_midnight_into_next_weekday():
+    scheduler = scheduler_for({(SUNDAY, 0): 120})
+    
+    assert scheduler.next_interval(now=datetime(2026, 10, 17, 23, 30)) == 60
+
+
+def test_rates_are_averaged_over_history_weeks():
+    scheduler = scheduler_for({(SATURDAY, 8): 240}, history_days=28)
+    
+    assert scheduler.next_interval(now=NOW) == 60
+
+
+@pytest.mark.parametrize('count, interval', [(3600, 10), (1, 600)])
+def test_interval_is_clamped(count, interval):
+    scheduler = scheduler_for({(SATURDAY, 8): count})
+    
+    assert scheduler.next_interval(now=NOW) == interval
+
+
+def test_hour_without_history_uses_max_interval():
+    scheduler = scheduler_for({(SUNDAY, 8): 60})
+    
+    assert scheduler.next_interval(now=NOW) == 600
+    assert scheduler.last_reason == '과거 입출차 없음'
+
+
+def test_activity_boosts_to_min_interval():
+    scheduler = scheduler_for({(SATURDAY, 8): 60})
+    
+    assert scheduler.next_interval({'entries': 1, 'exits': 0}, now=NOW) == 10
+    assert scheduler.next_interval({'entries': 0, 'exits': 0}, now=NOW) == 10
+    assert scheduler.next_interval({'entries': 0, 'exits': 0}, now=NOW) == 60
+    
+    # 집중 조회 중 다시 감지되면 횟수를 처음부터 다시 셈
+    assert scheduler.next_interval({'exits': 1}, now=NOW) == 10
+    assert scheduler.next_interval({'new_records': 1}, now=NOW) == 10
+    assert scheduler.next_interval(now=NOW) == 10
+    assert scheduler.next_interval(now=NOW) == 60
+
+
+def test_rates_are_refreshed_once_a_day():
+    scheduler = scheduler_for({(SATURDAY, 8): 60})
+    
+    scheduler.next_interval(now=NOW)
+    scheduler.next_interval(now=NOW.replace(hour=12))
+    assert scheduler.db.calls == 1
+    
+    scheduler.next_interval(now=datetime(2026, 10, 18, 8, 0))
+    assert scheduler.db.calls == 2
@@ -0,0 +1,103 @@
+"""
+기록 저장 실패 처리 및 조회 지표 테스트
+저장에 실패한 조회는 조회 지문이 남지 않아 다음 조회에서 다시 처리되어야 합니다.
+"""
+import asyncio
+import threading
+
+import pytest
+
+import main_with_notification
+from conftest import make_record
+from main_with_notification import FINGERPRINT_STATE_KEY, process_records, run_poll_async
+
+POINTS = {'basic': 0, 'purchase': 0}
+RECORDS = [make_record('A', '2026/10/18 08:00:00'), make_record('B', '2026/10/18 09:00:00')]
+
+
+def break_writes(db):
+    """기록 추가가 항상 실패하도록 트리거 생성"""
+    with db.transaction() as conn:
+        conn.execute('''
+            CREATE TRIGGER fail_insert BEFORE INSERT ON parking_records
+            BEGIN SELECT RAISE(ABORT, 'disk I/O error'); END
+        ''')
+
+
+def restore_writes(db):
+    """break_writes로 만든 트리거 삭제"""
+    with db.transaction() as conn:
+        conn.execute('DROP TRIGGER fail_insert')
+
+
+def stored_metrics(db):
+    """데이터베이스에 저장된 조회 지표"""
+    with db.connection() as conn:
+        return dict(conn.execute('SELECT name, value FROM poll_metrics').fetchall())
+
+
+def test_upsert_failure_returns_empty_lists(db):
+    break_writes(db)
+    
+    assert db.upsert_records(RECORDS) == ([], [])
+    assert db.committed_changes == []
+
+
+def test_upsert_failure_rolls_back_outer_transaction(db):
+    break_writes(db)
+    
+    with pytest.raises(Exception):
+        with db.transaction():
+            db.set_state('marker', 'written')
+            db.upsert_records(RECORDS)
+    
+    assert db.get_state('marker') is None
+
+
+def test_failed_write_does_not_store_fingerprint(db):
+    break_writes(db)
+    
+    with pytest.raises(Exception):
+        process_records(RECORDS, POINTS, db, verbose=False)
+    assert db.get_state(FINGERPRINT_STATE_KEY) is None
+    assert db.get_all_records() == []
+    
+    # 같은 결과가 다시 조회되어도 건너뛰지 않고 저장
+    restore_writes(db)
+    result = process_records(RECORDS, POINTS, db, verbose=False)
+    
+    assert result['skipped'] == 0
+    assert result['entries'] == 2
+    assert len(db.get_all_records()) == 2
+
+
+def test_unchanged_polls_keep_metrics_in_memory(db):
+    process_records(RECORDS, POINTS, db, verbose=False)
+    assert stored_metrics(db) == {'polls': 1}
+    
+    for _ in range(3):
+        assert process_records(RECORDS, POINTS, db, verbose=False)['skipped'] == 1
+    
+    assert stored_metrics(db) == {'polls': 1}
+    assert db.get_metrics() == {'polls': 4, 'fingerprint_skips': 3}
+    
+    db.close()
+    assert stored_metrics(db) == {'polls': 4, 'fingerprint_skips': 3}
+
+
+def test_async_poll_processes_records_off_the_event_loop(db, monkeypatch):
+    class FakeScraper:
+        async def poll(self, cursor):
+            return POINTS, RECORDS
+    
+    threads = []
+    
+    def recording_process_records(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return process_records(*args, **kwargs)
+    
+    monkeypatch.setattr(main_with_notification, 'process_records', recording_process_records)
+    result = asyncio.run(run_poll_async(FakeScraper(), db, verbose=False))
+    
+    assert result['entries'] == 2
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,135 @@
+"""
+증분 조회 기준(ScrapeCursor) 테스트
+테이블은 입차 시간 내림차순이며, 브라우저 파싱 스크립트(EXTRACT_SCRIPT)도 같은 결과를 내야 합니다.
+"""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from conftest import make_record
+from parking_scraper import EXTRACT_SCRIPT
+from table_parser import RECORD_COLUMNS, ScrapeCursor, parse_inout_table
+
+TODAY = '2026-10-18'
+
+
+def table_rows(records):
+    """기록 리스트를 테이블 셀 리스트로 변환 (RECORD_COLUMNS 순서)"""
+    return [[str(index + 1) if column == 'no' else record.get(column, '') for column in RECORD_COLUMNS]
+            for index, record in enumerate(records)]
+
+
+def table_html(records):
+    """기록 리스트를 입출차 테이블 HTML로 변환"""
+    body = ''.join('<tr>' + ''.join(f'<td>{cell}</td>' for cell in cells) + '</tr>'
+                   for cells in table_rows(records))
+    return f'<table><tbody>{body}</tbody></table>'
+
+
+def find_node():
+    """EXTRACT_SCRIPT를 실행할 node 경로 (Playwright에 포함된 node 우선)"""
+    try:
+        import playwright
+        bundled = Path(playwright.__file__).parent / 'driver' / 'node'
+        if bundled.exists():
+            return str(bundled)
+    except ImportError:
+        pass
+    return shutil.which('node')
+
+
+def run_extract_script(records, cursor):
+    """테이블 행만 흉내 낸 document로 EXTRACT_SCRIPT 실행"""
+    node = find_node()
+    if not node:
+        pytest.skip('node 없음')
+    
+    harness = f'''
+        const rows = {json.dumps(table_rows(records), ensure_ascii=False)}.map((cells) => ({{
+            querySelectorAll: () => cells.map((text) => ({{textContent: text}}))
+        }}));
+        globalThis.document = {{
+            body: {{textContent: ''}},
+            querySelectorAll: (selector) => (selector === 'tbody tr' ? rows : [])
+        }};
+        const extract = {EXTRACT_SCRIPT};
+        console.log(JSON.stringify(extract({{cursor: {json.dumps(cursor.to_js(), ensure_ascii=False)}, rows: true}})));
+    '''
+    result = subprocess.run([node, '-e', harness], capture_output=True, text=True, encoding='utf-8', check=True)
+    return json.loads(result.stdout)
+
+
+@pytest.fixture
+def overnight_db(db):
+    """오늘 입차 기록 A와 전날 밤 입차 후 아직 출차하지 않은 C가 저장된 데이터베이스"""
+    db.upsert_records([
+        make_record('A', '2026/10/18 08:00:00'),
+        make_record('C', '2026/10/17 22:00:00'),
+    ])
+    return db
+
+
+def test_open_keys_include_sessions_before_since_date(overnight_db):
+    state = overnight_db.get_incremental_state(TODAY)
+    
+    assert state['high_water'] == '2026/10/18 08:00:00'
+    assert set(state['open_keys']) == {('A', '2026/10/18 08:00:00'), ('C', '2026/10/17 22:00:00')}
+
+
+def test_overnight_exit_is_not_cut_by_early_stop(overnight_db):
+    table = [
+        make_record('B', '2026/10/18 09:00:00'),
+        make_record('A', '2026/10/18 08:00:00'),
+        make_record('D', '2026/10/18 07:00:00', '2026/10/18 07:30:00'),
+        make_record('C', '2026/10/17 22:00:00', '2026/10/18 10:00:00'),
+        make_record('E', '2026/10/17 21:00:00', '2026/10/17 21:30:00'),
+        make_record('F', '2026/10/17 20:00:00', '2026/10/17 20:30:00'),
+    ]
+    cursor = ScrapeCursor(**overnight_db.get_incremental_state(TODAY))
+    
+    records = parse_inout_table(table_html(table), cursor)
+    
+    # A는 high-water mark 보정(lookback) 범위라 다시 처리, D는 이미 저장된 구간이라 건너뜀
+    assert [record['car_number'] for record in records] == ['B', 'A', 'C']
+    assert records[2]['exit_time'] == '2026/10/18 10:00:00'
+    assert cursor.stopped
+
+
+def test_open_session_without_exit_is_skipped(overnight_db):
+    table = [
+        make_record('A', '2026/10/18 08:00:00'),
+        make_record('C', '2026/10/17 22:00:00'),
+    ]
+    cursor = ScrapeCursor(**overnight_db.get_incremental_state(TODAY))
+    
+    assert [record['car_number'] for record in parse_inout_table(table_html(table), cursor)] == ['A']
+
+
+def test_without_high_water_every_row_is_kept():
+    table = [make_record('A', '2026/10/18 08:00:00'), make_record('B', '2026/10/17 08:00:00')]
+    cursor = ScrapeCursor(None, [])
+    
+    assert len(parse_inout_table(table_html(table), cursor)) == 2
+    assert not cursor.stopped
+
+
+def test_extract_script_matches_python_cursor(overnight_db):
+    table = [
+        make_record('B', '2026/10/18 09:00:00'),
+        make_record('A', '2026/10/18 08:00:00'),
+        make_record('C', '2026/10/17 22:00:00', '2026/10/18 10:00:00'),
+        make_record('E', '2026/10/17 21:00:00', '2026/10/17 21:30:00'),
+        make_record('F', '2026/10/17 20:00:00', '2026/10/17 20:30:00'),
+    ]
+    state = overnight_db.get_incremental_state(TODAY)
+    python_cursor = ScrapeCursor(**state)
+    js_cursor = ScrapeCursor(**state)
+    
+    expected = parse_inout_table(table_html(table), python_cursor)
+    extract = run_extract_script(table, js_cursor)
+    
+    assert [cells[1] for cells in extract['rows']] == [record['car_number'] for record in expected]
+    assert extract['stopped'] == python_cursor.stopped
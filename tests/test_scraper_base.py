@@ -0,0 +1,160 @@
+"""
+동기/비동기 스크래퍼 공통 부분(BaseParkingScraper) 테스트
+"""
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+import config
+import http_scraper
+from async_parking_scraper import AsyncParkingScraper
+from http_client import create_http_session
+from http_scraper import HttpParkingScraper
+from parking_scraper import BaseParkingScraper, ParkingScraper, ROWS_REFRESHED_SCRIPT
+from table_parser import ScrapeCursor
+
+SITE = {
+    'name': 'test', 'url': 'http://parking.example:9080/', 'user_id': 'u', 'password': 'p',
+    'database_path': None, 'session_state_path': None
+}
+
+
+def test_restored_session_points_page_is_inout_list():
+    scraper = AsyncParkingScraper(SITE)
+    scraper.session_restored = True
+    
+    assert scraper._accept_session_probe(True)
+    assert scraper.is_logged_in
+    assert scraper.home_url == 'http://parking.example:9080/pay/inoutList'
+
+
+def test_expired_session_falls_back_to_login():
+    scraper = BaseParkingScraper(SITE)
+    scraper.session_restored = True
+    
+    assert not scraper._accept_session_probe(False)
+    assert not scraper.session_restored
+    assert scraper.home_url == SITE['url']
+
+
+def test_login_url_check():
+    scraper = BaseParkingScraper(SITE)
+    
+    assert not scraper._is_logged_in_url(SITE['url'])
+    assert scraper._is_logged_in_url('http://parking.example:9080/main/index')
+
+
+def test_blocked_requests_are_counted():
+    scraper = BaseParkingScraper(SITE)
+    
+    assert scraper._should_block(SimpleNamespace(url='http://parking.example:9080/a.png', resource_type='image'))
+    assert not scraper._should_block(SimpleNamespace(url='http://parking.example:9080/app.js', resource_type='script'))
+    assert scraper.request_stats['blocked_by_type'] == {'image': 1}
+
+
+def test_no_remaining_pages_after_early_stop():
+    scraper = BaseParkingScraper(SITE)
+    scraper.last_total_pages = 3
+    cursor = ScrapeCursor(None, [])
+    
+    assert scraper._remaining_total_pages(cursor) == 3
+    cursor.stopped = True
+    assert scraper._remaining_total_pages(cursor) == 1
+
+
+def search_response(url, resource_type='document', status=200, content_type='text/plain'):
+    """테스트용 Playwright 응답"""
+    return SimpleNamespace(
+        url=url, status=status, headers={'content-type': content_type}, text=lambda: '',
+        request=SimpleNamespace(resource_type=resource_type)
+    )
+
+
+def test_search_response_is_only_the_search_result():
+    scraper = BaseParkingScraper(SITE)
+    
+    assert scraper._is_search_response(search_response('http://parking.example:9080/pay/inoutList'))
+    assert scraper._is_search_response(search_response('http://parking.example:9080/pay/inoutList?page=1', 'xhr'))
+    assert not scraper._is_search_response(search_response('http://parking.example:9080/pay/inoutList/list.js', 'script'))
+    assert not scraper._is_search_response(search_response('http://parking.example:9080/pay/inoutListCount', 'xhr'))
+    assert not scraper._is_search_response(search_response('http://parking.example:9080/pay/inoutList', status=302))
+
+
+class FakeSearchPage:
+    """검색 버튼 클릭 후 대기 순서를 기록하는 페이지"""
+    
+    def __init__(self, rendered=True):
+        self.rendered = rendered
+        self.calls = []
+    
+    @contextmanager
+    def expect_response(self, predicate):
+        info = SimpleNamespace()
+        yield info
+        info.value = search_response('http://parking.example:9080/pay/inoutList')
+        self.calls.append('response' if predicate(info.value) else 'wrong response')
+    
+    def wait_for_function(self, script, timeout=None):
+        assert script == ROWS_REFRESHED_SCRIPT and timeout
+        self.calls.append('refreshed')
+        if not self.rendered:
+            raise PlaywrightTimeout('timeout')
+    
+    def wait_for_load_state(self, state):
+        self.calls.append(state)
+
+
+def test_search_waits_for_table_refresh_before_dom_parse():
+    scraper = ParkingScraper()
+    scraper.page = FakeSearchPage()
+    button = SimpleNamespace(click=lambda: scraper.page.calls.append('click'))
+    
+    assert scraper._search_and_wait(button) is None
+    assert scraper.page.calls == ['click', 'response', 'refreshed', 'domcontentloaded']
+
+
+def test_unchanged_table_is_used_after_render_timeout():
+    scraper = ParkingScraper()
+    scraper.page = FakeSearchPage(rendered=False)
+    button = SimpleNamespace(click=lambda: None)
+    
+    assert scraper._search_and_wait(button) is None
+    assert scraper.page.calls[-1] == 'domcontentloaded'
+
+
+def test_http_scraper_uses_site_session_and_credentials(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'USE_SAVED_SESSION', True)
+    monkeypatch.setattr(config, 'SESSION_STATE_PATH', tmp_path / 'session_state.json')
+    monkeypatch.setattr(config, 'PARKING_LOGIN_PATH', '')
+    site = dict(SITE, user_id='site_user', password='site_pw', session_state_path=tmp_path / 'site_session.json')
+    scraper = HttpParkingScraper(site)
+    scraper.session = create_http_session()
+    
+    requests_sent = []
+    
+    def fake_request(method, url, fields=None):
+        requests_sent.append((method, url, fields))
+        scraper.session.cookies.set('JSESSIONID', 'abc', domain='parking.example', path='/')
+        return SimpleNamespace(text='', url=url)
+    
+    monkeypatch.setattr(scraper, '_request', fake_request)
+    monkeypatch.setattr(scraper, 'is_session_valid', lambda: True)
+    monkeypatch.setattr(http_scraper, 'parse_login_form', lambda html, url: {
+        'url': url + 'login', 'fields': [], 'user_field': 'userid', 'password_field': 'passwd',
+        'auto_login_field': None
+    })
+    
+    assert scraper.login()
+    assert requests_sent[0][:2] == ('get', SITE['url'])
+    assert requests_sent[1] == ('post', SITE['url'] + 'login', [['userid', 'site_user'], ['passwd', 'site_pw']])
+    
+    # 로그인 세션은 사이트별 파일에 저장되고 기본 사이트 파일은 그대로
+    assert site['session_state_path'].exists()
+    assert not config.SESSION_STATE_PATH.exists()
+    
+    restored = HttpParkingScraper(site)
+    restored.start()
+    assert restored.session_restored
+    assert restored.session.cookies.get('JSESSIONID') == 'abc'
+    restored.stop()